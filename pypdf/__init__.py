@@ -9,8 +9,13 @@ You can read the full docs at https://pypdf.readthedocs.io/.
 
 from ._crypt_providers import crypt_provider
 from ._doc_common import DocumentInformation
-from ._encryption import PasswordType
+from ._encryption import (
+    PasswordType,
+    clear_key_derivation_cache,
+    set_key_derivation_cache_size,
+)
 from ._merger import PdfMerger
+from ._object_cache import ObjectCache
 from ._page import PageObject, Transformation, mult
 from ._reader import PdfReader
 from ._version import __version__
@@ -33,6 +38,7 @@ _debug_versions = (
 __all__ = [
     "DocumentInformation",
     "ImageType",
+    "ObjectCache",
     "ObjectDeletionFlag",
     "PageObject",
     "PageRange",
@@ -44,6 +50,8 @@ __all__ = [
     "Transformation",
     "__version__",
     "_debug_versions",
+    "clear_key_derivation_cache",
     "mult",
     "parse_filename_page_ranges",
+    "set_key_derivation_cache_size",
 ]
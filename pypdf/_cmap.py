@@ -1,7 +1,7 @@
 import binascii
 from binascii import unhexlify
 from math import ceil
-from typing import Any, Dict, List, Tuple, Union, cast
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 from ._codecs import adobe_glyphs, charset_encoding
 from ._utils import logger_error, logger_warning
@@ -37,6 +37,25 @@ def build_char_map(
     return font_subtype, font_halfspace, font_encoding, font_map, ft
 
 
+def get_font_cache(ft: DictionaryObject) -> Tuple[Optional[Dict[Any, Any]], Any]:
+    """
+    Get the cache of the parsed fonts of the document containing a font.
+
+    Fonts are cached by PdfReader only, keyed by their indirect reference.
+
+    Args:
+        ft: Font Dictionary
+
+    Returns:
+        The cache, or None if the font cannot be cached, and the key of the font.
+
+    """
+    ref = getattr(ft, "indirect_reference", None)
+    if ref is None:
+        return None, None
+    return getattr(ref.pdf, "_font_cache", None), (ref.idnum, ref.generation)
+
+
 def build_char_map_from_dict(
     space_width: float, ft: DictionaryObject
 ) -> Tuple[str, float, Union[str, Dict[int, str]], Dict[Any, Any]]:
@@ -53,6 +72,10 @@ def build_char_map_from_dict(
         The font-dictionary itself is suitable for the curious.
 
     """
+    cache, font_key = get_font_cache(ft)
+    key = ("char_map", font_key, space_width)
+    if cache is not None and key in cache:
+        return cast(Tuple[str, float, Union[str, Dict[int, str]], Dict[Any, Any]], cache[key])
     font_type = cast(str, ft["/Subtype"].get_object())
     encoding, map_dict = get_encoding(ft)
 
@@ -60,13 +83,16 @@ def build_char_map_from_dict(
     font_width_map = build_font_width_map(ft, space_width * 2.0)
     half_space_width = compute_space_width(font_width_map, space_key_char) / 2.0
 
-    return (
+    char_map = (
         font_type,
         half_space_width,
         encoding,
         # https://github.com/python/mypy/issues/4374
         map_dict
     )
+    if cache is not None:
+        cache[key] = char_map
+    return char_map
 
 
 # used when missing data, e.g. font def missing
@@ -395,6 +421,18 @@ def parse_bfchar(line: bytes, map_dict: Dict[Any, Any], int_entry: List[int]) ->
 
 def build_font_width_map(
     ft: DictionaryObject, default_font_width: float
+) -> Dict[Any, float]:
+    cache, font_key = get_font_cache(ft)
+    key = ("width_map", font_key, default_font_width)
+    if cache is not None:
+        if key not in cache:
+            cache[key] = _build_font_width_map(ft, default_font_width)
+        return cast(Dict[Any, float], cache[key])
+    return _build_font_width_map(ft, default_font_width)
+
+
+def _build_font_width_map(
+    ft: DictionaryObject, default_font_width: float
 ) -> Dict[Any, float]:
     font_width_map: Dict[Any, float] = {}
     st: int = 0
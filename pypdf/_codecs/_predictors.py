@@ -0,0 +1,226 @@
+"""
+Decoding of the PNG and TIFF predictors used by FlateDecode.
+
+NumPy is used when it is installed. Otherwise, the predictors which only
+depend on the encoded bytes (PNG Sub and Up, TIFF) are computed on whole rows
+with integer arithmetic rather than byte per byte.
+"""
+
+from typing import Union
+
+from ..errors import PdfReadError
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class _Lanes:
+    """
+    Arithmetic on all the samples of a row at once.
+
+    The row is loaded in a single integer, each sample being a lane of
+    ``bits`` bits. Lanes are added without carrying from one lane to the
+    next by adding their low bits, then setting their high bit with a xor.
+    """
+
+    __slots__ = ("bits", "high", "low", "padding", "size", "width")
+
+    def __init__(self, length: int, bits: int, count: int) -> None:
+        self.size = length
+        self.bits = bits
+        self.width = bits * count
+        self.padding = length * 8 - self.width  # unused bits at the end of the row
+        repeat = ((1 << (bits * count)) - 1) // ((1 << bits) - 1)  # a 1 in each lane
+        self.low = ((1 << (bits - 1)) - 1) * repeat
+        self.high = (1 << (bits - 1)) * repeat
+
+    def add(self, x: int, y: int) -> int:
+        low = self.low
+        return ((x & low) + (y & low)) ^ ((x ^ y) & self.high)
+
+    def running_sum(self, row: BytesLike, stride: int) -> bytes:
+        """Add to each sample the sample ``stride`` lanes before it, once decoded."""
+        x = int.from_bytes(row, "big")
+        padding = x & ((1 << self.padding) - 1)
+        x >>= self.padding
+        # prefix sums by doubling: after each step, a lane holds the sum of
+        # the 2**step lanes ending with it
+        shift = stride * self.bits
+        while shift < self.width:
+            x = self.add(x, x >> shift)
+            shift <<= 1
+        return ((x << self.padding) | padding).to_bytes(self.size, "big")
+
+
+def _average(raw: BytesLike, prev: BytesLike, bpp: int) -> bytes:
+    # each byte depends on the decoded byte on its left: no shortcut
+    out = [(x + (b >> 1)) & 0xFF for x, b in zip(raw[:bpp], prev)]
+    append = out.append
+    for x, b in zip(raw[bpp:], prev[bpp:]):
+        append((x + ((out[-bpp] + b) >> 1)) & 0xFF)
+    return bytes(out)
+
+
+def _paeth(raw: BytesLike, prev: BytesLike, bpp: int) -> bytes:
+    # left and upper left are 0 for the first pixel: the predictor is the byte above
+    out = [(x + b) & 0xFF for x, b in zip(raw[:bpp], prev)]
+    append = out.append
+    for x, b, c in zip(raw[bpp:], prev[bpp:], prev):
+        a = out[-bpp]
+        # distances between a + b - c and respectively a, b and c
+        pa = b - c
+        pb = a - c
+        pc = pa + pb
+        if pa < 0:
+            pa = -pa
+        if pb < 0:
+            pb = -pb
+        if pc < 0:
+            pc = -pc
+        if pa <= pb and pa <= pc:
+            append((x + a) & 0xFF)
+        elif pb <= pc:
+            append((x + b) & 0xFF)
+        else:
+            append((x + c) & 0xFF)
+    return bytes(out)
+
+
+def _unsupported_png_filter(filter_byte: int) -> PdfReadError:
+    return PdfReadError(f"Unsupported PNG filter {filter_byte!r}")
+
+
+def decode_png_prediction(data: BytesLike, bpp: int, rowlength: int) -> bytes:
+    """
+    Reverse the PNG predictors (PDF predictors 10 to 15).
+
+    Each row starts with a byte giving the filter type (None, Sub, Up,
+    Average or Paeth) applied to it.
+
+    Args:
+        data: The predicted data.
+        bpp: Number of bytes per pixel, rounded up to 1.
+        rowlength: Number of bytes per row, including the filter type byte.
+
+    Returns:
+        The decoded data, without the filter type bytes.
+
+    Raises:
+        PdfReadError: If the data are not a whole number of rows, or a row
+            uses an unknown filter type.
+
+    """
+    if len(data) % rowlength != 0:
+        raise PdfReadError("Image data is not rectangular")
+    if HAS_NUMPY:
+        return _decode_png_prediction_numpy(data, bpp, rowlength)
+    data = memoryview(data)
+    width = rowlength - 1
+    lanes = _Lanes(width, 8, width)
+    output = bytearray(len(data) // rowlength * width)
+    prev: BytesLike = bytes(width)
+    for out, start in enumerate(range(0, len(data), rowlength)):
+        filter_byte = data[start]
+        raw = data[start + 1 : start + rowlength]
+        row: BytesLike
+        if filter_byte == 0:
+            row = raw
+        elif filter_byte == 1:
+            row = lanes.running_sum(raw, bpp)
+        elif filter_byte == 2:
+            row = lanes.add(
+                int.from_bytes(raw, "big"), int.from_bytes(prev, "big")
+            ).to_bytes(width, "big")
+        elif filter_byte == 3:
+            row = _average(raw, prev, bpp)
+        elif filter_byte == 4:
+            row = _paeth(raw, prev, bpp)
+        else:
+            raise _unsupported_png_filter(filter_byte)
+        output[out * width : (out + 1) * width] = row
+        prev = row
+    return bytes(output)
+
+
+def _decode_png_prediction_numpy(data: BytesLike, bpp: int, rowlength: int) -> bytes:
+    table = np.frombuffer(data, dtype=np.uint8).reshape(-1, rowlength)
+    filters = table[:, 0]
+    invalid = np.flatnonzero(filters > 4)
+    if invalid.size:
+        raise _unsupported_png_filter(int(filters[invalid[0]]))
+    rows = table[:, 1:].copy()
+    nrows, width = rows.shape
+    row = 0
+    while row < nrows:
+        filter_byte = filters[row]
+        if filter_byte == 2:
+            # a run of Up rows is a running sum of the rows, starting from the previous one
+            end = row + 1
+            while end < nrows and filters[end] == 2:
+                end += 1
+            start = max(row - 1, 0)
+            np.cumsum(rows[start:end], axis=0, dtype=np.uint8, out=rows[start:end])
+            row = end
+            continue
+        if filter_byte == 1:
+            if width % bpp == 0:
+                pixels = rows[row].reshape(-1, bpp)
+                np.cumsum(pixels, axis=0, dtype=np.uint8, out=pixels)
+            else:
+                lanes = _Lanes(width, 8, width)
+                rows[row] = np.frombuffer(lanes.running_sum(rows[row].tobytes(), bpp), dtype=np.uint8)
+        elif filter_byte == 3:
+            prev = rows[row - 1].tobytes() if row else bytes(width)
+            rows[row] = np.frombuffer(_average(rows[row].tobytes(), prev, bpp), dtype=np.uint8)
+        elif filter_byte == 4:
+            prev = rows[row - 1].tobytes() if row else bytes(width)
+            rows[row] = np.frombuffer(_paeth(rows[row].tobytes(), prev, bpp), dtype=np.uint8)
+        row += 1
+    return rows.tobytes()
+
+
+def decode_tiff_prediction(
+    data: BytesLike, columns: int, colors: int, bits_per_component: int
+) -> bytes:
+    """
+    Reverse the TIFF predictor 2: each sample is a difference with the
+    sample of the same color component on its left.
+
+    Args:
+        data: The predicted data.
+        columns: Number of pixels per row.
+        colors: Number of color components per pixel.
+        bits_per_component: Number of bits per color component, 1 to 16.
+
+    Returns:
+        The decoded data.
+
+    """
+    rowlength = (columns * colors * bits_per_component + 7) // 8
+    if rowlength == 0:
+        return bytes(data)
+    data = memoryview(data)
+    complete = len(data) - len(data) % rowlength
+    if HAS_NUMPY and bits_per_component in (8, 16):
+        dtype = np.dtype(">u1" if bits_per_component == 8 else ">u2")
+        samples = np.frombuffer(data, dtype=dtype, count=complete // dtype.itemsize)
+        pixels = samples.reshape(-1, columns, colors)
+        output = np.cumsum(pixels, axis=1, dtype=dtype.newbyteorder("=")).astype(dtype).tobytes()
+    else:
+        lanes = _Lanes(rowlength, bits_per_component, columns * colors)
+        output = b"".join(
+            lanes.running_sum(data[start : start + rowlength], colors)
+            for start in range(0, complete, rowlength)
+        )
+    if complete < len(data):
+        # incomplete last row
+        count = (len(data) - complete) * 8 // bits_per_component
+        lanes = _Lanes(len(data) - complete, bits_per_component, count)
+        output += lanes.running_sum(data[complete:], colors)
+    return output
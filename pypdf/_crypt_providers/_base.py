@@ -25,6 +25,8 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+from typing import Callable, List
+
 
 class CryptBase:
     def encrypt(self, data: bytes) -> bytes:  # pragma: no cover
@@ -33,6 +35,77 @@ class CryptBase:
     def decrypt(self, data: bytes) -> bytes:  # pragma: no cover
         return data
 
+    def decrypt_many(self, data: List[bytes]) -> List[bytes]:
+        """Decrypt several strings encrypted with the same key."""
+        return [self.decrypt(d) for d in data]
+
+
+def rc4_decrypt_many(
+    rc4: Callable[[bytes], bytes], data: List[bytes]
+) -> List[bytes]:
+    """
+    Decrypt several strings encrypted with the same RC4 key.
+
+    The strings are xored with the same keystream: it is computed once, by
+    encrypting zeros.
+
+    Args:
+        rc4: Encryption with the key.
+        data: The encrypted strings.
+
+    Returns:
+        The decrypted strings.
+
+    """
+    if not data:
+        return []
+    keystream = rc4(bytes(max(len(d) for d in data)))
+    return [
+        (
+            int.from_bytes(d, "big") ^ int.from_bytes(keystream[: len(d)], "big")
+        ).to_bytes(len(d), "big")
+        for d in data
+    ]
+
+
+def aes_cbc_decrypt_many(
+    cbc_decrypt: Callable[[bytes], bytes],
+    decrypt: Callable[[bytes], bytes],
+    data: List[bytes],
+) -> List[bytes]:
+    """
+    Decrypt several strings encrypted with the same AES key in CBC mode.
+
+    Each string starts with its initialization vector, which is the
+    ciphertext block preceding its first block: the strings are decrypted
+    together, as a single buffer.
+
+    Args:
+        cbc_decrypt: Decryption with the key and a zero initialization vector.
+        decrypt: Decryption of a single string, for the strings which are not
+            made of whole blocks.
+        data: The encrypted strings.
+
+    Returns:
+        The decrypted strings.
+
+    """
+    whole = [d for d in data if len(d) >= 16 and len(d) % 16 == 0]
+    if len(whole) < 2:
+        return [decrypt(d) for d in data]
+    buffer = memoryview(cbc_decrypt(b"".join(whole)))
+    result = []
+    offset = 0
+    for d in data:
+        if len(d) < 16 or len(d) % 16 != 0:
+            result.append(decrypt(d))
+            continue
+        # the first block is the initialization vector
+        block = buffer[offset + 16 : offset + len(d)]
+        offset += len(d)
+        result.append(bytes(block[: -block[-1]]) if block else b"")
+    return result
+
 
 class CryptIdentity(CryptBase):
     pass
@@ -36,10 +36,16 @@ try:
     from cryptography.hazmat.decrepit.ciphers.algorithms import ARC4
 except ImportError:
     from cryptography.hazmat.primitives.ciphers.algorithms import ARC4
+from typing import List
+
 from cryptography.hazmat.primitives.ciphers.base import Cipher
 from cryptography.hazmat.primitives.ciphers.modes import CBC, ECB
 
-from pypdf._crypt_providers._base import CryptBase
+from pypdf._crypt_providers._base import (
+    CryptBase,
+    aes_cbc_decrypt_many,
+    rc4_decrypt_many,
+)
 
 crypt_provider = ("cryptography", __version__)
 
@@ -56,6 +62,9 @@ class CryptRC4(CryptBase):
         decryptor = self.cipher.decryptor()
         return decryptor.update(data) + decryptor.finalize()
 
+    def decrypt_many(self, data: List[bytes]) -> List[bytes]:
+        return rc4_decrypt_many(self.decrypt, data)
+
 
 class CryptAES(CryptBase):
     def __init__(self, key: bytes) -> None:
@@ -87,6 +96,13 @@ class CryptAES(CryptBase):
         d = decryptor.update(data) + decryptor.finalize()
         return d[: -d[-1]]
 
+    def decrypt_many(self, data: List[bytes]) -> List[bytes]:
+        return aes_cbc_decrypt_many(self._cbc_decrypt, self.decrypt, data)
+
+    def _cbc_decrypt(self, data: bytes) -> bytes:
+        decryptor = Cipher(self.alg, CBC(bytes(16))).decryptor()
+        return decryptor.update(data) + decryptor.finalize()
+
 
 def rc4_encrypt(key: bytes, data: bytes) -> bytes:
     encryptor = Cipher(ARC4(key), mode=None).encryptor()
@@ -25,48 +25,318 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
-from pypdf._crypt_providers._base import CryptBase
-from pypdf.errors import DependencyError
+"""
+Pure Python RC4 and AES, used when neither cryptography nor pycryptodome is
+installed.
 
-_DEPENDENCY_ERROR_STR = "cryptography>=3.1 is required for AES algorithm"
+AES uses the classic T-table implementation: each round of a block is a few
+lookups in four tables combining SubBytes, ShiftRows and MixColumns, on the
+four 32-bit columns of the state.
+"""
 
+import secrets
+import struct
+from typing import List, Tuple
+
+from pypdf._crypt_providers._base import (
+    CryptBase,
+    aes_cbc_decrypt_many,
+    rc4_decrypt_many,
+)
 
 crypt_provider = ("local_crypt_fallback", "0.0.0")
 
 
+# successive values of the index i of RC4, which only depend on the position
+_RC4_CYCLE = [*range(1, 256), 0]
+_MAX_KEPT_KEYSTREAM = 1 << 16
+
+
 class CryptRC4(CryptBase):
+    """
+    RC4 with the keystream kept: the strings and streams of an object are
+    encrypted with the same key, so their keystream is only generated once.
+    """
+
     def __init__(self, key: bytes) -> None:
-        self.s = bytearray(range(256))
+        s = list(range(256))
         j = 0
+        key_length = len(key)
         for i in range(256):
-            j = (j + self.s[i] + key[i % len(key)]) % 256
-            self.s[i], self.s[j] = self.s[j], self.s[i]
+            j = (j + s[i] + key[i % key_length]) & 0xFF
+            s[i], s[j] = s[j], s[i]
+        self._state = s
+        self._j = 0
+        self._keystream = bytearray()
+
+    def _get_keystream(self, length: int) -> bytearray:
+        keystream = self._keystream
+        missing = length - len(keystream)
+        if missing <= 0:
+            return keystream
+        # the keystream of large streams is not kept
+        keep = length <= _MAX_KEPT_KEYSTREAM
+        start = len(keystream) & 0xFF
+        indexes = (_RC4_CYCLE[start:] + _RC4_CYCLE[:start]) * (missing // 256 + 1)
+        del indexes[missing:]
+        s = self._state if keep else list(self._state)
+        j = self._j
+        out: List[int] = []
+        append = out.append
+        for i in indexes:
+            si = s[i]
+            j = (j + si) & 0xFF
+            sj = s[j]
+            s[i] = sj
+            s[j] = si
+            append(s[(si + sj) & 0xFF])
+        if not keep:
+            return keystream + bytes(out)
+        self._j = j
+        keystream += bytes(out)
+        return keystream
 
     def encrypt(self, data: bytes) -> bytes:
-        s = bytearray(self.s)
-        out = [0 for _ in range(len(data))]
-        i, j = 0, 0
-        for k in range(len(data)):
-            i = (i + 1) % 256
-            j = (j + s[i]) % 256
-            s[i], s[j] = s[j], s[i]
-            x = s[(s[i] + s[j]) % 256]
-            out[k] = data[k] ^ x
-        return bytes(out)
+        length = len(data)
+        keystream = self._get_keystream(length)
+        return (
+            int.from_bytes(data, "big")
+            ^ int.from_bytes(keystream[:length], "big")
+        ).to_bytes(length, "big")
 
     def decrypt(self, data: bytes) -> bytes:
         return self.encrypt(data)
 
+    def decrypt_many(self, data: List[bytes]) -> List[bytes]:
+        return rc4_decrypt_many(self.encrypt, data)
+
+
+def _build_tables() -> Tuple[List[int], ...]:
+    # multiplication in GF(2^8) through logarithms, 3 being a generator
+    exp = [0] * 510
+    log = [0] * 256
+    x = 1
+    for i in range(255):
+        exp[i] = exp[i + 255] = x
+        log[x] = i
+        x ^= ((x << 1) ^ (0x11B if x & 0x80 else 0)) & 0xFF  # x * 3
+
+    def mul(a: int, b: int) -> int:
+        return exp[log[a] + log[b]] if a and b else 0
+
+    sbox = [0] * 256
+    inv_sbox = [0] * 256
+    for a in range(256):
+        # affine transformation of the multiplicative inverse
+        s = inv = exp[255 - log[a]] if a else 0
+        for _ in range(4):
+            inv = ((inv << 1) | (inv >> 7)) & 0xFF
+            s ^= inv
+        s ^= 0x63
+        sbox[a] = s
+        inv_sbox[s] = a
+
+    def rotations(column: int) -> List[int]:
+        return [
+            ((column >> shift) | (column << (32 - shift))) & 0xFFFFFFFF
+            for shift in (0, 8, 16, 24)
+        ]
+
+    enc: List[List[int]] = [[], [], [], []]
+    dec: List[List[int]] = [[], [], [], []]
+    for a in range(256):
+        s = sbox[a]
+        for table, column in zip(
+            enc, rotations(mul(s, 2) << 24 | s << 16 | s << 8 | mul(s, 3))
+        ):
+            table.append(column)
+        s = inv_sbox[a]
+        for table, column in zip(
+            dec,
+            rotations(
+                mul(s, 14) << 24 | mul(s, 9) << 16 | mul(s, 13) << 8 | mul(s, 11)
+            ),
+        ):
+            table.append(column)
+    return (sbox, inv_sbox, *enc, *dec)
+
+
+_SBOX, _INV_SBOX, _TE0, _TE1, _TE2, _TE3, _TD0, _TD1, _TD2, _TD3 = _build_tables()
+
+
+class _AES:
+    """AES block cipher, the key being 16, 24 or 32 bytes long."""
+
+    def __init__(self, key: bytes) -> None:
+        if len(key) not in (16, 24, 32):
+            raise ValueError(f"Invalid AES key length: {len(key)}")
+        nk = len(key) // 4
+        self.rounds = nk + 6
+        w = list(struct.unpack(f">{nk}I", key))
+        rcon = 1
+        sbox = _SBOX
+        for i in range(nk, 4 * (self.rounds + 1)):
+            t = w[i - 1]
+            if i % nk == 0:
+                t = (
+                    (sbox[(t >> 16) & 0xFF] << 24)
+                    | (sbox[(t >> 8) & 0xFF] << 16)
+                    | (sbox[t & 0xFF] << 8)
+                    | sbox[t >> 24]
+                ) ^ (rcon << 24)
+                rcon = (rcon << 1) ^ (0x11B if rcon & 0x80 else 0)
+            elif nk > 6 and i % nk == 4:
+                t = (
+                    (sbox[t >> 24] << 24)
+                    | (sbox[(t >> 16) & 0xFF] << 16)
+                    | (sbox[(t >> 8) & 0xFF] << 8)
+                    | sbox[t & 0xFF]
+                )
+            w.append(w[i - nk] ^ t)
+        self.enc_keys = w
+        # equivalent inverse cipher: the round keys are used in reverse order,
+        # InvMixColumns being applied to the inner ones
+        dec = []
+        for r in range(self.rounds, -1, -1):
+            for t in w[4 * r : 4 * r + 4]:
+                if 0 < r < self.rounds:
+                    t = (
+                        _TD0[sbox[t >> 24]]
+                        ^ _TD1[sbox[(t >> 16) & 0xFF]]
+                        ^ _TD2[sbox[(t >> 8) & 0xFF]]
+                        ^ _TD3[sbox[t & 0xFF]]
+                    )
+                dec.append(t)
+        self.dec_keys = dec
+
+    def encrypt_block(self, s0: int, s1: int, s2: int, s3: int) -> Tuple[int, int, int, int]:
+        e0, e1, e2, e3 = _TE0, _TE1, _TE2, _TE3
+        k = self.enc_keys
+        s0 ^= k[0]
+        s1 ^= k[1]
+        s2 ^= k[2]
+        s3 ^= k[3]
+        for r in range(4, 4 * self.rounds, 4):
+            s0, s1, s2, s3 = (
+                e0[s0 >> 24] ^ e1[(s1 >> 16) & 0xFF] ^ e2[(s2 >> 8) & 0xFF] ^ e3[s3 & 0xFF] ^ k[r],
+                e0[s1 >> 24] ^ e1[(s2 >> 16) & 0xFF] ^ e2[(s3 >> 8) & 0xFF] ^ e3[s0 & 0xFF] ^ k[r + 1],
+                e0[s2 >> 24] ^ e1[(s3 >> 16) & 0xFF] ^ e2[(s0 >> 8) & 0xFF] ^ e3[s1 & 0xFF] ^ k[r + 2],
+                e0[s3 >> 24] ^ e1[(s0 >> 16) & 0xFF] ^ e2[(s1 >> 8) & 0xFF] ^ e3[s2 & 0xFF] ^ k[r + 3],
+            )
+        sb = _SBOX
+        r = 4 * self.rounds
+        return (
+            (sb[s0 >> 24] << 24 | sb[(s1 >> 16) & 0xFF] << 16 | sb[(s2 >> 8) & 0xFF] << 8 | sb[s3 & 0xFF]) ^ k[r],
+            (sb[s1 >> 24] << 24 | sb[(s2 >> 16) & 0xFF] << 16 | sb[(s3 >> 8) & 0xFF] << 8 | sb[s0 & 0xFF]) ^ k[r + 1],
+            (sb[s2 >> 24] << 24 | sb[(s3 >> 16) & 0xFF] << 16 | sb[(s0 >> 8) & 0xFF] << 8 | sb[s1 & 0xFF]) ^ k[r + 2],
+            (sb[s3 >> 24] << 24 | sb[(s0 >> 16) & 0xFF] << 16 | sb[(s1 >> 8) & 0xFF] << 8 | sb[s2 & 0xFF]) ^ k[r + 3],
+        )
+
+    def decrypt_block(self, s0: int, s1: int, s2: int, s3: int) -> Tuple[int, int, int, int]:
+        d0, d1, d2, d3 = _TD0, _TD1, _TD2, _TD3
+        k = self.dec_keys
+        s0 ^= k[0]
+        s1 ^= k[1]
+        s2 ^= k[2]
+        s3 ^= k[3]
+        for r in range(4, 4 * self.rounds, 4):
+            s0, s1, s2, s3 = (
+                d0[s0 >> 24] ^ d1[(s3 >> 16) & 0xFF] ^ d2[(s2 >> 8) & 0xFF] ^ d3[s1 & 0xFF] ^ k[r],
+                d0[s1 >> 24] ^ d1[(s0 >> 16) & 0xFF] ^ d2[(s3 >> 8) & 0xFF] ^ d3[s2 & 0xFF] ^ k[r + 1],
+                d0[s2 >> 24] ^ d1[(s1 >> 16) & 0xFF] ^ d2[(s0 >> 8) & 0xFF] ^ d3[s3 & 0xFF] ^ k[r + 2],
+                d0[s3 >> 24] ^ d1[(s2 >> 16) & 0xFF] ^ d2[(s1 >> 8) & 0xFF] ^ d3[s0 & 0xFF] ^ k[r + 3],
+            )
+        si = _INV_SBOX
+        r = 4 * self.rounds
+        return (
+            (si[s0 >> 24] << 24 | si[(s3 >> 16) & 0xFF] << 16 | si[(s2 >> 8) & 0xFF] << 8 | si[s1 & 0xFF]) ^ k[r],
+            (si[s1 >> 24] << 24 | si[(s0 >> 16) & 0xFF] << 16 | si[(s3 >> 8) & 0xFF] << 8 | si[s2 & 0xFF]) ^ k[r + 1],
+            (si[s2 >> 24] << 24 | si[(s1 >> 16) & 0xFF] << 16 | si[(s0 >> 8) & 0xFF] << 8 | si[s3 & 0xFF]) ^ k[r + 2],
+            (si[s3 >> 24] << 24 | si[(s2 >> 16) & 0xFF] << 16 | si[(s1 >> 8) & 0xFF] << 8 | si[s0 & 0xFF]) ^ k[r + 3],
+        )
+
+    def ecb_encrypt(self, data: bytes) -> bytes:
+        words = _unpack_blocks(data)
+        encrypt = self.encrypt_block
+        out: List[int] = []
+        for n in range(0, len(words), 4):
+            out.extend(encrypt(*words[n : n + 4]))
+        return struct.pack(f">{len(out)}I", *out)
+
+    def ecb_decrypt(self, data: bytes) -> bytes:
+        words = _unpack_blocks(data)
+        decrypt = self.decrypt_block
+        out: List[int] = []
+        for n in range(0, len(words), 4):
+            out.extend(decrypt(*words[n : n + 4]))
+        return struct.pack(f">{len(out)}I", *out)
+
+    def cbc_encrypt(self, iv: bytes, data: bytes) -> bytes:
+        words = _unpack_blocks(data)
+        c0, c1, c2, c3 = struct.unpack(">4I", iv)
+        encrypt = self.encrypt_block
+        out: List[int] = []
+        for n in range(0, len(words), 4):
+            c0, c1, c2, c3 = encrypt(
+                words[n] ^ c0, words[n + 1] ^ c1, words[n + 2] ^ c2, words[n + 3] ^ c3
+            )
+            out += (c0, c1, c2, c3)
+        return struct.pack(f">{len(out)}I", *out)
+
+    def cbc_decrypt(self, iv: bytes, data: bytes) -> bytes:
+        # the blocks do not depend on each other: the chaining is a single
+        # xor of the decrypted blocks with the ciphertext shifted by a block
+        words = _unpack_blocks(data)
+        if not words:
+            return b""
+        decrypt = self.decrypt_block
+        out: List[int] = []
+        for n in range(0, len(words), 4):
+            out.extend(decrypt(*words[n : n + 4]))
+        decrypted = int.from_bytes(struct.pack(f">{len(out)}I", *out), "big")
+        previous = int.from_bytes(iv + data[:-16], "big")
+        return (decrypted ^ previous).to_bytes(len(data), "big")
+
+
+def _unpack_blocks(data: bytes) -> Tuple[int, ...]:
+    if len(data) % 16 != 0:
+        raise ValueError("The length of the data must be a multiple of 16")
+    return struct.unpack(f">{len(data) // 4}I", data)
+
+
+def _pad(data: bytes) -> bytes:
+    # PKCS#7
+    length = 16 - len(data) % 16
+    return data + bytes((length,)) * length
+
 
 class CryptAES(CryptBase):
     def __init__(self, key: bytes) -> None:
-        pass
+        self.aes = _AES(key)
 
     def encrypt(self, data: bytes) -> bytes:
-        raise DependencyError(_DEPENDENCY_ERROR_STR)
+        iv = secrets.token_bytes(16)
+        return iv + self.aes.cbc_encrypt(iv, _pad(data))
 
     def decrypt(self, data: bytes) -> bytes:
-        raise DependencyError(_DEPENDENCY_ERROR_STR)
+        iv = data[:16]
+        data = data[16:]
+        # for empty encrypted data
+        if not data:
+            return data
+
+        # just for robustness, it does not happen under normal circumstances
+        if len(data) % 16 != 0:
+            data = _pad(data)
+
+        d = self.aes.cbc_decrypt(iv, data)
+        return d[: -d[-1]]
+
+    def decrypt_many(self, data: List[bytes]) -> List[bytes]:
+        return aes_cbc_decrypt_many(self._cbc_decrypt, self.decrypt, data)
+
+    def _cbc_decrypt(self, data: bytes) -> bytes:
+        return self.aes.cbc_decrypt(bytes(16), data)
 
 
 def rc4_encrypt(key: bytes, data: bytes) -> bytes:
@@ -78,16 +348,16 @@ def rc4_decrypt(key: bytes, data: bytes) -> bytes:
 
 
 def aes_ecb_encrypt(key: bytes, data: bytes) -> bytes:
-    raise DependencyError(_DEPENDENCY_ERROR_STR)
+    return _AES(key).ecb_encrypt(data)
 
 
 def aes_ecb_decrypt(key: bytes, data: bytes) -> bytes:
-    raise DependencyError(_DEPENDENCY_ERROR_STR)
+    return _AES(key).ecb_decrypt(data)
 
 
 def aes_cbc_encrypt(key: bytes, iv: bytes, data: bytes) -> bytes:
-    raise DependencyError(_DEPENDENCY_ERROR_STR)
+    return _AES(key).cbc_encrypt(iv, data)
 
 
 def aes_cbc_decrypt(key: bytes, iv: bytes, data: bytes) -> bytes:
-    raise DependencyError(_DEPENDENCY_ERROR_STR)
+    return _AES(key).cbc_decrypt(iv, data)
@@ -26,12 +26,17 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 import secrets
+from typing import List
 
 from Crypto import __version__
 from Crypto.Cipher import AES, ARC4
 from Crypto.Util.Padding import pad
 
-from pypdf._crypt_providers._base import CryptBase
+from pypdf._crypt_providers._base import (
+    CryptBase,
+    aes_cbc_decrypt_many,
+    rc4_decrypt_many,
+)
 
 crypt_provider = ("pycryptodome", __version__)
 
@@ -46,6 +51,9 @@ class CryptRC4(CryptBase):
     def decrypt(self, data: bytes) -> bytes:
         return ARC4.ARC4Cipher(self.key).decrypt(data)
 
+    def decrypt_many(self, data: List[bytes]) -> List[bytes]:
+        return rc4_decrypt_many(self.encrypt, data)
+
 
 class CryptAES(CryptBase):
     def __init__(self, key: bytes) -> None:
@@ -72,6 +80,12 @@ class CryptAES(CryptBase):
         d = aes.decrypt(data)
         return d[: -d[-1]]
 
+    def decrypt_many(self, data: List[bytes]) -> List[bytes]:
+        return aes_cbc_decrypt_many(self._cbc_decrypt, self.decrypt, data)
+
+    def _cbc_decrypt(self, data: bytes) -> bytes:
+        return AES.new(self.key, AES.MODE_CBC, bytes(16)).decrypt(data)
+
 
 def rc4_encrypt(key: bytes, data: bytes) -> bytes:
     return ARC4.ARC4Cipher(key).encrypt(data)
@@ -31,6 +31,7 @@
 import struct
 import zlib
 from abc import abstractmethod
+from bisect import bisect_right
 from datetime import datetime
 from typing import (
     Any,
@@ -41,6 +42,7 @@ from typing import (
     List,
     Mapping,
     Optional,
+    Sequence,
     Tuple,
     Union,
     cast,
@@ -335,6 +337,15 @@ class PdfDocCommon:
 
     flattened_pages: Optional[List[PageObject]] = None
 
+    # pages loaded one by one through the page tree, by page number, before
+    # flattened_pages is computed; None if the pages are always flattened
+    _lazy_pages: Optional[Dict[int, PageObject]] = None
+    # page tree node number -> number of pages before each of its kids
+    _page_tree_offsets: Dict[int, Sequence[int]]
+    # page object number -> page number, built once when a page is looked up
+    # and kept current when pages are added or removed
+    _page_id2num: Optional[Dict[int, int]] = None
+
     def get_num_pages(self) -> int:
         """
         Calculate the number of pages in this PDF file.
@@ -354,6 +365,9 @@ class PdfDocCommon:
             return self.root_object["/Pages"]["/Count"]  # type: ignore
         else:
             if self.flattened_pages is None:
+                count = self._get_page_count_from_tree()
+                if count is not None:
+                    return count
                 self._flatten(self._readonly)
             assert self.flattened_pages is not None
             return len(self.flattened_pages)
@@ -372,10 +386,153 @@ class PdfDocCommon:
 
         """
         if self.flattened_pages is None:
+            page = self._get_page_from_tree(page_number)
+            if page is not None:
+                return page
             self._flatten(self._readonly)
         assert self.flattened_pages is not None, "hint for mypy"
         return self.flattened_pages[page_number]
 
+    def _has_object(self, indirect_reference: IndirectObject) -> bool:
+        """Whether the object exists, without loading it if possible."""
+        return self.get_object(indirect_reference) is not None
+
+    def _get_page_tree_kind(self, node: Any) -> Optional[str]:
+        # same rules as _flatten
+        if not isinstance(node, DictionaryObject) or not node:
+            return None
+        if PA.TYPE in node:
+            kind = cast(str, node[PA.TYPE])
+        elif PA.KIDS not in node:
+            kind = "/Page"
+        else:
+            kind = "/Pages"
+        return kind if kind in ("/Page", "/Pages") else None
+
+    def _get_page_count_from_tree(self) -> Optional[int]:
+        """
+        Get the number of pages from the /Count of the page tree root, without
+        loading the pages.
+
+        Returns:
+            The number of pages, or None if the pages are to be flattened:
+            lazy loading is disabled, or the root /Count does not match its
+            kids.
+
+        """
+        if self._lazy_pages is None:
+            return None
+        pages = self.root_object.get("/Pages")
+        if pages is None or self._get_page_tree_kind(pages.get_object()) != "/Pages":
+            return None
+        offsets = self._get_page_tree_offsets(cast(DictionaryObject, pages.get_object()))
+        return None if offsets is None else offsets[-1]
+
+    def _get_page_tree_offsets(self, node: DictionaryObject) -> Optional[Sequence[int]]:
+        """
+        Compute the number of pages before each kid of a page tree node,
+        followed by the total.
+
+        If /Count is the number of kids, the kids are expected to be pages:
+        they are not loaded, only checked to be references to existing objects.
+
+        Returns:
+            The offsets, or None if the counts are not consistent.
+
+        """
+        key = id(node) if node.indirect_reference is None else node.indirect_reference.idnum
+        if key in self._page_tree_offsets:
+            return self._page_tree_offsets[key]
+        kids = node.get(PA.KIDS)
+        count = node.get(PA.COUNT)
+        if not isinstance(kids, ArrayObject) or not isinstance(count, int):
+            return None
+        offsets: Sequence[int]
+        if count == len(kids) and all(
+            isinstance(kid, IndirectObject) and self._has_object(kid) for kid in kids
+        ):
+            offsets = range(count + 1)
+        else:
+            counted = [0]
+            for kid in kids:
+                kid_node = kid.get_object()
+                kind = self._get_page_tree_kind(kid_node)
+                if kind is None:
+                    return None
+                kid_count = 1 if kind == "/Page" else kid_node.get(PA.COUNT)
+                if not isinstance(kid_count, int) or kid_count < 0:
+                    return None
+                counted.append(counted[-1] + kid_count)
+            if counted[-1] != count:
+                return None
+            offsets = counted
+        self._page_tree_offsets[key] = offsets
+        return offsets
+
+    def _get_page_from_tree(self, page_number: int) -> Optional[PageObject]:
+        """
+        Load a page by descending the page tree with the page counts of its
+        nodes, without flattening the whole tree.
+
+        The inherited attributes are applied to the page as in _flatten.
+
+        Args:
+            page_number: The page number.
+
+        Returns:
+            The page, or None if the pages are to be flattened: lazy loading
+            is disabled, or the page tree is not consistent.
+
+        """
+        if self._lazy_pages is None:
+            return None
+        if page_number in self._lazy_pages:
+            return self._lazy_pages[page_number]
+        pages = self.root_object.get("/Pages")
+        if pages is None or self._get_page_tree_kind(pages.get_object()) != "/Pages":
+            return None
+        node = pages.get_object()
+        inheritable_page_attributes = (
+            NameObject(PG.RESOURCES),
+            NameObject(PG.MEDIABOX),
+            NameObject(PG.CROPBOX),
+            NameObject(PG.ROTATE),
+        )
+        inherit: Dict[str, Any] = {}
+        number = page_number
+        visited = set()
+        reference = pages
+        expect_page = False
+        while self._get_page_tree_kind(node) == "/Pages":
+            if id(node) in visited or expect_page:
+                return None
+            visited.add(id(node))
+            offsets = self._get_page_tree_offsets(node)
+            if offsets is None or not 0 <= number < offsets[-1]:
+                return None
+            # as many kids as pages: the kids are not checked by the offsets
+            expect_page = isinstance(offsets, range)
+            for attr in inheritable_page_attributes:
+                if attr in node:
+                    inherit[attr] = node[attr]
+            index = bisect_right(offsets, number) - 1
+            number -= offsets[index]
+            reference = cast(ArrayObject, node[PA.KIDS])[index]
+            node = reference.get_object()
+        if number != 0 or self._get_page_tree_kind(node) != "/Page":
+            return None
+        for key, value in inherit.items():
+            if key not in node:
+                node[key] = value
+        page = PageObject(
+            self,
+            reference if isinstance(reference, IndirectObject) else None,
+        )
+        if not self._readonly:
+            page.update(node)
+        self._lazy_pages[page_number] = page
+        return page
+
     def _get_page_in_node(
         self,
         page_number: int,
@@ -910,11 +1067,47 @@ class PdfDocCommon:
         else:
             return None
 
-    @abstractmethod
     def _get_page_number_by_indirect(
         self, indirect_reference: Union[None, int, NullObject, IndirectObject]
     ) -> Optional[int]:
-        ...  # pragma: no cover
+        """
+        Retrieve the page number from an indirect reference.
+
+        The page numbers of all the pages are computed at the first call, so
+        that resolving many destinations is a single pass over the pages.
+
+        Args:
+            indirect_reference: The indirect reference to locate.
+
+        Returns:
+            Page number or None.
+
+        """
+        if is_null_or_none(indirect_reference):
+            return None
+        assert isinstance(indirect_reference, (int, IndirectObject)), "mypy"
+        if isinstance(indirect_reference, int):
+            idnum = indirect_reference
+        else:
+            pdf = indirect_reference.pdf
+            if pdf is not self and isinstance(pdf, PdfDocCommon):
+                # the page of another document
+                return pdf._get_page_number_by_indirect(indirect_reference)
+            idnum = indirect_reference.idnum
+        if self._page_id2num is None:
+            page_id2num: Dict[int, int] = {}
+            for i, page in enumerate(self.pages):
+                if page.indirect_reference is not None:
+                    page_id2num.setdefault(page.indirect_reference.idnum, i)
+            self._page_id2num = page_id2num
+        return self._page_id2num.get(idnum, None)
+
+    def _reset_page_index(self) -> None:
+        """Forget the page numbers computed from the page tree, once it is modified."""
+        self._page_id2num = None
+        if self._lazy_pages is not None:
+            self._lazy_pages = {}
+            self._page_tree_offsets = {}
 
     def get_page_number(self, page: PageObject) -> Optional[int]:
         """
@@ -1164,6 +1357,7 @@ class PdfDocCommon:
             if not isinstance(pages, DictionaryObject):
                 raise PdfReadError("Invalid object in /Pages")
             self.flattened_pages = []
+            self._page_id2num = None
 
         if PA.TYPE in pages:
             t = cast(str, pages[PA.TYPE])
@@ -1196,9 +1390,16 @@ class PdfDocCommon:
                 # parent's value:
                 if attr_in not in pages:
                     pages[attr_in] = value
-            page_obj = PageObject(self, indirect_reference)
-            if not list_only:
-                page_obj.update(pages)
+            page_obj = None
+            if self._lazy_pages:
+                # the pages already returned are kept
+                page_obj = self._lazy_pages.get(len(self.flattened_pages))  # type: ignore
+                if page_obj is not None and page_obj.indirect_reference != indirect_reference:
+                    page_obj = None
+            if page_obj is None:
+                page_obj = PageObject(self, indirect_reference)
+                if not list_only:
+                    page_obj.update(pages)
 
             # TODO: Could flattened_pages be None at this point?
             self.flattened_pages.append(page_obj)  # type: ignore
@@ -27,8 +27,10 @@
 import hashlib
 import secrets
 import struct
+import threading
+from collections import OrderedDict
 from enum import Enum, IntEnum
-from typing import Any, Dict, Optional, Tuple, Union, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, cast
 
 from pypdf._crypt_providers import (
     CryptAES,
@@ -56,6 +58,9 @@ from .generic import (
     create_string_object,
 )
 
+# number of crypt filters kept by an Encryption, see Encryption._get_crypt_filter
+MAX_CRYPT_FILTERS = 1024
+
 
 class CryptFilter:
     def __init__(
@@ -92,22 +97,61 @@ class CryptFilter:
         return obj
 
     def decrypt_object(self, obj: PdfObject) -> PdfObject:
-        if isinstance(obj, (ByteStringObject, TextStringObject)):
-            data = self.str_crypt.decrypt(obj.original_bytes)
-            obj = create_string_object(data)
-        elif isinstance(obj, StreamObject):
+        kind = _kind(obj.__class__)
+        if kind == _STRING:
+            data = self.str_crypt.decrypt(cast(ByteStringObject, obj).original_bytes)
+            return create_string_object(data)
+        if kind != _CONTAINER:
+            return obj
+        if isinstance(obj, StreamObject):
             obj._data = self.stm_crypt.decrypt(obj._data)
-            for key, value in obj.items():  # Dont forget the Stream dict.
-                obj[key] = self.decrypt_object(value)
-        elif isinstance(obj, DictionaryObject):
-            for key, value in obj.items():
-                obj[key] = self.decrypt_object(value)
-        elif isinstance(obj, ArrayObject):
-            for i in range(len(obj)):
-                obj[i] = self.decrypt_object(obj[i])
+        # the strings of an object share their key: they are decrypted together
+        locations: List[Tuple[Any, Any]] = []
+        strings: List[bytes] = []
+        pending: List[Any] = [obj]
+        while pending:
+            container = pending.pop()
+            # dict methods: TreeObject iterates over its children
+            items = (
+                dict.items(container)
+                if isinstance(container, dict)
+                else enumerate(container)
+            )
+            for key, value in items:
+                kind = _kind(value.__class__)
+                if kind == _STRING:
+                    locations.append((container, key))
+                    strings.append(value.original_bytes)
+                elif kind == _CONTAINER:
+                    pending.append(value)
+        for (container, key), data in zip(
+            locations, self.str_crypt.decrypt_many(strings)
+        ):
+            container[key] = create_string_object(data)
         return obj
 
 
+# kinds of objects, found from their class rather than with isinstance, which
+# is slow for subclasses of protocols
+_OTHER, _STRING, _CONTAINER = range(3)
+_kinds: Dict[type, int] = {}
+
+
+def _kind(cls: type) -> int:
+    try:
+        return _kinds[cls]
+    except KeyError:
+        pass
+    if issubclass(cls, (ByteStringObject, TextStringObject)):
+        kind = _STRING
+    elif issubclass(cls, (ArrayObject, DictionaryObject)):
+        kind = _CONTAINER
+    else:
+        kind = _OTHER
+    _kinds[cls] = kind
+    return kind
+
+
 _PADDING = (
     b"\x28\xbf\x4e\x5e\x4e\x75\x8a\x41\x64\x00\x4e\x56\xff\xfa\x01\x08"
     b"\x2e\x2e\x00\xb6\xd0\x68\x3e\x80\x2f\x0c\xa9\xfe\x64\x53\x69\x7a"
@@ -788,6 +832,74 @@ class EncryptionValues:
     Perms: bytes
 
 
+class _KeyDerivationCache:
+    """
+    Least recently used password verifications, see set_key_derivation_cache_size.
+
+    The passwords are only kept as hashes, but the derived file keys are kept.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[Tuple[Any, ...], Tuple[bytes, PasswordType]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        #: Maximum number of entries, 0 disabling the cache
+        self.max_size = 0
+
+    def resize(self, max_size: int) -> None:
+        with self._lock:
+            self.max_size = max_size
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._entries) > max(self.max_size, 0):
+            self._entries.popitem(last=False)
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[Tuple[bytes, PasswordType]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Tuple[Any, ...], entry: Tuple[bytes, PasswordType]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_key_derivation_cache = _KeyDerivationCache()
+
+
+def set_key_derivation_cache_size(max_size: int) -> None:
+    """
+    Set the number of password verifications kept for all the readers.
+
+    Opening many times documents with the same encryption dictionary and
+    password then derives the key once: this matters for AES-256, whose key
+    derivation is slow on purpose. The cache is disabled by default.
+
+    The cache keeps the file keys of the documents until they are evicted or
+    :func:`clear_key_derivation_cache` is called.
+
+    Args:
+        max_size: Maximum number of entries, 0 disabling the cache and
+            removing its entries.
+
+    """
+    _key_derivation_cache.resize(max_size)
+
+
+def clear_key_derivation_cache() -> None:
+    """Remove the file keys kept by :func:`set_key_derivation_cache_size`."""
+    _key_derivation_cache.clear()
+
+
 class Encryption:
     """
     Collects and manages parameters for PDF document encryption and decryption.
@@ -842,6 +954,11 @@ class Encryption:
 
         self._password_type = PasswordType.NOT_DECRYPTED
         self._key: Optional[bytes] = None
+        # (object number, generation) -> crypt filter, see _get_crypt_filter
+        self._crypt_filters: Dict[Tuple[int, int], CryptFilter] = {}
+        self._object_independent = all(
+            method in ("/AESV3", "/Identity") for method in (StmF, StrF, EFF)
+        )
 
     def is_decrypted(self) -> bool:
         return self._password_type != PasswordType.NOT_DECRYPTED
@@ -851,15 +968,15 @@ class Encryption:
         if not self._is_encryption_object(obj):
             return obj
 
-        cf = self._make_crypt_filter(idnum, generation)
+        cf = self._get_crypt_filter(idnum, generation)
         return cf.encrypt_object(obj)
 
     def decrypt_object(self, obj: PdfObject, idnum: int, generation: int) -> PdfObject:
         # skip calculate key
-        if not self._is_encryption_object(obj):
+        if _kind(obj.__class__) == _OTHER:
             return obj
 
-        cf = self._make_crypt_filter(idnum, generation)
+        cf = self._get_crypt_filter(idnum, generation)
         return cf.decrypt_object(obj)
 
     @staticmethod
@@ -875,6 +992,33 @@ class Encryption:
             ),
         )
 
+    def _get_crypt_filter(self, idnum: int, generation: int) -> CryptFilter:
+        """
+        Get the crypt filter of an object, the keys derived for the last
+        objects being kept.
+
+        Args:
+            idnum: The object number.
+            generation: The generation number.
+
+        Returns:
+            The crypt filter.
+
+        """
+        if self._object_independent:
+            # AES-256 uses the file key for all the objects
+            idnum = generation = 0
+        try:
+            return self._crypt_filters[(idnum, generation)]
+        except KeyError:
+            pass
+        if len(self._crypt_filters) >= MAX_CRYPT_FILTERS:
+            self._crypt_filters.clear()
+        cf = self._crypt_filters[(idnum, generation)] = self._make_crypt_filter(
+            idnum, generation
+        )
+        return cf
+
     def _make_crypt_filter(self, idnum: int, generation: int) -> CryptFilter:
         """
         Algorithm 1: Encryption of data using the RC4 or AES algorithms.
@@ -964,12 +1108,63 @@ class Encryption:
 
     def verify(self, password: Union[bytes, str]) -> PasswordType:
         pwd = self._encode_password(password)
-        key, rc = self.verify_v4(pwd) if self.V <= 4 else self.verify_v5(pwd)
+        key, rc = self._derive_key(pwd)
         if rc != PasswordType.NOT_DECRYPTED:
             self._password_type = rc
             self._key = key
+            self._crypt_filters.clear()
         return rc
 
+    def verify_any(
+        self, passwords: Iterable[Union[bytes, str]]
+    ) -> Tuple[Optional[Union[bytes, str]], PasswordType]:
+        """
+        Verify candidate passwords until one of them matches.
+
+        Passwords which are identical once encoded are only verified once.
+
+        Args:
+            passwords: The candidate passwords, in the order to try them.
+
+        Returns:
+            The first matching password and its type, or None and
+            PasswordType.NOT_DECRYPTED if none of them matches.
+
+        """
+        tried = set()
+        for password in passwords:
+            pwd = self._encode_password(password)
+            if pwd in tried:
+                continue
+            tried.add(pwd)
+            rc = self.verify(pwd)
+            if rc != PasswordType.NOT_DECRYPTED:
+                return password, rc
+        return None, PasswordType.NOT_DECRYPTED
+
+    def _derive_key(self, password: bytes) -> Tuple[bytes, PasswordType]:
+        if _key_derivation_cache.max_size <= 0:
+            return self.verify_v4(password) if self.V <= 4 else self.verify_v5(password)
+        # everything the key and the verification depend on
+        cache_key = (
+            self.V,
+            self.R,
+            self.Length,
+            self.P,
+            self.EncryptMetadata,
+            self.id1_entry,
+            getattr(self.values, "O", b""),
+            getattr(self.values, "U", b""),
+            getattr(self.values, "OE", b""),
+            getattr(self.values, "UE", b""),
+            hashlib.sha256(password).digest(),
+        )
+        entry = _key_derivation_cache.get(cache_key)
+        if entry is None:
+            entry = self.verify_v4(password) if self.V <= 4 else self.verify_v5(password)
+            _key_derivation_cache.put(cache_key, entry)
+        return entry
+
     def verify_v4(self, password: bytes) -> Tuple[bytes, PasswordType]:
         # verify owner password first
         key = AlgV4.verify_owner_password(
@@ -1030,6 +1225,7 @@ class Encryption:
             self.compute_values_v4(user_pwd, owner_pwd)
         else:
             self._key = secrets.token_bytes(self.Length // 8)
+            self._crypt_filters.clear()
             values = AlgV5.generate_values(
                 self.R, user_pwd, owner_pwd, self._key, self.P, self.EncryptMetadata
             )
@@ -1086,6 +1282,7 @@ class Encryption:
         u_value = AlgV4.compute_U_value(key, self.R, self.id1_entry)
 
         self._key = key
+        self._crypt_filters.clear()
         self.values.O = o_value
         self.values.U = u_value
 
@@ -0,0 +1,118 @@
+"""Storage of the images decoded from the XObjects of a PdfReader."""
+
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+# default maximum estimated size of the images kept by each PdfReader, in bytes
+MAX_DECODED_IMAGE_BYTES = 128 * 1024 * 1024
+
+# file extension, image format, PIL image and encoded data, see
+# filters._xobj_to_pil_image
+DecodedImage = Tuple[str, str, Any, Optional[bytes]]
+ImageKey = Tuple[int, int]  # (idnum, generation)
+
+
+class DecodedImageCache:
+    """
+    Cache of the images decoded by a :class:`~pypdf.PdfReader`, keyed by the
+    indirect reference of their XObject.
+
+    The least recently used images are evicted once the estimated size of the
+    images exceeds ``max_bytes``. The cached PIL images are never given out:
+    the users of the XObject get copies of them. For JPEG and JPEG 2000 images
+    whose stream data are the encoded image, only the data are kept.
+
+    Args:
+        max_bytes: Maximum estimated size of the images, 0 disabling the cache.
+
+    """
+
+    def __init__(self, max_bytes: int = MAX_DECODED_IMAGE_BYTES) -> None:
+        self.max_bytes = max_bytes
+        #: Number of lookups which found the image
+        self.hits = 0
+        #: Number of lookups which did not find the image
+        self.misses = 0
+        #: Estimated size of the images
+        self.current_bytes = 0
+        self._images: OrderedDict[ImageKey, Tuple[DecodedImage, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    @staticmethod
+    def size_of(image: DecodedImage) -> int:
+        """
+        Estimate the memory used by a decoded image.
+
+        Args:
+            image: The decoded image.
+
+        Returns:
+            The size of the pixels and of the encoded data, in bytes.
+
+        """
+        img, data = image[2], image[3]
+        size = 0 if data is None else len(data)
+        if img is not None:
+            size += img.width * img.height * len(img.getbands())
+        return size
+
+    def get(self, key: ImageKey) -> Optional[DecodedImage]:
+        try:
+            image, _ = self._images[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._images.move_to_end(key)
+        return image
+
+    def put(self, key: ImageKey, image: DecodedImage) -> None:
+        """
+        Store a decoded image, unless it is larger than the cache.
+
+        Args:
+            key: The (idnum, generation) of the XObject.
+            image: The decoded image.
+
+        """
+        size = self.size_of(image)
+        self.discard(key)
+        if size > self.max_bytes:
+            return
+        self._images[key] = (image, size)
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._images.popitem(last=False)
+            self.current_bytes -= evicted_size
+
+    def discard(self, key: ImageKey) -> None:
+        entry = self._images.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry[1]
+
+    def clear(self) -> None:
+        """Remove all images and reset the counters."""
+        self._images.clear()
+        self.current_bytes = 0
+        self.hits = self.misses = 0
+
+
+def get_image_cache(obj: Any) -> Tuple[Optional[DecodedImageCache], Any]:
+    """
+    Get the cache of the decoded images of the document containing an image.
+
+    Images are cached by PdfReader only, keyed by their indirect reference.
+
+    Args:
+        obj: The image XObject, or an object with the same indirect reference.
+
+    Returns:
+        The cache, or None if the image cannot be cached, and the key of the image.
+
+    """
+    ref = getattr(obj, "indirect_reference", None)
+    if ref is None:
+        return None, None
+    return getattr(ref.pdf, "_image_cache", None), (ref.idnum, ref.generation)
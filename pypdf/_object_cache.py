@@ -0,0 +1,147 @@
+"""Storage of the objects parsed by a PdfReader."""
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+from .generic import PdfObject, StreamObject
+
+ObjectKey = Tuple[int, int]  # (generation, idnum)
+
+
+class ObjectCache(Dict[ObjectKey, Optional[PdfObject]]):
+    """
+    Cache of the objects resolved by a :class:`~pypdf.PdfReader`.
+
+    By default, every parsed object is kept for the lifetime of the reader.
+    If ``max_objects`` or ``max_bytes`` is set, the least recently used
+    objects are evicted once the limit is exceeded; they are parsed again from
+    the file if needed. Pinned objects (the catalog, the page tree and the
+    encryption dictionary) are never evicted.
+
+    Evicted objects which are still referenced elsewhere are not updated
+    anymore: a bounded cache is intended for documents which are only read.
+
+    A cache can only be used by one reader. Closing the reader replaces its
+    cache with an empty one, so the counters remain available.
+
+    Args:
+        max_objects: Maximum number of objects, pinned ones excluded.
+        max_bytes: Maximum estimated size of the objects, see :meth:`size_of`.
+
+    """
+
+    def __init__(
+        self, max_objects: Optional[int] = None, max_bytes: Optional[int] = None
+    ) -> None:
+        super().__init__()
+        self.max_objects = max_objects
+        self.max_bytes = max_bytes
+        #: Number of lookups which found the object
+        self.hits = 0
+        #: Number of lookups which did not find the object
+        self.misses = 0
+        #: Number of objects removed to respect the limits
+        self.evictions = 0
+        #: Estimated size of the objects which can be evicted
+        self.current_bytes = 0
+        self.pinned: Set[ObjectKey] = set()
+        # evictable keys from the least to the most recently used, with their size
+        self._lru: OrderedDict[ObjectKey, int] = OrderedDict()
+        # the objects of different documents must not be mixed
+        self._attached = False
+
+    @property
+    def bounded(self) -> bool:
+        return self.max_objects is not None or self.max_bytes is not None
+
+    def _attach(self) -> None:
+        if self._attached:
+            raise ValueError("The object cache is already used by another reader")
+        self._attached = True
+
+    def size_of(self, obj: Optional[PdfObject]) -> int:
+        """
+        Estimate the memory used by an object.
+
+        Stream data dominate the memory usage: they are counted in bytes,
+        including the decoded data once computed. Other objects are given a
+        flat size per item.
+
+        Args:
+            obj: The object to evaluate.
+
+        Returns:
+            The estimated size in bytes.
+
+        """
+        if isinstance(obj, StreamObject):
+            size = len(obj._data)
+            decoded = getattr(obj, "decoded_self", None)
+            if decoded is not None:
+                size += len(decoded._data)
+            return size + 64 * len(obj)
+        if isinstance(obj, (list, dict)):
+            return 64 + 64 * len(obj)
+        return 64
+
+    def get(self, key: ObjectKey, default: Any = None) -> Any:
+        try:
+            obj = super().__getitem__(key)
+        except KeyError:
+            self.misses += 1
+            return default
+        self.hits += 1
+        if key in self._lru:
+            self._lru.move_to_end(key)
+            if self.max_bytes is not None:
+                # the decoded data of streams are computed after the parsing
+                size = self.size_of(obj)
+                self.current_bytes += size - self._lru[key]
+                self._lru[key] = size
+                self._evict()
+        return obj
+
+    def __setitem__(self, key: ObjectKey, obj: Optional[PdfObject]) -> None:
+        super().__setitem__(key, obj)
+        if not self.bounded or key in self.pinned:
+            return
+        size = self.size_of(obj) if self.max_bytes is not None else 0
+        self.current_bytes += size - self._lru.pop(key, 0)
+        self._lru[key] = size
+        self._evict()
+
+    def __delitem__(self, key: ObjectKey) -> None:
+        super().__delitem__(key)
+        self.current_bytes -= self._lru.pop(key, 0)
+
+    def pin(self, key: ObjectKey) -> None:
+        """
+        Prevent an object from being evicted.
+
+        The object does not need to be in the cache yet.
+
+        Args:
+            key: The (generation, idnum) of the object.
+
+        """
+        self.pinned.add(key)
+        self.current_bytes -= self._lru.pop(key, 0)
+
+    def clear(self) -> None:
+        """Remove all objects and pins, and reset the counters."""
+        super().clear()
+        self._lru.clear()
+        self.pinned.clear()
+        self.current_bytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def _evict(self) -> None:
+        # the most recently used object is kept even if it exceeds the limits
+        while len(self._lru) > 1 and (
+            (self.max_objects is not None and len(self._lru) > self.max_objects)
+            or (self.max_bytes is not None and self.current_bytes > self.max_bytes)
+        ):
+            key, size = self._lru.popitem(last=False)
+            super().__delitem__(key)
+            self.current_bytes -= size
+            self.evictions += 1
@@ -0,0 +1,319 @@
+"""
+Merging of the identical objects of a PdfWriter, and removal of the objects
+which are not used anymore.
+
+Each object is serialized in a canonical form: the keys of the dictionaries
+are sorted and the references are replaced by the number of the object which
+represents the referenced object. Objects with the same canonical form are
+merged. The objects referencing merged objects are then serialized again,
+until nothing changes: objects which only differ by references to identical
+objects are merged as well.
+
+Canonical forms are compared through dictionaries: they are hashed, and only
+compared byte per byte when the hashes match. The data of the streams are not
+copied in the canonical forms, and their hash is computed once as it is cached
+by the bytes objects.
+"""
+
+from io import BytesIO
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, cast
+
+from .constants import Core as CO
+from .constants import PagesAttributes as PA
+from .generic import (
+    ArrayObject,
+    ContentStream,
+    DictionaryObject,
+    IndirectObject,
+    NameObject,
+    NumberObject,
+    PdfObject,
+    StreamObject,
+)
+
+# class name, serialization, data of streams
+CanonicalForm = Tuple[str, bytes, Optional[bytes]]
+
+
+def _stream_data(obj: StreamObject) -> bytes:
+    # the operations of content streams are serialized when needed
+    data = obj.get_data() if obj.__class__ is ContentStream else obj._data
+    return data if isinstance(data, bytes) else bytes(data)
+
+
+# kinds of objects, found from their class rather than with isinstance, which
+# is slow for subclasses of protocols
+_LEAF, _REFERENCE, _DICTIONARY, _STREAM, _ARRAY = range(5)
+_kinds: Dict[type, int] = {}
+
+
+def _kind(cls: type) -> int:
+    try:
+        return _kinds[cls]
+    except KeyError:
+        pass
+    if issubclass(cls, IndirectObject):
+        kind = _REFERENCE
+    elif issubclass(cls, StreamObject):
+        kind = _STREAM
+    elif issubclass(cls, DictionaryObject):
+        kind = _DICTIONARY
+    elif issubclass(cls, ArrayObject):
+        kind = _ARRAY
+    else:
+        kind = _LEAF
+    _kinds[cls] = kind
+    return kind
+
+
+class _Serializer:
+    """Serialization of objects in canonical forms, see :func:`canonical_form`."""
+
+    def __init__(self, pdf: Any, representatives: List[int]) -> None:
+        self.pdf = pdf
+        self.representatives = representatives
+        self._names: Dict[str, bytes] = {}
+
+    def name(self, name: str) -> bytes:
+        try:
+            return self._names[name]
+        except KeyError:
+            encoded = self._names[name] = NameObject(name).renumber()
+            return encoded
+
+    def serialize(self, obj: Any, buffer: BytesIO, references: Set[int]) -> None:
+        kind = _kind(obj.__class__)
+        if kind == _REFERENCE:
+            if obj.pdf is self.pdf:
+                idnum = obj.idnum
+                references.add(idnum)
+                if idnum < len(self.representatives):
+                    idnum = self.representatives[idnum]
+                buffer.write(b"%d R " % idnum)
+            else:
+                buffer.write(b"%d %d R %d " % (obj.idnum, obj.generation, id(obj.pdf)))
+        elif kind in (_DICTIONARY, _STREAM):
+            self.serialize_dictionary(obj, buffer, references)
+            if kind == _STREAM:
+                # streams are not expected as direct objects
+                buffer.write(_stream_data(obj))
+        elif kind == _ARRAY:
+            buffer.write(b"[")
+            for item in obj:
+                self.serialize(item, buffer, references)
+            buffer.write(b"] ")
+        elif obj.__class__ is NameObject:
+            buffer.write(self.name(obj))
+            buffer.write(b" ")
+        elif obj.__class__ is NumberObject:
+            buffer.write(b"%d " % obj)
+        else:
+            obj.write_to_stream(buffer)
+            buffer.write(b" ")
+
+    def serialize_dictionary(
+        self, obj: DictionaryObject, buffer: BytesIO, references: Set[int]
+    ) -> None:
+        buffer.write(b"<<")
+        # dict methods: TreeObject iterates over its children
+        for key in sorted(dict.keys(obj)):
+            buffer.write(self.name(key))
+            buffer.write(b" ")
+            self.serialize(dict.__getitem__(obj, key), buffer, references)
+        buffer.write(b">> ")
+
+    def canonical_form(self, obj: PdfObject) -> Tuple[CanonicalForm, Set[int]]:
+        """
+        Serialize an indirect object in a canonical form: the keys of the
+        dictionaries are sorted and the references are replaced by the
+        number of the object representing the referenced object.
+
+        Args:
+            obj: The object to serialize.
+
+        Returns:
+            The canonical form, and the numbers of the objects referenced by obj.
+
+        """
+        buffer = BytesIO()
+        references: Set[int] = set()
+        data = None
+        if _kind(obj.__class__) == _STREAM:
+            # the data are kept apart: the dictionary is serialized alone
+            data = _stream_data(cast(StreamObject, obj))
+            self.serialize_dictionary(cast(StreamObject, obj), buffer, references)
+        else:
+            self.serialize(obj, buffer, references)
+        return (obj.__class__.__name__, buffer.getvalue(), data), references
+
+
+def _collect_references(obj: Any, pdf: Any, references: Set[int]) -> None:
+    kind = _kind(obj.__class__)
+    if kind == _REFERENCE:
+        if obj.pdf is pdf:
+            references.add(obj.idnum)
+    elif kind in (_DICTIONARY, _STREAM):
+        for value in dict.values(obj):
+            _collect_references(value, pdf, references)
+    elif kind == _ARRAY:
+        for item in obj:
+            _collect_references(item, pdf, references)
+
+
+def _replace_references(obj: Any, pdf: Any, representatives: List[int]) -> None:
+    kind = _kind(obj.__class__)
+    if kind in (_DICTIONARY, _STREAM):
+        items: Iterable[Tuple[Any, Any]] = list(dict.items(obj))
+    elif kind == _ARRAY:
+        items = enumerate(obj)
+    else:
+        return
+    for key, value in items:
+        if _kind(value.__class__) == _REFERENCE:
+            if (
+                value.pdf is pdf
+                and value.idnum < len(representatives)
+                and representatives[value.idnum] != value.idnum
+            ):
+                obj[key] = IndirectObject(representatives[value.idnum], 0, pdf)
+        else:
+            _replace_references(value, pdf, representatives)
+
+
+def _written_size(idnum: int, obj: PdfObject) -> int:
+    buffer = BytesIO()
+    obj.write_to_stream(buffer)
+    return len(b"%d 0 obj\n\nendobj\n" % idnum) + buffer.tell()
+
+
+def _is_page(obj: PdfObject) -> bool:
+    return isinstance(obj, DictionaryObject) and obj.get(PA.TYPE) == CO.PAGE
+
+
+def compress_objects(
+    pdf: Any,
+    roots: Iterable[int],
+    remove_identicals: bool,
+    remove_orphans: bool,
+) -> int:
+    """
+    Merge the identical objects of a writer and remove the unused ones.
+
+    Pages and root objects are never merged: the page tree cannot reference
+    a page twice.
+
+    Args:
+        pdf: The writer.
+        roots: The numbers of the objects referenced by the trailer.
+        remove_identicals: Merge the identical objects.
+        remove_orphans: Remove the objects which cannot be reached from the
+            roots.
+
+    Returns:
+        The number of bytes of the removed objects, as they would have been
+        written without encryption. Merged objects are counted with the size
+        of the object they are merged into.
+
+    """
+    objects: List[Optional[PdfObject]] = pdf._objects
+    roots = set(roots)
+    count = len(objects) + 1
+    # indexed by object number; 0 is not used
+    representatives = list(range(count))
+    references: List[Set[int]] = [set() for _ in range(count)]
+    live = [idnum for idnum in range(1, count) if objects[idnum - 1] is not None]
+
+    if remove_identicals:
+        serializer = _Serializer(pdf, representatives)
+        forms: List[Optional[CanonicalForm]] = [None] * count
+        mergeable = []
+        roots_and_pages = []
+        for idnum in live:
+            if idnum in roots or _is_page(objects[idnum - 1]):  # type: ignore[arg-type]
+                roots_and_pages.append(idnum)
+            else:
+                mergeable.append(idnum)
+        for idnum in mergeable:
+            form, references[idnum] = serializer.canonical_form(
+                objects[idnum - 1]  # type: ignore[arg-type]
+            )
+            forms[idnum] = form
+        for idnum in roots_and_pages:
+            _collect_references(objects[idnum - 1], pdf, references[idnum])
+        referrers: Dict[int, List[int]] = {}
+        for idnum in live:
+            for ref in references[idnum]:
+                referrers.setdefault(ref, []).append(idnum)
+
+        while True:
+            groups: Dict[CanonicalForm, int] = {}
+            merged = []
+            for idnum in mergeable:
+                first = groups.setdefault(forms[idnum], idnum)  # type: ignore[arg-type]
+                if first != representatives[idnum]:
+                    representatives[idnum] = first
+                    merged.append(idnum)
+            if not merged:
+                break
+            # the objects referencing merged objects may now be identical
+            changed = {ref for idnum in merged for ref in referrers.get(idnum, ())}
+            for idnum in changed:
+                if forms[idnum] is not None:
+                    forms[idnum] = serializer.canonical_form(
+                        objects[idnum - 1]  # type: ignore[arg-type]
+                    )[0]
+    else:
+        for idnum in live:
+            _collect_references(objects[idnum - 1], pdf, references[idnum])
+
+    removed = [idnum for idnum in live if representatives[idnum] != idnum]
+    if remove_orphans:
+        reachable: Set[int] = set()
+        pending = [idnum for idnum in roots if 0 < idnum < count]
+        while pending:
+            idnum = representatives[pending.pop()]
+            if idnum not in reachable:
+                reachable.add(idnum)
+                pending.extend(ref for ref in references[idnum] if ref < count)
+        removed.extend(
+            idnum
+            for idnum in live
+            if representatives[idnum] == idnum and idnum not in reachable
+        )
+
+    # merged objects only differ from their representative by the numbers
+    # of the referenced objects: the representative is measured once
+    sizes: Dict[int, int] = {}
+    saved = 0
+    for idnum in removed:
+        measured = representatives[idnum]
+        if measured not in sizes:
+            sizes[measured] = _written_size(measured, objects[measured - 1])  # type: ignore[arg-type]
+        saved += sizes[measured]
+    for idnum in removed:
+        pdf._object_index.pop(id(objects[idnum - 1]), None)
+        objects[idnum - 1] = None
+    # the copies of objects from other documents are now found at their
+    # representative, and removed copies are cloned again if needed
+    if removed:
+        removed_set = set(removed)
+        for translations in pdf._id_translated.values():
+            for source, idnum in list(translations.items()):
+                if idnum in removed_set:
+                    representative = representatives[idnum]
+                    if objects[representative - 1] is None:
+                        del translations[source]
+                    else:
+                        translations[source] = representative
+    if remove_identicals:
+        # update the references to the merged objects
+        updated = {
+            ref
+            for idnum in live
+            if representatives[idnum] != idnum
+            for ref in referrers.get(idnum, ())
+        }
+        for idnum in updated:
+            if objects[idnum - 1] is not None:
+                _replace_references(objects[idnum - 1], pdf, representatives)
+    return saved
@@ -54,6 +54,7 @@ from ._cmap import (
     build_font_width_map,
     compute_font_width,
     get_actual_str_key,
+    get_font_cache,
     unknown_char_map,
 )
 from ._protocols import PdfCommonDocProtocol
@@ -77,7 +78,7 @@ from .constants import ImageAttributes as IA
 from .constants import PageAttributes as PG
 from .constants import Resources as RES
 from .errors import PageSizeNotDefinedError, PdfReadError
-from .filters import _xobj_to_image
+from .filters import _encode_image, _xobj_to_pil_image
 from .generic import (
     ArrayObject,
     ContentStream,
@@ -326,12 +327,40 @@ class Transformation:
         return list(pt1) if isinstance(pt, list) else pt1
 
 
+class _ImageData:
+    """
+    Descriptor of :attr:`ImageFile.data`: the images of the pages are only
+    encoded when their data are first needed.
+    """
+
+    def __get__(self, image_file: Optional["ImageFile"], owner: Any = None) -> bytes:
+        if image_file is None:
+            return b""  # default value of the dataclass field
+        data = image_file._data
+        if data is None:
+            name = image_file.name
+            extension = name[name.rfind(".") :]
+            new_extension, data = _encode_image(
+                image_file.image, image_file._image_format, extension
+            )
+            if new_extension != extension:  # pragma: no cover
+                image_file.name = name[: name.rfind(".")] + new_extension
+            image_file._data = data
+        return data
+
+    def __set__(self, image_file: "ImageFile", data: bytes) -> None:
+        image_file._data = data
+
+
 @dataclass
 class ImageFile:
     """
     Image within the PDF file. *This object is not designed to be built.*
 
     This object should not be modified except using :func:`ImageFile.replace` to replace the image with a new one.
+
+    The images of the pages are encoded on first access to :attr:`data`:
+    reading :attr:`image` or :meth:`raw_pixels` does not encode them.
     """
 
     name: str = ""
@@ -339,9 +368,14 @@ class ImageFile:
     Filename as identified within the PDF file.
     """
 
-    data: bytes = b""
+    data: _ImageData = _ImageData()
     """
-    Data as bytes.
+    Data as bytes, in the format given by the extension of the name.
+
+    The data of JPEG and JPEG 2000 images are taken from the PDF file
+    when the image is not modified by the decoding. Other images are
+    encoded on first access; if the image cannot be saved in its format,
+    it is saved as PNG and the extension of the name is changed.
     """
 
     image: Optional[Image] = None
@@ -354,6 +388,40 @@ class ImageFile:
     Reference to the object storing the stream.
     """
 
+    # not annotated, so that they are not dataclass fields: the encoded data,
+    # None until the image is encoded, and the format to encode it in
+    _data = cast(Optional[bytes], None)
+    _image_format = ""
+
+    @classmethod
+    def _from_xobject(
+        cls,
+        stem: str,
+        x_object: DictionaryObject,
+        indirect_reference: Optional[IndirectObject],
+    ) -> "ImageFile":
+        extension, image_format, img, data = _xobj_to_pil_image(x_object)
+        image_file = cls(f"{stem}{extension}", b"", img, indirect_reference)
+        image_file._data = data  # None: encoded when needed
+        image_file._image_format = image_format
+        return image_file
+
+    def raw_pixels(self) -> Tuple[str, Tuple[int, int], bytes]:
+        """
+        Get the decoded pixels of the image, without encoding it.
+
+        Returns:
+            The PIL mode, the size (width, height) and the pixels, as returned
+            by ``PIL.Image.Image.tobytes()``.
+
+        Raises:
+            ValueError: If the object has no image.
+
+        """
+        if self.image is None:
+            raise ValueError("No image to get the pixels from")
+        return self.image.mode, self.image.size, self.image.tobytes()
+
     def replace(self, new_image: Image, **kwargs: Any) -> None:
         """
         Replace the image with a new PIL image.
@@ -383,8 +451,7 @@ class ImageFile:
         from ._reader import PdfReader
 
         # to prevent circular import
-        from .filters import _xobj_to_image
-        from .generic import DictionaryObject, PdfObject
+        from .generic import DictionaryObject
 
         if self.indirect_reference is None:
             raise TypeError("Cannot update an inline image.")
@@ -396,20 +463,15 @@ class ImageFile:
         new_image.save(b, "PDF", **kwargs)
         reader = PdfReader(b)
         assert reader.pages[0].images[0].indirect_reference is not None
-        self.indirect_reference.pdf._objects[self.indirect_reference.idnum - 1] = (
-            reader.pages[0].images[0].indirect_reference.get_object()
+        self.indirect_reference.pdf._replace_object(
+            self.indirect_reference,
+            reader.pages[0].images[0].indirect_reference.get_object(),
         )
-        cast(
-            PdfObject, self.indirect_reference.get_object()
-        ).indirect_reference = self.indirect_reference
-        # change the object attributes
-        extension, byte_stream, img = _xobj_to_image(
+        # change the object attributes, the data are encoded when needed
+        extension, self._image_format, self.image, self._data = _xobj_to_pil_image(
             cast(DictionaryObject, self.indirect_reference.get_object())
         )
-        assert extension is not None
         self.name = self.name[: self.name.rfind(".")] + extension
-        self.data = byte_stream
-        self.image = img
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}(name={self.name}, data: {_human_readable_bytes(len(self.data))})"
@@ -629,6 +691,39 @@ class PageObject(DictionaryObject):
         lst.extend(list(self.inline_images.keys()))
         return lst
 
+    def _image_xobjects(self) -> Iterator[Tuple[str, StreamObject]]:
+        """
+        Iterate over the image XObjects of the page and of its forms.
+
+        Unlike :attr:`images`, the images are not decoded, and the inline
+        images are not included.
+
+        Yields:
+            The name of each image in its resources, and the image XObject.
+
+        """
+        visited: Set[Any] = set()
+        pending: List[DictionaryObject] = [self]
+        while pending:
+            obj = pending.pop()
+            ref = obj.indirect_reference
+            key = id(obj) if ref is None else (ref.idnum, ref.generation)
+            if key in visited:
+                continue
+            visited.add(key)
+            try:
+                x_object = obj[PG.RESOURCES][RES.XOBJECT].get_object()  # type: ignore
+            except KeyError:
+                continue
+            for name in x_object:
+                value = x_object[name]
+                if not isinstance(value, StreamObject):
+                    continue
+                if value.get(IA.SUBTYPE) == "/Image":
+                    yield name, value
+                else:  # is a form with possible images inside
+                    pending.append(value)
+
     def _get_image(
         self,
         id: Union[str, List[str], Tuple[str]],
@@ -655,15 +750,11 @@ class PageObject(DictionaryObject):
                     raise KeyError("No inline image can be found")
                 return self.inline_images[id]
 
-            imgd = _xobj_to_image(cast(DictionaryObject, xobjs[id]))
-            extension, byte_stream = imgd[:2]
-            f = ImageFile(
-                name=f"{id[1:]}{extension}",
-                data=byte_stream,
-                image=imgd[2],
-                indirect_reference=xobjs[id].indirect_reference,
+            return ImageFile._from_xobject(
+                id[1:],
+                cast(DictionaryObject, xobjs[id]),
+                xobjs[id].indirect_reference,
             )
-            return f
         else:  # in a sub object
             ids = id[1:]
             return self._get_image(ids, cast(DictionaryObject, xobjs[id[0]]))
@@ -694,6 +785,8 @@ class PageObject(DictionaryObject):
             * `.indirect_reference` : object reference
 
         and the following methods:
+            `.raw_pixels()` :
+                the mode, size and pixels of the image, without encoding it
             `.replace(new_image: PIL.Image.Image, **kwargs)` :
                 replace the image in the pdf with the new image
                 applying the saving parameters indicated (such as quality)
@@ -755,7 +848,7 @@ class PageObject(DictionaryObject):
             return {}
         imgs_data = []
         assert content is not None, "mypy"
-        for param, ope in content.operations:
+        for param, ope in content.iter_operations():
             if ope == b"INLINE IMAGE":
                 imgs_data.append(
                     {"settings": param["settings"], "__streamdata__": param["data"]}
@@ -822,12 +915,8 @@ class PageObject(DictionaryObject):
                 if k not in init:
                     init[k] = v
             ii["object"] = EncodedStreamObject.initialize_from_dictionary(init)
-            extension, byte_stream, img = _xobj_to_image(ii["object"])
-            files[f"~{num}~"] = ImageFile(
-                name=f"~{num}~{extension}",
-                data=byte_stream,
-                image=img,
-                indirect_reference=None,
+            files[f"~{num}~"] = ImageFile._from_xobject(
+                f"~{num}~", ii["object"], None
             )
         return files
 
@@ -933,13 +1022,21 @@ class PageObject(DictionaryObject):
             # can not be found because translated : this may be improved
 
             # try the current key first (e.g. "foo"), but otherwise iterate
-            # through "foo-0", "foo-1", etc. new_res can contain only finitely
-            # many keys, thus this'll eventually end, even if it's been crafted
-            # to be maximally annoying.
+            # through "foo-0", "foo-1", etc. Each key of new_res is in the chain
+            # of at most one base key besides its own, and the keys of page2res
+            # are unique: the chains are walked once per merge.
+            try:
+                same_keys: Optional[Set[str]] = keys_by_value.get(value, set())
+            except TypeError:  # unhashable value, e.g. a direct dictionary
+                same_keys = None
             computed_key = base_key
             idx = 0
             while computed_key in new_res:
-                if new_res.raw_get(computed_key) == value:
+                if same_keys is None or computed_key in unhashable_keys:
+                    same_value = new_res.raw_get(computed_key) == value
+                else:
+                    same_value = computed_key in same_keys
+                if same_value:
                     # there's already a resource of this name, with the exact
                     # same value
                     return computed_key, True
@@ -947,6 +1044,12 @@ class PageObject(DictionaryObject):
                 idx += 1
             return computed_key, False
 
+        def index_resource(key: str, value: Any) -> None:
+            try:
+                keys_by_value.setdefault(value, set()).add(key)
+            except TypeError:
+                unhashable_keys.add(key)
+
         if new_res1:
             new_res = DictionaryObject()
             new_res.update(res1.get(resource, DictionaryObject()).get_object())
@@ -955,6 +1058,12 @@ class PageObject(DictionaryObject):
         page2res = cast(
             DictionaryObject, res2.get(resource, DictionaryObject()).get_object()
         )
+        # keys of new_res, indexed by their value to find the identical
+        # resources without comparing deeply with all of them
+        keys_by_value: Dict[Any, Set[str]] = {}
+        unhashable_keys: Set[str] = set()
+        for key in new_res:
+            index_resource(key, new_res.raw_get(key))
         rename_res = {}
         for key in page2res:
             unique_key, same_value = compute_unique_key(key)
@@ -964,14 +1073,16 @@ class PageObject(DictionaryObject):
                 rename_res[key] = newname
 
             if not same_value:
+                value = page2res.raw_get(key)
                 if is_pdf_writer:
-                    new_res[newname] = page2res.raw_get(key).clone(pdf)
+                    value = value.clone(pdf)
                     try:
-                        new_res[newname] = new_res[newname].indirect_reference
+                        value = value.get_object().indirect_reference
                     except AttributeError:
                         pass
-                else:
-                    new_res[newname] = page2res.raw_get(key)
+                new_res[newname] = value
+                index_resource(newname, value)
+        if page2res:
             lst = sorted(new_res.items())
             new_res.clear()
             for el in lst:
@@ -1695,9 +1806,12 @@ class PageObject(DictionaryObject):
         if self.indirect_reference is None:
             return None
         else:
-            try:
-                lst = self.indirect_reference.pdf.pages
-                return lst.index(self)
+            pdf = self.indirect_reference.pdf
+            number = pdf._get_page_number_by_indirect(self.indirect_reference)
+            if number is not None and pdf.pages[number] == self:
+                return number
+            try:  # the page may have been copied
+                return pdf.pages.index(self)
             except ValueError:
                 return None
 
@@ -1705,7 +1819,7 @@ class PageObject(DictionaryObject):
         out = ""
         for ope, op in ContentStream(
             self["/Contents"].get_object(), self.pdf, "bytes"
-        ).operations:
+        ).iter_operations():
             if op == b"TJ":
                 s = [x for x in ope[0] if isinstance(x, str)]
             else:
@@ -2070,7 +2184,7 @@ class PageObject(DictionaryObject):
                 except OrientationNotFoundError:
                     return None
 
-        for operands, operator in content.operations:
+        for operands, operator in content.iter_operations():
             if visitor_operand_before is not None:
                 visitor_operand_before(operator, operands, cm_matrix, tm_matrix)
             # Multiple operators are handled here
@@ -2172,6 +2286,11 @@ class PageObject(DictionaryObject):
             if "/Font" in resources_dict and self.pdf is not None:
                 for font_name in resources_dict["/Font"]:
                     *cmap, font_dict_obj = build_char_map(font_name, 200.0, self)
+                    cache, font_key = get_font_cache(font_dict_obj)
+                    key = ("layout_font", font_key)
+                    if cache is not None and key in cache:
+                        fonts[font_name] = cache[key]
+                        continue
                     font_dict = {
                         k: v.get_object()
                         if isinstance(v, IndirectObject)
@@ -2182,6 +2301,8 @@ class PageObject(DictionaryObject):
                     }
                     # mypy really sucks at unpacking
                     fonts[font_name] = _layout_mode.Font(*cmap, font_dict)  # type: ignore[call-arg,arg-type]
+                    if cache is not None:
+                        cache[key] = fonts[font_name]
             try:
                 objr = objr["/Parent"].get_object()
             except KeyError:
@@ -2234,9 +2355,9 @@ class PageObject(DictionaryObject):
                 "utf-8",
             )
 
-        ops = iter(
-            ContentStream(self["/Contents"].get_object(), self.pdf, "bytes").operations
-        )
+        ops = ContentStream(
+            self["/Contents"].get_object(), self.pdf, "bytes"
+        ).iter_operations()
         bt_groups = _layout_mode.text_show_operations(
             ops, fonts, strip_rotated, debug_path
         )
@@ -2560,6 +2681,7 @@ class _VirtualList(Sequence[PageObject]):
                 first = False
                 try:
                     assert ind is not None
+                    ind.pdf._reset_page_index()
                     del ind.pdf.flattened_pages[index]  # case of page in a Reader
                 except Exception:  # pragma: no cover
                     pass
@@ -2577,8 +2699,12 @@ class _VirtualList(Sequence[PageObject]):
                 break
 
     def __iter__(self) -> Iterator[PageObject]:
-        for i in range(len(self)):
+        # the length is checked at each step: the number of pages of a reader
+        # may be corrected once its page tree is flattened
+        i = 0
+        while i < len(self):
             yield self[i]
+            i += 1
 
     def __str__(self) -> str:
         p = [f"PageObject({i})" for i in range(self.length_function())]
@@ -72,6 +72,7 @@ class PdfReaderProtocol(PdfCommonDocProtocol, Protocol):
 
 class PdfWriterProtocol(PdfCommonDocProtocol, Protocol):
     _objects: List[Any]
+    _object_index: Dict[int, int]
     _id_translated: Dict[int, Dict[int, int]]
 
     incremental: bool
@@ -30,6 +30,7 @@
 import os
 import re
 from io import BytesIO, UnsupportedOperation
+from itertools import chain
 from pathlib import Path
 from types import TracebackType
 from typing import (
@@ -38,8 +39,11 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
+    Literal,
     Optional,
+    Sequence,
     Tuple,
     Type,
     Union,
@@ -48,7 +52,12 @@ from typing import (
 
 from ._doc_common import PdfDocCommon, convert_to_int
 from ._encryption import Encryption, PasswordType
+from ._image_cache import MAX_DECODED_IMAGE_BYTES, DecodedImageCache
+from ._object_cache import ObjectCache
+from ._page import ImageFile
+from ._text_extraction._parallel import PageText, extract_text_parallel
 from ._utils import (
+    MemoryMappedStream,
     StrByteType,
     StreamType,
     logger_warning,
@@ -105,6 +114,25 @@ class PdfReader(PdfDocCommon):
         password: Decrypt PDF file at initialization. If the
             password is None, the file will not be decrypted.
             Defaults to ``None``.
+        memory_map: Only used if ``stream`` is a path. Map the file into memory
+            instead of reading it completely. Stream contents then reference
+            the mapped data without copying it, so the memory usage grows with
+            the objects which are accessed and not with the file size.
+            Defaults to ``False``.
+        object_cache: Storage of the parsed objects. Use an
+            :class:`~pypdf.ObjectCache` with ``max_objects`` or ``max_bytes``
+            to limit the memory usage when walking through big documents.
+            A cache cannot be shared between readers.
+            Defaults to an unbounded cache.
+        eager_object_streams: Parse all the objects of an object stream
+            when one of them is requested, instead of one at a time.
+            This is faster when most objects of the document are used, for
+            example when iterating over all the pages.
+            Defaults to ``False``.
+        max_image_cache_bytes: Maximum estimated size of the decoded images
+            kept to be shared by the pages, see :meth:`clear_image_cache`.
+            ``0`` disables the cache.
+            Defaults to 128 MiB.
 
     """
 
@@ -113,35 +141,59 @@ class PdfReader(PdfDocCommon):
         stream: Union[StrByteType, Path],
         strict: bool = False,
         password: Union[None, str, bytes] = None,
+        memory_map: bool = False,
+        object_cache: Optional[ObjectCache] = None,
+        eager_object_streams: bool = False,
+        max_image_cache_bytes: int = MAX_DECODED_IMAGE_BYTES,
     ) -> None:
         self.strict = strict
+        self.eager_object_streams = eager_object_streams
         self.flattened_pages: Optional[List[PageObject]] = None
+        # the pages are loaded one by one until they are all needed
+        self._lazy_pages: Optional[Dict[int, PageObject]] = {}
+        self._page_tree_offsets: Dict[int, Sequence[int]] = {}
 
         #: Storage of parsed PDF objects.
-        self.resolved_objects: Dict[Tuple[Any, Any], Optional[PdfObject]] = {}
+        self.resolved_objects: ObjectCache = (
+            ObjectCache() if object_cache is None else object_cache
+        )
+        self.resolved_objects._attach()
 
         self._startxref: int = 0
         self.xref_index = 0
         self.xref: Dict[int, Dict[Any, Any]] = {}
         self.xref_free_entry: Dict[int, Dict[Any, Any]] = {}
         self.xref_objStm: Dict[int, Tuple[Any, Any]] = {}
+        # object stream number -> object number -> (index, offset)
+        self._object_stream_index: Dict[int, Dict[int, Tuple[int, int]]] = {}
         self.trailer = DictionaryObject()
 
         # Map page indirect_reference number to page number
-        self._page_id2num: Optional[Dict[Any, Any]] = None
+        self._page_id2num: Optional[Dict[int, int]] = None
+
+        # fonts parsed for the text extraction, see _cmap.get_font_cache
+        self._font_cache: Dict[Any, Any] = {}
+        # images decoded from the XObjects, see _image_cache.get_image_cache
+        self._image_cache = DecodedImageCache(max_image_cache_bytes)
 
         self._validated_root: Optional[DictionaryObject] = None
 
-        self._initialize_stream(stream)
+        self._memory_map = memory_map
+        # path of the file, to open it again in other processes
+        self._source_path: Optional[str] = None
+        self._initialize_stream(stream, memory_map)
 
         self._override_encryption = False
         self._encryption: Optional[Encryption] = None
+        self._password: Union[None, str, bytes] = None
         if self.is_encrypted:
             self._handle_encryption(password)
         elif password is not None:
             raise PdfReadError("Not an encrypted file")
 
-    def _initialize_stream(self, stream: Union[StrByteType, Path]) -> None:
+    def _initialize_stream(
+        self, stream: Union[StrByteType, Path], memory_map: bool = False
+    ) -> None:
         if hasattr(stream, "mode") and "b" not in stream.mode:
             logger_warning(
                 "PdfReader stream/file object is not in binary mode. "
@@ -150,8 +202,12 @@ class PdfReader(PdfDocCommon):
             )
         self._stream_opened = False
         if isinstance(stream, (str, Path)):
+            self._source_path = str(Path(stream).resolve())
             with open(stream, "rb") as fh:
-                stream = BytesIO(fh.read())
+                if memory_map and os.fstat(fh.fileno()).st_size > 0:
+                    stream = cast(StreamType, MemoryMappedStream(fh))
+                else:
+                    stream = BytesIO(fh.read())
             self._stream_opened = True
         self.read(stream)
         self.stream = stream
@@ -163,6 +219,7 @@ class PdfReader(PdfDocCommon):
         # https://github.com/py-pdf/pypdf/issues/608
         id_entry = self.trailer.get(TK.ID)
         id1_entry = id_entry[0].get_object().original_bytes if id_entry else b""
+        self._pin_object(self.trailer.raw_get(TK.ENCRYPT))
         encrypt_entry = cast(DictionaryObject, self.trailer[TK.ENCRYPT].get_object())
         self._encryption = Encryption.read(encrypt_entry, id1_entry)
 
@@ -174,6 +231,7 @@ class PdfReader(PdfDocCommon):
         ):
             # raise if password provided
             raise WrongPasswordError("Wrong password")
+        self._password = password
         self._override_encryption = False
 
     def __enter__(self) -> "PdfReader":
@@ -192,11 +250,68 @@ class PdfReader(PdfDocCommon):
         if self._stream_opened:
             self.stream.close()
         self.flattened_pages = []
-        self.resolved_objects = {}
+        self._lazy_pages = {}
+        self._page_tree_offsets = {}
+        self._page_id2num = None
+        # the cache may belong to the caller, who may still read its counters
+        self.resolved_objects = ObjectCache(
+            self.resolved_objects.max_objects, self.resolved_objects.max_bytes
+        )
+        self.resolved_objects._attach()
         self.trailer = DictionaryObject()
         self.xref = {}
         self.xref_free_entry = {}
         self.xref_objStm = {}
+        self._object_stream_index = {}
+        self._font_cache = {}
+        self._image_cache.clear()
+
+    def clear_font_cache(self) -> None:
+        """
+        Forget the fonts parsed by the text extraction.
+
+        The character maps and widths of the fonts are computed once per
+        document and reused by all the pages. The cache has to be cleared if
+        font dictionaries are modified, or to release its memory.
+        """
+        self._font_cache.clear()
+
+    def clear_image_cache(self) -> None:
+        """
+        Forget the decoded images.
+
+        The image XObjects are decoded once per document and shared by all
+        the pages using them, within the limit given by the
+        ``max_image_cache_bytes`` argument of the reader. The cache has to be
+        cleared if image XObjects are modified, or to release its memory.
+        """
+        self._image_cache.clear()
+
+    def unique_images(self) -> Iterator[Tuple[ImageFile, List[int]]]:
+        """
+        Iterate over the distinct image XObjects of the document.
+
+        An image used by several pages, or several times by a page, is
+        yielded once. The images are decoded while iterating; inline images
+        are not included.
+
+        Yields:
+            Each image, and the numbers of the pages using it.
+
+        """
+        usages: Dict[Any, Tuple[str, StreamObject, List[int]]] = {}
+        for page_number, page in enumerate(self.pages):
+            for name, x_object in page._image_xobjects():
+                ref = x_object.indirect_reference
+                key = id(x_object) if ref is None else (ref.idnum, ref.generation)
+                page_numbers = usages.setdefault(key, (name, x_object, []))[2]
+                if not page_numbers or page_numbers[-1] != page_number:
+                    page_numbers.append(page_number)
+        for name, x_object, page_numbers in usages.values():
+            image = ImageFile._from_xobject(
+                name[1:], x_object, x_object.indirect_reference
+            )
+            yield image, page_numbers
 
     @property
     def root_object(self) -> DictionaryObject:
@@ -229,6 +344,7 @@ class PdfReader(PdfDocCommon):
                     break
             if self._validated_root is None:
                 raise PdfReadError("Cannot find Root object in pdf")
+        self._pin_object(self._validated_root.indirect_reference)
         return self._validated_root
 
     @property
@@ -288,44 +404,21 @@ class PdfReader(PdfDocCommon):
         finally:
             self._override_encryption = False
 
-    def _get_page_number_by_indirect(
-        self, indirect_reference: Union[None, int, NullObject, IndirectObject]
-    ) -> Optional[int]:
+    def _read_object_stream_index(
+        self, obj_stm: EncodedStreamObject
+    ) -> Dict[int, Tuple[int, int]]:
         """
-        Retrieve the page number from an indirect reference.
+        Parse the header of an object stream.
 
         Args:
-            indirect_reference: The indirect reference to locate.
+            obj_stm: The object stream.
 
         Returns:
-            Page number or None.
+            A dictionary mapping the object numbers to their index in the
+            stream and their offset within the decoded data.
 
         """
-        if self._page_id2num is None:
-            self._page_id2num = {
-                x.indirect_reference.idnum: i for i, x in enumerate(self.pages)  # type: ignore
-            }
-
-        if is_null_or_none(indirect_reference):
-            return None
-        assert isinstance(indirect_reference, (int, IndirectObject)), "mypy"
-        if isinstance(indirect_reference, int):
-            idnum = indirect_reference
-        else:
-            idnum = indirect_reference.idnum
-        assert self._page_id2num is not None, "hint for mypy"
-        ret = self._page_id2num.get(idnum, None)
-        return ret
-
-    def _get_object_from_stream(
-        self, indirect_reference: IndirectObject
-    ) -> Union[int, PdfObject, str]:
-        # indirect reference to object in object stream
-        # read the entire object stream into memory
-        stmnum, idx = self.xref_objStm[indirect_reference.idnum]
-        obj_stm: EncodedStreamObject = IndirectObject(stmnum, 0, self).get_object()  # type: ignore
-        # This is an xref to a stream, so its type better be a stream
-        assert cast(str, obj_stm["/Type"]) == "/ObjStm"
+        index: Dict[int, Tuple[int, int]] = {}
         stream_data = BytesIO(obj_stm.get_data())
         for i in range(obj_stm["/N"]):  # type: ignore
             read_non_whitespace(stream_data)
@@ -336,42 +429,76 @@ class PdfReader(PdfDocCommon):
             offset = NumberObject.read_from_stream(stream_data)
             read_non_whitespace(stream_data)
             stream_data.seek(-1, 1)
-            if objnum != indirect_reference.idnum:
-                # We're only interested in one object
-                continue
-            if self.strict and idx != i:
-                raise PdfReadError("Object is in wrong index.")
-            stream_data.seek(int(obj_stm["/First"] + offset), 0)  # type: ignore
-
-            # to cope with some case where the 'pointer' is on a white space
-            read_non_whitespace(stream_data)
-            stream_data.seek(-1, 1)
+            # the first definition wins if an object is listed twice
+            index.setdefault(
+                int(objnum), (i, int(obj_stm["/First"] + offset))  # type: ignore
+            )
+        return index
 
-            try:
-                obj = read_object(stream_data, self)
-            except PdfStreamError as exc:
-                # Stream object cannot be read. Normally, a critical error, but
-                # Adobe Reader doesn't complain, so continue (in strict mode?)
-                logger_warning(
-                    f"Invalid stream (index {i}) within object "
-                    f"{indirect_reference.idnum} {indirect_reference.generation}: "
-                    f"{exc}",
-                    __name__,
-                )
+    def _read_object_stream_entry(
+        self, stream_data: StreamType, idnum: int, i: int, offset: int
+    ) -> PdfObject:
+        stream_data.seek(offset, 0)
 
-                if self.strict:  # pragma: no cover
-                    raise PdfReadError(
-                        f"Cannot read object stream: {exc}"
-                    )  # pragma: no cover
-                # Replace with null. Hopefully it's nothing important.
-                obj = NullObject()  # pragma: no cover
-            return obj
-
-        if self.strict:  # pragma: no cover
-            raise PdfReadError(
-                "This is a fatal error in strict mode."
-            )  # pragma: no cover
-        return NullObject()  # pragma: no cover
+        # to cope with some case where the 'pointer' is on a white space
+        read_non_whitespace(stream_data)
+        stream_data.seek(-1, 1)
+
+        try:
+            return cast(PdfObject, read_object(stream_data, self))
+        except PdfStreamError as exc:
+            # Stream object cannot be read. Normally, a critical error, but
+            # Adobe Reader doesn't complain, so continue (in strict mode?)
+            logger_warning(
+                f"Invalid stream (index {i}) within object {idnum} 0: {exc}",
+                __name__,
+            )
+
+            if self.strict:  # pragma: no cover
+                raise PdfReadError(
+                    f"Cannot read object stream: {exc}"
+                )  # pragma: no cover
+            # Replace with null. Hopefully it's nothing important.
+            return NullObject()  # pragma: no cover
+
+    def _get_object_from_stream(
+        self, indirect_reference: IndirectObject
+    ) -> Union[int, PdfObject, str]:
+        # indirect reference to object in object stream
+        stmnum, idx = self.xref_objStm[indirect_reference.idnum]
+        obj_stm: EncodedStreamObject = IndirectObject(stmnum, 0, self).get_object()  # type: ignore
+        # This is an xref to a stream, so its type better be a stream
+        assert cast(str, obj_stm["/Type"]) == "/ObjStm"
+        # the decoded data are shared, not copied
+        stream_data = BytesIO(obj_stm.get_data())
+        index = self._object_stream_index.get(stmnum)
+        if index is None:
+            # the header is parsed once per object stream
+            index = self._read_object_stream_index(obj_stm)
+            self._object_stream_index[stmnum] = index
+            if self.eager_object_streams:
+                for idnum, (i, offset) in index.items():
+                    if (
+                        idnum != indirect_reference.idnum
+                        and self.xref_objStm.get(idnum, (None, None))[0] == stmnum
+                        and (0, idnum) not in self.resolved_objects
+                    ):
+                        self.cache_indirect_object(
+                            0, idnum, self._read_object_stream_entry(stream_data, idnum, i, offset)
+                        )
+        entry = index.get(indirect_reference.idnum)
+        if entry is None:
+            if self.strict:  # pragma: no cover
+                raise PdfReadError(
+                    "This is a fatal error in strict mode."
+                )  # pragma: no cover
+            return NullObject()  # pragma: no cover
+        i, offset = entry
+        if self.strict and idx != i:
+            raise PdfReadError("Object is in wrong index.")
+        return self._read_object_stream_entry(
+            stream_data, indirect_reference.idnum, i, offset
+        )
 
     def get_object(
         self, indirect_reference: Union[int, IndirectObject]
@@ -535,6 +662,45 @@ class PdfReader(PdfDocCommon):
             )
         return int(idnum), int(generation)
 
+    def _pin_object(self, indirect_reference: Any) -> None:
+        """Prevent the object from being evicted from the cache."""
+        if isinstance(indirect_reference, IndirectObject) and indirect_reference.pdf is self:
+            self.resolved_objects.pin(
+                (indirect_reference.generation, indirect_reference.idnum)
+            )
+
+    def _flatten(
+        self,
+        list_only: bool = False,
+        pages: Union[None, DictionaryObject, "PageObject"] = None,
+        inherit: Optional[Dict[str, Any]] = None,
+        indirect_reference: Optional[IndirectObject] = None,
+    ) -> None:
+        # the page tree is kept in the cache: the pages may have been
+        # modified to apply the inherited attributes
+        if pages is None:
+            self._pin_object(self.root_object.raw_get("/Pages"))
+        self._pin_object(indirect_reference)
+        super()._flatten(list_only, pages, inherit, indirect_reference)
+        if pages is None:
+            self._lazy_pages = {}
+
+    def _has_object(self, indirect_reference: IndirectObject) -> bool:
+        idnum, generation = indirect_reference.idnum, indirect_reference.generation
+        if generation == 0 and idnum in self.xref_objStm:
+            return True
+        return idnum in self.xref.get(generation, {}) and not self.xref_free_entry.get(
+            generation, {}
+        ).get(idnum, False)
+
+    def _get_page_from_tree(self, page_number: int) -> Optional["PageObject"]:
+        page = super()._get_page_from_tree(page_number)
+        if page is not None:
+            # the page may have been modified to apply the inherited attributes
+            self._pin_object(self.root_object.raw_get("/Pages"))
+            self._pin_object(page.indirect_reference)
+        return page
+
     def cache_get_indirect_object(
         self, generation: int, idnum: int
     ) -> Optional[PdfObject]:
@@ -562,6 +728,8 @@ class PdfReader(PdfDocCommon):
             raise ValueError("Cannot update PdfReader with external object")
         if (indirect.generation, indirect.idnum) not in self.resolved_objects:
             raise ValueError("Cannot find referenced object")
+        # a modified object can not be read again from the file
+        self.resolved_objects.pin((indirect.generation, indirect.idnum))
         self.resolved_objects[(indirect.generation, indirect.idnum)] = obj
         obj.indirect_reference = indirect
         return obj
@@ -1141,7 +1309,32 @@ class PdfReader(PdfDocCommon):
         if not self._encryption:
             raise PdfReadError("Not encrypted file")
         # TODO: raise Exception for wrong password
-        return self._encryption.verify(password)
+        password_type = self._encryption.verify(password)
+        if password_type != PasswordType.NOT_DECRYPTED:
+            self._password = password
+        return password_type
+
+    def decrypt_any(
+        self, passwords: Iterable[Union[str, bytes]]
+    ) -> Tuple[Optional[Union[str, bytes]], PasswordType]:
+        """
+        Try candidate passwords in turn, as with :meth:`decrypt`, until the
+        document is decrypted.
+
+        Args:
+            passwords: The candidate passwords, in the order to try them.
+
+        Returns:
+            The password which decrypted the document and its type, or None
+            and PasswordType.NOT_DECRYPTED if no password matches.
+
+        """
+        if not self._encryption:
+            raise PdfReadError("Not encrypted file")
+        password, password_type = self._encryption.verify_any(passwords)
+        if password is not None:
+            self._password = password
+        return password, password_type
 
     @property
     def is_encrypted(self) -> bool:
@@ -1178,11 +1371,11 @@ class PdfReader(PdfDocCommon):
         interim = DictionaryObject()
         interim[NameObject("/T")] = TextStringObject(name)
         interim[NameObject("/Kids")] = acroform[NameObject("/Fields")]
-        self.cache_indirect_object(
-            0,
-            max(i for (g, i) in self.resolved_objects if g == 0) + 1,
-            interim,
-        )
+        # objects evicted from the cache are still listed in the xref table
+        idnum = max(chain((i for (g, i) in self.resolved_objects if g == 0), self.xref.get(0, ()))) + 1
+        # the object does not exist in the file: it can not be evicted
+        self.resolved_objects.pin((0, idnum))
+        self.cache_indirect_object(0, idnum, interim)
         arr = ArrayObject()
         arr.append(interim.indirect_reference)
         acroform[NameObject("/Fields")] = arr
@@ -1224,6 +1417,56 @@ class PdfReader(PdfDocCommon):
         interim[NameObject("/T")] = TextStringObject(name)
         return interim
 
+    def extract_text_parallel(
+        self,
+        pages: Optional[Iterable[int]] = None,
+        workers: Optional[int] = None,
+        mode: Literal["plain", "layout"] = "plain",
+        ordered: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[PageText]:
+        """
+        Extract the text of several pages using a pool of processes.
+
+        Each worker process opens the document again: from its path if the
+        reader was created from a path, otherwise from a copy of its data.
+        Modifications done to this reader are not seen by the workers.
+        The pages are given to the workers by batches of consecutive pages.
+
+        On platforms starting processes with "spawn" (Windows, macOS), the
+        call has to be protected by ``if __name__ == "__main__":``.
+
+        Args:
+            pages: The numbers of the pages, starting at 0.
+                Defaults to all the pages.
+            workers: The number of processes. ``1`` extracts the text in this
+                process. Defaults to the number of processors.
+            mode: The ``extraction_mode`` of :meth:`PageObject.extract_text`.
+            ordered: Return the results in the order of ``pages``. If ``False``,
+                they are returned as soon as they are available.
+            **kwargs: Other arguments of :meth:`PageObject.extract_text`.
+                They have to be picklable.
+
+        Returns:
+            An iterator over the extracted texts. A page whose extraction
+            failed has an empty text and the description of the error. If a
+            worker process dies, the batches running at that time fail, and
+            the other batches are given to new processes.
+
+        """
+        page_numbers = list(range(len(self.pages)) if pages is None else pages)
+        source: Union[str, bytes]
+        if self._source_path is not None:
+            source = self._source_path
+        else:
+            position = self.stream.tell()
+            self.stream.seek(0)
+            source = self.stream.read()
+            self.stream.seek(position)
+        return extract_text_parallel(
+            self, source, page_numbers, workers, mode, ordered, kwargs
+        )
+
     def _repr_mimebundle_(
         self,
         include: Union[None, Iterable[str]] = None,
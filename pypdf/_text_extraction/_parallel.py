@@ -0,0 +1,144 @@
+"""
+Extraction of the text of pages in several processes.
+
+Each worker process opens the document once, then extracts the text of the
+batches of pages it is given. Batches are consecutive pages, so that the
+resources shared by neighbouring pages (fonts, ...) are parsed once per worker.
+"""
+
+import math
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Literal, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    from .._reader import PdfReader
+
+BATCHES_PER_WORKER = 4
+MAX_BATCH_SIZE = 50
+
+
+@dataclass
+class PageText:
+    """Text extracted from a page by :meth:`~pypdf.PdfReader.extract_text_parallel`."""
+
+    page_number: int
+    text: str
+    #: Description of the exception raised by the extraction, None on success
+    error: Optional[str] = None
+
+
+_worker_reader: Optional["PdfReader"] = None
+
+
+def _open_reader(
+    source: Union[str, bytes], password: Union[None, str, bytes], memory_map: bool
+) -> None:
+    from .._reader import PdfReader
+
+    global _worker_reader
+    stream = source if isinstance(source, str) else BytesIO(source)
+    _worker_reader = PdfReader(stream, password=password, memory_map=memory_map)
+
+
+def _extract_pages(
+    reader: "PdfReader",
+    page_numbers: Sequence[int],
+    mode: Literal["plain", "layout"],
+    kwargs: Dict[str, Any],
+) -> List[PageText]:
+    results = []
+    for page_number in page_numbers:
+        try:
+            text = reader.pages[page_number].extract_text(
+                extraction_mode=mode, **kwargs
+            )
+        except Exception as exc:
+            results.append(PageText(page_number, "", f"{type(exc).__name__}: {exc}"))
+        else:
+            results.append(PageText(page_number, text))
+    return results
+
+
+def _extract_pages_in_worker(
+    page_numbers: Sequence[int],
+    mode: Literal["plain", "layout"],
+    kwargs: Dict[str, Any],
+) -> List[PageText]:
+    assert _worker_reader is not None, "the worker is initialized"
+    return _extract_pages(_worker_reader, page_numbers, mode, kwargs)
+
+
+def extract_text_parallel(
+    reader: "PdfReader",
+    source: Union[str, bytes],
+    page_numbers: Sequence[int],
+    workers: Optional[int],
+    mode: Literal["plain", "layout"],
+    ordered: bool,
+    kwargs: Dict[str, Any],
+) -> Iterator[PageText]:
+    """See :meth:`~pypdf.PdfReader.extract_text_parallel`."""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(page_numbers) <= 1:
+        for page_number in page_numbers:
+            yield from _extract_pages(reader, (page_number,), mode, kwargs)
+        return
+
+    batch_size = math.ceil(len(page_numbers) / (workers * BATCHES_PER_WORKER))
+    batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
+    batches = [
+        page_numbers[start : start + batch_size]
+        for start in range(0, len(page_numbers), batch_size)
+    ]
+    workers = min(workers, len(batches))
+    results: Dict[int, List[PageText]] = {}
+    next_batch = 0  # next batch to submit
+    next_result = 0  # next batch to yield, when ordered
+    while next_batch < len(batches):
+        # a worker which dies breaks the pool: the batches which were running
+        # fail, the others are given to a new pool
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_open_reader,
+            initargs=(source, reader._password, reader._memory_map),
+        ) as executor:
+            # batches are submitted when a worker is free, so that those
+            # which were not started are known when the pool breaks
+            running: Dict[Future[List[PageText]], int] = {}
+            try:
+                broken = False
+                while not broken and (running or next_batch < len(batches)):
+                    while len(running) < workers and next_batch < len(batches):
+                        future = executor.submit(
+                            _extract_pages_in_worker, batches[next_batch], mode, kwargs
+                        )
+                        running[future] = next_batch
+                        next_batch += 1
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    if any(isinstance(f.exception(), BrokenProcessPool) for f in done):
+                        broken = True
+                        done = set(running)
+                        wait(done)
+                    for future in done:
+                        index = running.pop(future)
+                        try:
+                            results[index] = future.result()
+                        except Exception as exc:  # the worker died
+                            error = f"{type(exc).__name__}: {exc}"
+                            results[index] = [PageText(n, "", error) for n in batches[index]]
+                    if ordered:
+                        while next_result in results:
+                            yield from results.pop(next_result)
+                            next_result += 1
+                    else:
+                        for index in list(results):
+                            yield from results.pop(index)
+            finally:
+                # when the iteration is stopped early
+                for future in running:
+                    future.cancel()
@@ -31,13 +31,14 @@ __author_email__ = "biziqe@mathieu.fenniak.net"
 
 import functools
 import logging
+import mmap
 import re
 import sys
 import warnings
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from io import DEFAULT_BUFFER_SIZE
-from os import SEEK_CUR
+from os import SEEK_CUR, SEEK_END, SEEK_SET
 from typing import (
     IO,
     Any,
@@ -132,6 +133,7 @@ def _get_max_pdf_version_header(header1: str, header2: str) -> str:
 WHITESPACES = (b"\x00", b"\t", b"\n", b"\f", b"\r", b" ")
 WHITESPACES_AS_BYTES = b"".join(WHITESPACES)
 WHITESPACES_AS_REGEXP = b"[" + WHITESPACES_AS_BYTES + b"]"
+SPACE_REGEXP = re.compile(rb"[ \t\n\r\x0b\f]")  # bytes.isspace()
 
 
 def read_until_whitespace(stream: StreamType, maxchars: Optional[int] = None) -> bytes:
@@ -150,13 +152,18 @@ def read_until_whitespace(stream: StreamType, maxchars: Optional[int] = None) ->
     """
     txt = b""
     while True:
-        tok = stream.read(1)
-        if tok.isspace() or not tok:
-            break
+        size = 32 if not maxchars else min(32, maxchars - len(txt))
+        tok = stream.read(size)
+        if not tok:
+            return txt
+        m = SPACE_REGEXP.search(tok)
+        if m is not None:
+            # consume the whitespace, like the data preceding it
+            stream.seek(m.end() - len(tok), 1)
+            return txt + tok[: m.start()]
         txt += tok
         if len(txt) == maxchars:
-            break
-    return txt
+            return txt
 
 
 def read_non_whitespace(stream: StreamType) -> bytes:
@@ -233,8 +240,9 @@ def read_until_regex(stream: StreamType, regex: Pattern[bytes]) -> bytes:
 
     """
     name = b""
+    size = 16
     while True:
-        tok = stream.read(16)
+        tok = stream.read(size)
         if not tok:
             return name
         m = regex.search(name + tok)
@@ -243,6 +251,8 @@ def read_until_regex(stream: StreamType, regex: Pattern[bytes]) -> bytes:
             name = (name + tok)[: m.start()]
             break
         name += tok
+        # double the size of the reads to keep long tokens linear
+        size *= 2
     return name
 
 
@@ -532,6 +542,78 @@ class classproperty:  # noqa: N801
         return self
 
 
+class MemoryMappedStream:
+    """
+    Read-only, seekable stream backed by a memory-mapped file.
+
+    Only the pages which are actually read are loaded into memory, which keeps
+    the resident memory low for big files. Besides the usual stream interface,
+    :meth:`read_view` returns a ``memoryview`` on the mapped data, which is
+    used to store stream contents without copying them.
+
+    Args:
+        fh: A file object opened in binary mode. It can be closed once the
+            stream has been created.
+
+    """
+
+    def __init__(self, fh: IO[Any]) -> None:
+        self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        self._size = len(self._mmap)
+        self.closed = False
+        # bound methods are used directly as they are called for every byte
+        self.read = self._mmap.read
+        self.tell = self._mmap.tell
+        self.find = self._mmap.find
+
+    def seek(self, offset: int, whence: int = SEEK_SET) -> int:
+        if whence == SEEK_CUR:
+            offset += self._mmap.tell()
+        elif whence == SEEK_END:
+            offset += self._size
+        if offset < 0:
+            raise ValueError(f"negative seek value {offset}")
+        # BytesIO accepts positions beyond the end; reading from there returns b""
+        self._mmap.seek(min(offset, self._size))
+        return offset
+
+    def read_view(self, size: int = -1) -> memoryview:
+        """
+        Read up to size bytes as a zero-copy view on the mapped data.
+
+        Args:
+            size: The maximum number of bytes to read; by default all remaining data.
+
+        Returns:
+            A read-only memoryview.
+
+        """
+        start = self._mmap.tell()
+        end = self._size if size < 0 else min(start + size, self._size)
+        self._mmap.seek(end)
+        return self._view[start:end]
+
+    def getbuffer(self) -> memoryview:
+        return self._view
+
+    def getvalue(self) -> mmap.mmap:
+        """Return the mapped data without copying it; slices of it are bytes."""
+        return self._mmap
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Some views are still referenced by stream objects:
+            # the mapping will be released once they have been garbage collected.
+            pass
+
+
 @dataclass
 class File:
     from .generic import IndirectObject
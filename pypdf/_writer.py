@@ -34,9 +34,8 @@ import re
 import struct
 import uuid
 from io import BytesIO, FileIO, IOBase
-from itertools import compress
 from pathlib import Path
-from types import TracebackType
+from types import MappingProxyType, TracebackType
 from typing import (
     IO,
     Any,
@@ -44,6 +43,7 @@ from typing import (
     Dict,
     Iterable,
     List,
+    Mapping,
     Optional,
     Pattern,
     Tuple,
@@ -55,10 +55,12 @@ from typing import (
 from ._cmap import _default_fonts_space_width, build_char_map_from_dict
 from ._doc_common import DocumentInformation, PdfDocCommon
 from ._encryption import EncryptAlgorithm, Encryption
-from ._page import PageObject
+from ._object_deduplication import compress_objects
+from ._page import MERGE_CROP_BOX, PageObject, Transformation
 from ._page_labels import nums_clear_range, nums_insert, nums_next
 from ._reader import PdfReader
 from ._utils import (
+    CompressedTransformationMatrix,
     StrByteType,
     StreamType,
     _get_max_pdf_version_header,
@@ -111,6 +113,7 @@ from .generic import (
     hex_to_rgb,
     is_null_or_none,
 )
+from .generic._data_structures import track_changes
 from .pagerange import PageRange, PageRangeSpec
 from .types import (
     AnnotationSubtype,
@@ -124,6 +127,8 @@ from .xmp import XmpInformation
 
 ALL_DOCUMENT_PERMISSIONS = UserAccessPermissions.all()
 DEFAULT_FONT_HEIGHT_IN_MULTILINE = 12
+OUTPUT_BUFFER_SIZE = 1 << 20
+OBJECT_STREAM_SIZE = 100
 
 
 class ObjectDeletionFlag(enum.IntFlag):
@@ -139,6 +144,52 @@ class ObjectDeletionFlag(enum.IntFlag):
     IMAGES = XOBJECT_IMAGES | INLINE_IMAGES | DRAWING_IMAGES
 
 
+class _PdfOutput:
+    """
+    Buffered output of a PDF file.
+
+    The serialized objects are accumulated in memory and written to the
+    underlying stream by blocks of about ``buffer_size`` bytes, rather than
+    token per token. The offset of each indirect object is recorded for the
+    cross-reference table.
+    """
+
+    def __init__(self, stream: StreamType, buffer_size: int = OUTPUT_BUFFER_SIZE) -> None:
+        self.stream = stream
+        self.buffer_size = buffer_size
+        #: Offsets of the written objects, by object number
+        self.positions: Dict[int, int] = {}
+        self.closed = False
+        self.origin = stream.tell()
+        self._buffer = BytesIO()
+        self._start = self.origin  # offset of the buffer in the stream
+
+    def tell(self) -> int:
+        return self._start + self._buffer.tell()
+
+    def write(self, data: bytes) -> int:
+        written = self._buffer.write(data)
+        if self._buffer.tell() >= self.buffer_size:
+            self.flush()
+        return written
+
+    def write_object(self, idnum: int, obj: PdfObject) -> None:
+        buffer = self._buffer
+        self.positions[idnum] = self._start + buffer.tell()
+        buffer.write(b"%d 0 obj\n" % idnum)
+        obj.write_to_stream(buffer)
+        buffer.write(b"\nendobj\n")
+        if buffer.tell() >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        size = self._buffer.tell()
+        if size:
+            self.stream.write(self._buffer.getbuffer())
+            self._start += size
+            self._buffer = BytesIO()
+
+
 def _rolling_checksum(stream: BytesIO, blocksize: int = 65536) -> str:
     hash = hashlib.md5()
     for block in iter(lambda: stream.read(blocksize), b""):
@@ -186,9 +237,24 @@ class PdfWriter(PdfDocCommon):
         in clone_reader_document_root.
         """
 
-        self._original_hash: List[int] = []
+        self._object_index: Dict[int, int] = {}
+        """
+        Maps the id() of the indirect objects to their object number, see
+        get_reference. Entries are checked against _objects before use, as
+        _objects may be modified directly.
+        """
+
+        self._original_objects: List[Optional[PdfObject]] = []
         """
-        List of hashes after import; used to identify changes.
+        The objects after import in incremental mode; used with their
+        _modified flag to identify changes, see track_changes.
+        """
+
+        self.verify_increment = False
+        """
+        In incremental mode, also compare the objects which are not marked as
+        modified with the original ones, to find the changes made without the
+        methods of the generic objects. Slower: the whole document is read.
         """
 
         self._idnum_hash: Dict[bytes, Tuple[IndirectObject, List[IndirectObject]]] = {}
@@ -210,6 +276,16 @@ class PdfWriter(PdfDocCommon):
         """The PDF file identifier,
         defined by the ID in the PDF file's trailer dictionary."""
 
+        self._output: Optional[_PdfOutput] = None
+        """The output when the document is written progressively, see stream_to."""
+
+        self._output_owned = False
+        self._output_header = b""
+        self._pending_pages: List[PageObject] = []
+        """Pages whose objects will be written to the output by the next flush."""
+
+        self._flush_holds = 0
+
         if self.incremental:
             if isinstance(fileobj, (str, Path)):
                 with open(fileobj, "rb") as f:
@@ -336,7 +412,9 @@ class PdfWriter(PdfDocCommon):
     def _info(self, value: Optional[Union[IndirectObject, DictionaryObject]]) -> None:
         if value is None:
             try:
-                self._objects[self._info_obj.indirect_reference.idnum - 1] = None  # type: ignore
+                idnum = self._info_obj.indirect_reference.idnum  # type: ignore
+                self._object_index.pop(id(self._objects[idnum - 1]), None)
+                self._objects[idnum - 1] = None
             except (KeyError, AttributeError):
                 pass
             self._info_obj = None
@@ -390,7 +468,9 @@ class PdfWriter(PdfDocCommon):
         traceback: Optional[TracebackType],
     ) -> None:
         """Write data to the fileobj."""
-        if self.fileobj and not self._cloned:
+        if self._output is not None:
+            self.close()
+        elif self.fileobj and not self._cloned:
             self.write(self.fileobj)
 
     @property
@@ -424,6 +504,7 @@ class PdfWriter(PdfDocCommon):
         ):
             obj[NameObject(PG.CONTENTS)] = self._add_object(obj[PG.CONTENTS])
         self._objects.append(obj)
+        self._object_index[id(obj)] = len(self._objects)
         obj.indirect_reference = IndirectObject(len(self._objects), 0, self)
         return obj.indirect_reference
 
@@ -437,6 +518,16 @@ class PdfWriter(PdfDocCommon):
             raise ValueError("PDF must be self")
         else:
             obj = self._objects[indirect_reference.idnum - 1]
+        if obj is None and self._output is not None:
+            idnum = (
+                indirect_reference
+                if isinstance(indirect_reference, int)
+                else indirect_reference.idnum
+            )
+            if idnum in self._output.positions:
+                raise PyPdfError(
+                    f"Object {idnum} has already been written to the output"
+                )
         assert obj is not None  # clarification for mypy
         return obj
 
@@ -455,7 +546,9 @@ class PdfWriter(PdfDocCommon):
             and obj.indirect_reference.pdf != self  # type: ignore
         ):
             obj = obj.clone(self)
+        self._object_index.pop(id(self._objects[indirect_reference - 1]), None)
         self._objects[indirect_reference - 1] = obj
+        self._object_index[id(obj)] = indirect_reference
         obj.indirect_reference = IndirectObject(indirect_reference, gen, self)
 
         assert isinstance(obj, PdfObject)  # clarification for mypy
@@ -498,6 +591,13 @@ class PdfWriter(PdfDocCommon):
         else:
             cast(ArrayObject, node[PA.KIDS]).append(page.indirect_reference)
             self.flattened_pages.append(page)
+        if self._page_id2num is not None:
+            if self.flattened_pages[-1] is page:
+                self._page_id2num.setdefault(page.indirect_reference.idnum, index)  # type: ignore
+            else:  # the following pages are shifted
+                self._page_id2num = None
+        if self._output is not None:
+            self._pending_pages.append(page)
         recurse = 0
         while not is_null_or_none(node):
             node = cast(DictionaryObject, node.get_object())
@@ -571,6 +671,7 @@ class PdfWriter(PdfDocCommon):
 
         """
         assert self.flattened_pages is not None, "mypy"
+        self._flush_pending_pages()
         return self._add_page(page, len(self.flattened_pages), excluded_keys)
 
     def insert_page(
@@ -600,32 +701,9 @@ class PdfWriter(PdfDocCommon):
         if index >= len(self.flattened_pages):
             return self.add_page(page, excluded_keys)
         else:
+            self._flush_pending_pages()
             return self._add_page(page, index, excluded_keys)
 
-    def _get_page_number_by_indirect(
-        self, indirect_reference: Union[None, int, NullObject, IndirectObject]
-    ) -> Optional[int]:
-        """
-        Generate _page_id2num.
-
-        Args:
-            indirect_reference:
-
-        Returns:
-            The page number or None
-
-        """
-        # to provide same function as in PdfReader
-        if is_null_or_none(indirect_reference):
-            return None
-        assert indirect_reference is not None, "mypy"
-        if isinstance(indirect_reference, int):
-            indirect_reference = IndirectObject(indirect_reference, 0, self)
-        obj = indirect_reference.get_object()
-        if isinstance(obj, PageObject):
-            return obj.page_number
-        return None
-
     def add_blank_page(
         self, width: Optional[float] = None, height: Optional[float] = None
     ) -> PageObject:
@@ -1016,8 +1094,7 @@ class PdfWriter(PdfDocCommon):
             ] = self._add_object(dct)
         else:  # [/AP][/N] exists
             n = annotation[AA.AP]["/N"].indirect_reference.idnum  # type: ignore
-            self._objects[n - 1] = dct
-            dct.indirect_reference = IndirectObject(n, 0, self)
+            self._replace_object(n, dct)
 
     FFBITS_NUL = FA.FfBits(0)
 
@@ -1198,19 +1275,29 @@ class PdfWriter(PdfDocCommon):
                     self._objects[i] = o.replicate(self)
         else:
             self._objects.clear()
+        self._rebuild_object_index()
         self._root_object = reader.root_object.clone(self)
         self._pages = self._root_object.raw_get("/Pages")
 
         assert len(self._objects) <= cast(int, reader.trailer["/Size"])  # for pytest
         # must be done here before rewriting
         if self.incremental:
-            self._original_hash = [
-                (obj.hash_bin() if obj is not None else 0) for obj in self._objects
-            ]
+            self._original_objects = list(self._objects)
+            for obj in self._objects:
+                if obj is not None:
+                    track_changes(obj)
         self._flatten()
         assert self.flattened_pages is not None
         for p in self.flattened_pages:
-            self._replace_object(cast(IndirectObject, p.indirect_reference).idnum, p)
+            idnum = cast(IndirectObject, p.indirect_reference).idnum
+            original = self._objects[idnum - 1]
+            self._replace_object(idnum, p)
+            if self.incremental and original is not None:
+                # same entries as the original object, which may have
+                # inherited some of them
+                track_changes(p)
+                p._modified = original._modified
+                self._original_objects[idnum - 1] = p
             if not self.incremental:
                 p[NameObject("/Parent")] = self._pages
         if not self.incremental:
@@ -1246,9 +1333,7 @@ class PdfWriter(PdfDocCommon):
                     IndirectObject, inf.clone(self).indirect_reference
                 )
                 assert isinstance(self._info, DictionaryObject), "for mypy"
-                self._original_hash[
-                    self._info_obj.indirect_reference.idnum - 1
-                ] = self._info.hash_bin()
+                self._info._modified = False
         elif inf is not None:
             self._info_obj = self._add_object(
                 DictionaryObject(cast(DictionaryObject, inf.get_object()))
@@ -1268,7 +1353,9 @@ class PdfWriter(PdfDocCommon):
 
     def _compute_document_identifier(self) -> ByteStringObject:
         stream = BytesIO()
-        self._write_pdf_structure(stream)
+        output = _PdfOutput(stream)
+        self._write_pdf_structure(output)
+        output.flush()
         stream.seek(0)
         return ByteStringObject(_rolling_checksum(stream).encode("utf8"))
 
@@ -1324,7 +1411,14 @@ class PdfWriter(PdfDocCommon):
                 "AES-128", "AES-256-R5", "AES-256". If it is valid,
                 `use_128bit` will be ignored.
 
+        Raises:
+            PyPdfError: If objects have already been written by :meth:`stream_to`.
+
         """
+        if self._output_header:
+            raise PyPdfError(
+                "The document has to be encrypted before pages are added to the output"
+            )
         if owner_password is None:
             owner_password = user_password
 
@@ -1345,19 +1439,28 @@ class PdfWriter(PdfDocCommon):
         if self._encrypt_entry:
             # replace old encrypt_entry
             assert self._encrypt_entry.indirect_reference is not None
-            entry.indirect_reference = self._encrypt_entry.indirect_reference
-            self._objects[entry.indirect_reference.idnum - 1] = entry
+            self._replace_object(self._encrypt_entry.indirect_reference, entry)
         else:
             self._add_object(entry)
         self._encrypt_entry = entry
 
-    def write_stream(self, stream: StreamType) -> None:
+    def write_stream(
+        self,
+        stream: StreamType,
+        use_object_streams: bool = False,
+        object_stream_size: int = OBJECT_STREAM_SIZE,
+    ) -> None:
         if hasattr(stream, "mode") and "b" not in stream.mode:
             logger_warning(
                 f"File <{stream.name}> to write to is not in binary mode. "
                 "It may not be written to correctly.",
                 __name__,
             )
+        if self._output is not None:
+            raise PyPdfError(
+                "The document is already being written by stream_to(): "
+                "call close() to complete it"
+            )
         # deprecated to be removed in pypdf 6.0.0 :
         # if not self._root:
         #   self._root = self._add_object(self._root_object)
@@ -1367,15 +1470,29 @@ class PdfWriter(PdfDocCommon):
             self._reader.stream.seek(0)
             stream.write(self._reader.stream.read(-1))
             if len(self.list_objects_in_increment()) > 0:
-                self._write_increment(stream)  # writes objs, xref stream and startxref
+                output = _PdfOutput(stream)
+                # writes objs, xref stream and startxref
+                self._write_increment(cast(StreamType, output))
+                output.flush()
+        elif use_object_streams:
+            output = _PdfOutput(stream)
+            self._write_compressed_structure(output, object_stream_size)
+            output.flush()
         else:
-            object_positions, free_objects = self._write_pdf_structure(stream)
+            output = _PdfOutput(stream)
+            object_positions, free_objects = self._write_pdf_structure(output)
             xref_location = self._write_xref_table(
-                stream, object_positions, free_objects
+                cast(StreamType, output), object_positions, free_objects
             )
-            self._write_trailer(stream, xref_location)
+            self._write_trailer(cast(StreamType, output), xref_location)
+            output.flush()
 
-    def write(self, stream: Union[Path, StrByteType]) -> Tuple[bool, IO[Any]]:
+    def write(
+        self,
+        stream: Union[Path, StrByteType],
+        use_object_streams: bool = False,
+        object_stream_size: int = OBJECT_STREAM_SIZE,
+    ) -> Tuple[bool, IO[Any]]:
         """
         Write the collection of pages added to this object out as a PDF file.
 
@@ -1384,6 +1501,11 @@ class PdfWriter(PdfDocCommon):
                 the write method and the tell method, similar to a file object, or
                 be a file path, just like the fileobj, just named it stream to keep
                 existing workflow.
+            use_object_streams: If true, the objects which are not streams are
+                packed in compressed object streams, and the cross-reference
+                table is written as a compressed stream. This requires PDF 1.5:
+                the header is raised if needed. Not used in incremental mode.
+            object_stream_size: Maximum number of objects per object stream.
 
         Returns:
             A tuple (bool, IO).
@@ -1398,7 +1520,7 @@ class PdfWriter(PdfDocCommon):
             stream = FileIO(stream, "wb")
             my_file = True
 
-        self.write_stream(stream)
+        self.write_stream(stream, use_object_streams, object_stream_size)
 
         if my_file:
             stream.close()
@@ -1407,6 +1529,100 @@ class PdfWriter(PdfDocCommon):
 
         return my_file, stream
 
+    def stream_to(
+        self,
+        stream: Union[Path, StrByteType],
+        buffer_size: int = OUTPUT_BUFFER_SIZE,
+    ) -> None:
+        """
+        Write the document progressively instead of keeping it in memory.
+
+        The objects used by the pages added afterwards with :meth:`add_page`,
+        :meth:`insert_page`, :meth:`append` or :meth:`merge` (content
+        streams, images, fonts, annotations, ...) are written to the output
+        when the next pages are added, then released. The page dictionaries,
+        the document structure (page tree, outline, forms, ...) and the
+        remaining objects are written by :meth:`close`, followed by the
+        cross-reference table and the trailer.
+
+        Written objects cannot be accessed through the writer anymore: the
+        pages have to be modified before the next pages are added.
+        :meth:`encrypt` has to be called before adding pages.
+
+        Args:
+            stream: The file object or the path of the file to write to.
+            buffer_size: Number of bytes accumulated in memory between two
+                writes to the stream.
+
+        Raises:
+            PyPdfError: If the writer is in incremental mode or is already
+                streaming.
+
+        """
+        if self.incremental:
+            raise PyPdfError("stream_to() is not supported in incremental mode")
+        if self._output is not None:
+            raise PyPdfError("The document is already being written")
+        if stream == "":
+            raise ValueError(f"Output({stream=}) is empty.")
+        self._output_owned = isinstance(stream, (str, Path))
+        if isinstance(stream, (str, Path)):
+            stream = FileIO(stream, "wb")
+        self._output = _PdfOutput(cast(StreamType, stream), buffer_size)
+
+    def _flush_pending_pages(self) -> None:
+        """Write and release the objects used by the pages added since the last flush."""
+        output = self._output
+        if output is None or self._flush_holds or not self._pending_pages:
+            return
+        self._write_output_header(output)
+        # the objects referenced by the catalog may still be modified
+        kept = set()
+        for obj in (
+            self._root_object,
+            self._pages,
+            self._info_obj,
+            self._encrypt_entry,
+            *self._root_object.values(),
+        ):
+            ref = getattr(obj, "indirect_reference", None)
+            if isinstance(ref, IndirectObject) and ref.pdf is self:
+                kept.add(ref.idnum)
+        stack: List[Any] = []
+        for page in self._pending_pages:
+            stack.extend(page.values())
+        self._pending_pages = []
+        while stack:
+            obj = stack.pop()
+            if isinstance(obj, IndirectObject):
+                idnum = obj.idnum
+                if (
+                    obj.pdf is not self
+                    or idnum in kept
+                    or idnum in output.positions
+                    or idnum > len(self._objects)
+                ):
+                    continue
+                obj = self._objects[idnum - 1]
+                if obj is None or (
+                    isinstance(obj, DictionaryObject)
+                    and obj.get(PA.TYPE) in (CO.PAGE, CO.PAGES)
+                ):
+                    # the pages are written by close()
+                    continue
+                self._write_object(output, idnum, obj)
+                self._objects[idnum - 1] = None
+                self._object_index.pop(id(obj), None)
+            if isinstance(obj, DictionaryObject):
+                stack.extend(obj.values())
+            elif isinstance(obj, ArrayObject):
+                stack.extend(obj)
+
+    def _write_output_header(self, output: _PdfOutput) -> None:
+        if not self._output_header:
+            self._output_header = self._header
+            output.write(self._header + b"\n%\xE2\xE3\xCF\xD3\n")
+
     def list_objects_in_increment(self) -> List[IndirectObject]:
         """
         For analysis or debugging.
@@ -1418,30 +1634,37 @@ class PdfWriter(PdfDocCommon):
             List of new or modified IndirectObjects
 
         """
-        original_hash_count = len(self._original_hash)
         return [
             cast(IndirectObject, obj).indirect_reference
-            for i, obj in enumerate(self._objects)
-            if (
-                obj is not None
-                and (
-                    i >= original_hash_count
-                    or obj.hash_bin() != self._original_hash[i]
-                )
-            )
+            for idnum, obj in enumerate(self._objects, 1)
+            if self._is_in_increment(idnum, obj)
         ]
 
+    def _is_in_increment(self, idnum: int, obj: Optional[PdfObject]) -> bool:
+        if obj is None:
+            return False
+        if (
+            idnum > len(self._original_objects)
+            or obj is not self._original_objects[idnum - 1]
+            or obj._modified
+        ):
+            return True
+        if not self.verify_increment:
+            return False
+        # the references of the original object point to the reader: the
+        # objects are compared through their serialization
+        original, current = BytesIO(), BytesIO()
+        cast(PdfObject, self._reader.get_object(idnum)).write_to_stream(original)
+        obj.write_to_stream(current)
+        return original.getvalue() != current.getvalue()
+
     def _write_increment(self, stream: StreamType) -> None:
         object_positions = {}
         object_blocks = []
         current_start = -1
         current_stop = -2
-        original_hash_count = len(self._original_hash)
         for i, obj in enumerate(self._objects):
-            if obj is not None and (
-                i >= original_hash_count
-                or obj.hash_bin() != self._original_hash[i]
-            ):
+            if self._is_in_increment(i + 1, obj):
                 idnum = i + 1
                 assert isinstance(obj, PdfObject)  # mypy
                 # first write new/modified object
@@ -1481,13 +1704,9 @@ class PdfWriter(PdfDocCommon):
             ),
             "__streamdata__": b"",
         }
-        if self._info is not None and (
-            self._info.indirect_reference.idnum - 1  # type: ignore
-            >= len(self._original_hash)
-            or cast(IndirectObject, self._info).hash_bin()  # kept for future
-            != self._original_hash[
-                self._info.indirect_reference.idnum - 1  # type: ignore
-            ]
+        if self._info is not None and self._is_in_increment(
+            self._info.indirect_reference.idnum,  # type: ignore
+            self._info,
         ):
             init_data[NameObject(TK.INFO)] = self._info.indirect_reference
         init_data[NameObject(TK.PREV)] = NumberObject(self._reader._startxref)
@@ -1502,24 +1721,26 @@ class PdfWriter(PdfDocCommon):
         xr.write_to_stream(stream)
         stream.write(f"\nstartxref\n{xref_location}\n%%EOF\n".encode())  # eof
 
-    def _write_pdf_structure(self, stream: StreamType) -> Tuple[List[int], List[int]]:
-        object_positions = []
-        free_objects = []  # will contain list of all free entries
-        stream.write(self.pdf_header.encode() + b"\n")
-        stream.write(b"%\xE2\xE3\xCF\xD3\n")
-
+    def _write_pdf_structure(self, output: _PdfOutput) -> Tuple[List[int], List[int]]:
+        output.write(self.pdf_header.encode() + b"\n%\xE2\xE3\xCF\xD3\n")
         for i, obj in enumerate(self._objects):
             if obj is not None:
-                idnum = i + 1
-                object_positions.append(stream.tell())
-                stream.write(f"{idnum} 0 obj\n".encode())
-                if self._encryption and obj != self._encrypt_entry:
-                    obj = self._encryption.encrypt_object(obj, idnum, 0)
-                obj.write_to_stream(stream)
-                stream.write(b"\nendobj\n")
-            else:
-                object_positions.append(-1)
-                free_objects.append(i + 1)
+                self._write_object(output, i + 1, obj)
+        return self._get_object_positions(output)
+
+    def _write_object(self, output: _PdfOutput, idnum: int, obj: PdfObject) -> None:
+        if self._encryption and obj != self._encrypt_entry:
+            obj = self._encryption.encrypt_object(obj, idnum, 0)
+        output.write_object(idnum, obj)
+
+    def _get_object_positions(self, output: _PdfOutput) -> Tuple[List[int], List[int]]:
+        object_positions = []
+        free_objects = []  # will contain list of all free entries
+        for idnum in range(1, len(self._objects) + 1):
+            position = output.positions.get(idnum, -1)
+            object_positions.append(position)
+            if position < 0:
+                free_objects.append(idnum)
         free_objects.append(0)  # add 0 to loop in accordance with PDF spec
         return object_positions, free_objects
 
@@ -1527,16 +1748,19 @@ class PdfWriter(PdfDocCommon):
         self, stream: StreamType, object_positions: List[int], free_objects: List[int]
     ) -> int:
         xref_location = stream.tell()
-        stream.write(b"xref\n")
-        stream.write(f"0 {len(self._objects) + 1}\n".encode())
-        stream.write(f"{free_objects[0]:0>10} {65535:0>5} f \n".encode())
+        lines = [
+            b"xref\n",
+            b"0 %d\n" % (len(self._objects) + 1),
+            b"%010d 65535 f \n" % free_objects[0],
+        ]
         free_idx = 1
         for offset in object_positions:
             if offset > 0:
-                stream.write(f"{offset:0>10} {0:0>5} n \n".encode())
+                lines.append(b"%010d 00000 n \n" % offset)
             else:
-                stream.write(f"{free_objects[free_idx]:0>10} {1:0>5} f \n".encode())
+                lines.append(b"%010d 00001 f \n" % free_objects[free_idx])
                 free_idx += 1
+        stream.write(b"".join(lines))
         return xref_location
 
     def _write_trailer(self, stream: StreamType, xref_location: int) -> None:
@@ -1548,9 +1772,14 @@ class PdfWriter(PdfDocCommon):
             of certain special objects within the body of the file.
         """
         stream.write(b"trailer\n")
+        trailer = self._get_trailer_entries(len(self._objects) + 1)
+        trailer.write_to_stream(stream)
+        stream.write(f"\nstartxref\n{xref_location}\n%%EOF\n".encode())  # eof
+
+    def _get_trailer_entries(self, size: int) -> DictionaryObject:
         trailer = DictionaryObject(
             {
-                NameObject(TK.SIZE): NumberObject(len(self._objects) + 1),
+                NameObject(TK.SIZE): NumberObject(size),
                 NameObject(TK.ROOT): self.root_object.indirect_reference,
             }
         )
@@ -1560,8 +1789,62 @@ class PdfWriter(PdfDocCommon):
             trailer[NameObject(TK.ID)] = self._ID
         if self._encrypt_entry:
             trailer[NameObject(TK.ENCRYPT)] = self._encrypt_entry.indirect_reference
-        trailer.write_to_stream(stream)
-        stream.write(f"\nstartxref\n{xref_location}\n%%EOF\n".encode())  # eof
+        return trailer
+
+    def _write_compressed_structure(
+        self, output: _PdfOutput, object_stream_size: int
+    ) -> None:
+        """
+        Write the objects, packing the ones which are not streams in object
+        streams, followed by a cross-reference stream.
+
+        See §7.5.7 and §7.5.8 of the PDF 1.7 specification.
+        """
+        if object_stream_size < 1:
+            raise ValueError("object_stream_size must be at least 1")
+        header = _get_max_pdf_version_header(self.pdf_header, "%PDF-1.5")
+        output.write(header.encode() + b"\n%\xE2\xE3\xCF\xD3\n")
+        packed: List[Tuple[int, PdfObject]] = []
+        for i, obj in enumerate(self._objects):
+            if obj is None:
+                continue
+            # the encryption dictionary cannot be encrypted with the object stream
+            packable = not isinstance(obj, StreamObject) and obj is not self._encrypt_entry
+            if packable:
+                packed.append((i + 1, obj))
+            else:
+                self._write_object(output, i + 1, obj)
+
+        # object number -> (number of the object stream, index in the stream)
+        compressed: Dict[int, Tuple[int, int]] = {}
+        stream_idnum = len(self._objects)
+        for start in range(0, len(packed), object_stream_size):
+            stream_idnum += 1
+            batch = packed[start : start + object_stream_size]
+            for index, (idnum, _) in enumerate(batch):
+                compressed[idnum] = (stream_idnum, index)
+            self._write_object(output, stream_idnum, _create_object_stream(batch))
+
+        # the cross-reference stream, which is not encrypted, comes last
+        xref_idnum = stream_idnum + 1
+        xref_location = output.tell()
+        output.positions[xref_idnum] = xref_location
+        entries = [[0, 0, 65535]]
+        last_free = 0
+        for idnum in range(1, xref_idnum + 1):
+            if idnum in output.positions:
+                entries.append([1, output.positions[idnum], 0])
+            elif idnum in compressed:
+                entries.append([2, *compressed[idnum]])
+            else:
+                # chain the free entries like in the cross-reference table
+                entries[last_free][1] = idnum
+                last_free = idnum
+                entries.append([0, 0, 1])
+        xref = _create_xref_stream(entries)
+        xref.update(self._get_trailer_entries(xref_idnum + 1))
+        output.write_object(xref_idnum, xref)
+        output.write(f"\nstartxref\n{xref_location}\n%%EOF\n".encode())
 
     @property
     def metadata(self) -> Optional[DocumentInformation]:
@@ -1615,75 +1898,38 @@ class PdfWriter(PdfDocCommon):
         self,
         remove_identicals: bool = True,
         remove_orphans: bool = True,
-    ) -> None:
+    ) -> int:
         """
-        Parse the PDF file and merge objects that have the same hash.
+        Parse the PDF file and merge objects that have the same content.
         This will make objects common to multiple pages.
         Recommended to be used just before writing output.
 
+        Objects which only differ by references to identical objects are
+        merged as well. Pages are never merged.
+
         Args:
             remove_identicals: Remove identical objects.
-            remove_orphans: Remove unreferenced objects.
-
-        """
+            remove_orphans: Remove the objects which cannot be reached from
+                the document catalog or the document information.
 
-        def replace_in_obj(
-            obj: PdfObject, crossref: Dict[IndirectObject, IndirectObject]
-        ) -> None:
-            if isinstance(obj, DictionaryObject):
-                key_val = obj.items()
-            elif isinstance(obj, ArrayObject):
-                key_val = enumerate(obj)  # type: ignore
-            else:
-                return
-            assert isinstance(obj, (DictionaryObject, ArrayObject))
-            for k, v in key_val:
-                if isinstance(v, IndirectObject):
-                    orphans[v.idnum - 1] = False
-                    if v in crossref:
-                        obj[k] = crossref[v]
-                else:
-                    """the filtering on DictionaryObject and ArrayObject only
-                    will be performed within replace_in_obj"""
-                    replace_in_obj(v, crossref)
-
-        # _idnum_hash :dict[hash]=(1st_ind_obj,[other_indir_objs,...])
-        self._idnum_hash = {}
-        orphans = [True] * len(self._objects)
-        # look for similar objects
-        for idx, obj in enumerate(self._objects):
-            if obj is None:
-                continue
-            assert isinstance(obj.indirect_reference, IndirectObject)
-            h = obj.hash_value()
-            if remove_identicals and h in self._idnum_hash:
-                self._idnum_hash[h][1].append(obj.indirect_reference)
-                self._objects[idx] = None
-            else:
-                self._idnum_hash[h] = (obj.indirect_reference, [])
-
-        # generate the dict converting others to 1st
-        cnv = {v[0]: v[1] for v in self._idnum_hash.values() if len(v[1]) > 0}
-        cnv_rev: Dict[IndirectObject, IndirectObject] = {}
-        for k, v in cnv.items():
-            cnv_rev.update(zip(v, (k,) * len(v)))
-
-        # replace reference to merged objects
-        for obj in self._objects:
-            if isinstance(obj, (DictionaryObject, ArrayObject)):
-                replace_in_obj(obj, cnv_rev)
-
-        # remove orphans (if applicable)
-        orphans[self.root_object.indirect_reference.idnum - 1] = False  # type: ignore
+        Returns:
+            The number of bytes saved, estimated from the size of the removed
+            objects without encryption.
 
-        orphans[self._info.indirect_reference.idnum - 1] = False  # type: ignore
+        Raises:
+            PyPdfError: If the document is written by :meth:`stream_to`.
 
-        try:
-            orphans[self._ID.indirect_reference.idnum - 1] = False  # type: ignore
-        except AttributeError:
-            pass
-        for i in compress(range(len(self._objects)), orphans):
-            self._objects[i] = None
+        """
+        if self._output is not None:
+            raise PyPdfError(
+                "Identical objects cannot be merged once the output is started"
+            )
+        roots = [
+            obj.indirect_reference.idnum
+            for obj in (self._root_object, self._info_obj, self._encrypt_entry, self._ID)
+            if obj is not None and obj.indirect_reference is not None
+        ]
+        return compress_objects(self, roots, remove_identicals, remove_orphans)
 
     def _sweep_indirect_references(
         self,
@@ -1753,11 +1999,49 @@ class PdfWriter(PdfDocCommon):
         )
         return IndirectObject(0, 0, self)
 
+    def _rebuild_object_index(self) -> None:
+        self._object_index = {
+            id(obj): idnum
+            for idnum, obj in enumerate(self._objects, 1)
+            if obj is not None
+        }
+
+    def _find_object(self, obj: PdfObject) -> Optional[int]:
+        idnum = self._object_index.get(id(obj))
+        # the identifier of a removed object may have been reused
+        if idnum is not None and self._objects[idnum - 1] is obj:
+            return idnum
+        return None
+
+    @property
+    def object_index(self) -> Mapping[int, int]:
+        """
+        Read-only mapping of the ``id()`` of the indirect objects of the
+        writer to their object number.
+
+        It is the index used by :meth:`get_reference`.
+        """
+        return MappingProxyType(self._object_index)
+
     def get_reference(self, obj: PdfObject) -> IndirectObject:
-        idnum = self._objects.index(obj) + 1
-        ref = IndirectObject(idnum, 0, self)
-        assert ref.get_object() == obj
-        return ref
+        """
+        Get a reference to an indirect object of the writer.
+
+        Args:
+            obj: The object.
+
+        Returns:
+            The reference to the object.
+
+        Raises:
+            ValueError: If the object is not an indirect object of the writer.
+
+        """
+        idnum = self._find_object(obj)
+        if idnum is None:
+            # an equal object, as compared by list.index
+            idnum = self._objects.index(obj) + 1
+        return IndirectObject(idnum, 0, self)
 
     def get_outline_root(self) -> TreeObject:
         if CO.OUTLINES in self._root_object:
@@ -1767,9 +2051,7 @@ class PdfWriter(PdfDocCommon):
                 t = TreeObject(outline)
                 self._replace_object(outline.indirect_reference.idnum, t)
                 outline = t
-            idnum = self._objects.index(outline) + 1
-            outline_ref = IndirectObject(idnum, 0, self)
-            assert outline_ref.get_object() == outline
+            outline_ref = self.get_reference(outline)
         else:
             outline = TreeObject()
             outline.update({})
@@ -2035,7 +2317,7 @@ class PdfWriter(PdfDocCommon):
                 obj = cast(DictionaryObject, an.get_object())
                 if subtypes is None or cast(str, obj["/Subtype"]) in subtypes:
                     if isinstance(an, IndirectObject):
-                        self._objects[an.idnum - 1] = NullObject()  # to reduce PDF size
+                        self._replace_object(an, NullObject())  # to reduce PDF size
                     del page[PG.ANNOTS][i]  # type:ignore
                 else:
                     i += 1
@@ -2085,10 +2367,11 @@ class PdfWriter(PdfDocCommon):
 
         def clean(content: ContentStream, images: List[str], forms: List[str]) -> None:
             nonlocal jump_operators, to_delete
-            i = 0
-            while i < len(content.operations):
-                operands, operator = content.operations[i]
-                if (
+            # filtered while parsing: the operations are only listed once
+            content.operations = [
+                (operands, operator)
+                for operands, operator in content.iter_operations()
+                if not (
                     (
                         operator == b"INLINE IMAGE"
                         and (to_delete & ObjectDeletionFlag.INLINE_IMAGES)
@@ -2099,10 +2382,8 @@ class PdfWriter(PdfDocCommon):
                         and (to_delete & ObjectDeletionFlag.XOBJECT_IMAGES)
                         and (operands[0] in images)
                     )
-                ):
-                    del content.operations[i]
-                else:
-                    i += 1
+                )
+            ]
             content.get_data()  # this ensures ._data is rebuilt from the .operations
 
         def clean_forms(
@@ -2159,7 +2440,7 @@ class PdfWriter(PdfDocCommon):
                         clean_forms(content, stack)  # clean subforms
                     if content is not None:
                         if isinstance(v, IndirectObject):
-                            self._objects[v.idnum - 1] = content
+                            self._replace_object(v, content)
                         else:
                             # should only occur in a PDF not respecting PDF spec
                             # where streams must be indirected.
@@ -2440,6 +2721,120 @@ class PdfWriter(PdfDocCommon):
             mode_name = NameObject(mode)
         self._root_object.update({NameObject("/PageMode"): mode_name})
 
+    def stamp_pages(
+        self,
+        stamp_page: PageObject,
+        pages: Optional[Iterable[Union[int, PageObject]]] = None,
+        over: bool = True,
+        transformation: Union[
+            None, Transformation, CompressedTransformationMatrix
+        ] = None,
+    ) -> IndirectObject:
+        """
+        Draw a page over or under many pages of the document, as a stamp or
+        a watermark.
+
+        Unlike :meth:`~pypdf._page.PageObject.merge_page`, the stamp is added
+        once as a form XObject shared by all the pages. Each page gets a short
+        content stream drawing it: the existing contents are neither parsed
+        nor rewritten. The annotations of the stamp page are not copied.
+
+        Args:
+            stamp_page: The page to draw, from any document.
+            pages: The pages to stamp, as page numbers or pages of this writer.
+                All the pages by default.
+            over: Draw the stamp over the page contents if True (default),
+                else under them.
+            transformation: The transformation applied to the stamp.
+
+        Returns:
+            The reference to the form XObject.
+
+        Raises:
+            ValueError: A page does not belong to this writer.
+
+        """
+        form = self._add_object(self._page_to_form(stamp_page))
+        if transformation is None:
+            ctm = b""
+        else:
+            if isinstance(transformation, Transformation):
+                transformation = transformation.ctm
+            ctm = b" ".join(
+                FloatObject(x).myrepr().encode() for x in transformation
+            ) + b" cm\n"
+        # the contents of the pages are drawn in a saved graphics state, so
+        # that the stamp drawn after them is not affected by their changes
+        save_state = DecodedStreamObject()
+        save_state.set_data(b"q\n")
+        save_state_ref = self._add_object(save_state)
+        draw_streams: Dict[str, IndirectObject] = {}
+
+        for page in self.pages if pages is None else pages:
+            if isinstance(page, int):
+                page = self.pages[page]
+            elif page.indirect_reference is None or page.indirect_reference.pdf is not self:
+                raise ValueError("The page does not belong to this writer")
+            if PG.RESOURCES not in page:
+                page[NameObject(PG.RESOURCES)] = DictionaryObject()
+            resources = cast(DictionaryObject, page[PG.RESOURCES])
+            if "/XObject" not in resources:
+                resources[NameObject("/XObject")] = DictionaryObject()
+            xobjects = cast(DictionaryObject, resources["/XObject"])
+            name = "/Stamp"
+            idx = 0
+            while name in xobjects and xobjects.raw_get(name) != form:
+                name = f"/Stamp-{idx}"
+                idx += 1
+            xobjects[NameObject(name)] = form
+
+            if name not in draw_streams:
+                stream = DecodedStreamObject()
+                stream.set_data(
+                    (b"Q\n" if over else b"")
+                    + b"q\n%s%s Do\nQ\n" % (ctm, name.encode())
+                )
+                draw_streams[name] = self._add_object(stream)
+            draw = draw_streams[name]
+
+            contents = page.get(PG.CONTENTS)
+            if contents is not None:
+                contents = contents.get_object()
+            if isinstance(contents, ArrayObject):
+                parts = list(contents)
+            elif isinstance(contents, StreamObject):
+                parts = [self._add_object(contents)]
+            else:
+                parts = []
+            if over:
+                parts = [save_state_ref, *parts, draw]
+            else:
+                parts.insert(0, draw)
+            page[NameObject(PG.CONTENTS)] = ArrayObject(parts)
+            page.inline_images = None
+        return form
+
+    def _page_to_form(self, page: PageObject) -> StreamObject:
+        """Convert a page to a form XObject of this writer, clipped to its crop box."""
+        form = DecodedStreamObject()
+        contents = page[PG.CONTENTS] if PG.CONTENTS in page else ArrayObject()
+        parts = contents if isinstance(contents, ArrayObject) else [contents]
+        # a stream may end without a whitespace after its last token
+        form.set_data(
+            b"\n".join(
+                part.get_data()
+                for part in (part.get_object() for part in parts)
+                if isinstance(part, StreamObject)
+            )
+        )
+        form[NameObject("/Type")] = NameObject("/XObject")
+        form[NameObject("/Subtype")] = NameObject("/Form")
+        form[NameObject("/BBox")] = RectangleObject(getattr(page, MERGE_CROP_BOX))
+        for key in (PG.RESOURCES, "/Group"):
+            if key in page:
+                form[NameObject(key)] = page.raw_get(key).clone(self)
+        return form.flate_encode()
+
     def add_annotation(
         self,
         page_number: Union[int, PageObject],
@@ -2663,6 +3058,25 @@ class PdfWriter(PdfDocCommon):
             TypeError: The pages attribute is not configured properly
 
         """
+        self._flush_pending_pages()
+        # the pages are completed (annotations, ...) after being added
+        self._flush_holds += 1
+        try:
+            self._merge_pages(
+                position, fileobj, outline_item, pages, import_outline, excluded_fields
+            )
+        finally:
+            self._flush_holds -= 1
+
+    def _merge_pages(
+        self,
+        position: Optional[int],
+        fileobj: Union[Path, StrByteType, PdfReader],
+        outline_item: Optional[str],
+        pages: Optional[Union[PageRangeSpec, List[PageObject]]],
+        import_outline: bool,
+        excluded_fields: Optional[Union[List[str], Tuple[str, ...]]],
+    ) -> None:
         if isinstance(fileobj, PdfDocCommon):
             reader = fileobj
         else:
@@ -2815,6 +3229,12 @@ class PdfWriter(PdfDocCommon):
         if "/B" not in excluded_fields:
             self.add_filtered_articles("", srcpages, reader)
 
+        if self._output is not None and reader is not fileobj:
+            # release the reader opened here once its pages are written
+            for pag in srcpages.values():
+                del pag.original_page
+            self.reset_translation(reader)
+
     def _add_articles_thread(
         self,
         thread: DictionaryObject,  # thread entry from the reader's array of threads
@@ -3073,8 +3493,43 @@ class PdfWriter(PdfDocCommon):
             self._insert_filtered_outline(dest._filtered_children, np, None)
 
     def close(self) -> None:
-        """Implemented for API harmonization."""
-        return
+        """
+        Complete the output started by :meth:`stream_to`.
+
+        The objects which have not been written yet are written, followed by
+        the cross-reference table and the trailer. Otherwise, does nothing.
+        """
+        output = self._output
+        if output is None or output.closed:
+            return
+        self._flush_holds = 0
+        self._flush_pending_pages()
+        self._write_output_header(output)
+        for i, obj in enumerate(self._objects):
+            if obj is not None and i + 1 not in output.positions:
+                self._write_object(output, i + 1, obj)
+        object_positions, free_objects = self._get_object_positions(output)
+        xref_location = self._write_xref_table(
+            cast(StreamType, output), object_positions, free_objects
+        )
+        self._write_trailer(cast(StreamType, output), xref_location)
+        output.flush()
+        stream = output.stream
+        if self._header != self._output_header:
+            # the version has been raised by pages added after the first flush
+            if len(self._header) == len(self._output_header) and stream.seekable():
+                stream.seek(output.origin)
+                stream.write(self._header)
+                stream.seek(0, 2)
+            else:
+                logger_warning(
+                    f"The header could not be updated to {self.pdf_header}", __name__
+                )
+        if self._output_owned:
+            stream.close()
+        else:
+            stream.flush()
+        output.closed = True
 
     def find_outline_item(
         self,
@@ -3292,6 +3747,68 @@ class PdfWriter(PdfDocCommon):
         return data
 
 
+def _create_object_stream(objects: List[Tuple[int, PdfObject]]) -> StreamObject:
+    """Pack objects in a compressed object stream."""
+    data = BytesIO()
+    offsets = []
+    for idnum, obj in objects:
+        offsets.append(b"%d %d" % (idnum, data.tell()))
+        obj.write_to_stream(data)
+        data.write(b"\n")
+    index = b" ".join(offsets) + b"\n"
+    stream = DecodedStreamObject()
+    stream.set_data(index + data.getvalue())
+    stream.update(
+        {
+            NameObject("/Type"): NameObject("/ObjStm"),
+            NameObject("/N"): NumberObject(len(objects)),
+            NameObject("/First"): NumberObject(len(index)),
+        }
+    )
+    return stream.flate_encode()
+
+
+def _create_xref_stream(entries: List[List[int]]) -> StreamObject:
+    """
+    Create a compressed cross-reference stream.
+
+    Args:
+        entries: The (type, field 2, field 3) of each object number.
+
+    Returns:
+        The stream, without the trailer entries.
+
+    """
+    widths = [
+        max(1, (max(entry[field] for entry in entries).bit_length() + 7) // 8)
+        for field in range(3)
+    ]
+    # rows encoded with the PNG Up predictor: the difference with the row
+    # above is mostly zeros, which compresses much better
+    rows = []
+    previous = bytes(sum(widths))
+    for entry in entries:
+        row = b"".join(value.to_bytes(width, "big") for value, width in zip(entry, widths))
+        rows.append(b"\x02" + bytes((a - b) & 0xFF for a, b in zip(row, previous)))
+        previous = row
+    stream = DecodedStreamObject()
+    stream.set_data(b"".join(rows))
+    xref = stream.flate_encode()
+    xref.update(
+        {
+            NameObject("/Type"): NameObject("/XRef"),
+            NameObject("/W"): ArrayObject([NumberObject(width) for width in widths]),
+            NameObject("/DecodeParms"): DictionaryObject(
+                {
+                    NameObject("/Predictor"): NumberObject(12),
+                    NameObject("/Columns"): NumberObject(sum(widths)),
+                }
+            ),
+        }
+    )
+    return xref
+
+
 def _pdf_objectify(obj: Union[Dict[str, Any], str, float, List[Any]]) -> PdfObject:
     if isinstance(obj, PdfObject):
         return obj
@@ -32,6 +32,13 @@ except ImportError:
         "It can be installed via 'pip install pypdf[image]'"
     )
 
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 mode_str_type: TypeAlias = Literal[
     "", "1", "RGB", "2bits", "4bits", "P", "L", "RGBA", "CMYK"
 ]
@@ -123,21 +130,54 @@ def _get_imagemode(
 
 
 def bits2byte(data: bytes, size: Tuple[int, int], bits: int) -> bytes:
+    """
+    Unpack the samples of 1, 2 or 4 bits into a byte per sample.
+
+    Each row starts on a new byte. Missing data are completed with zeros.
+
+    Args:
+        data: The packed samples.
+        size: The width and height of the image.
+        bits: The number of bits per sample.
+
+    Returns:
+        The unpacked samples.
+
+    """
+    width, height = size
+    per_byte = 8 // bits
+    row_length = (width * bits + 7) // 8
+    data = bytes(data[: row_length * height]).ljust(row_length * height, b"\x00")
     mask = (1 << bits) - 1
-    byte_buffer = bytearray(size[0] * size[1])
-    data_index = 0
-    bit = 8 - bits
-    for y in range(size[1]):
-        if bit != 8 - bits:
-            data_index += 1
-            bit = 8 - bits
-        for x in range(size[0]):
-            byte_buffer[x + y * size[0]] = (data[data_index] >> bit) & mask
-            bit -= bits
-            if bit < 0:
-                data_index += 1
-                bit = 8 - bits
-    return bytes(byte_buffer)
+    # each sample position within the bytes is extracted from all the bytes at once
+    if HAS_NUMPY:
+        packed = np.frombuffer(data, dtype=np.uint8).reshape(height, row_length)
+        samples = np.empty((height, row_length * per_byte), dtype=np.uint8)
+        for i in range(per_byte):
+            shift = 8 - bits * (i + 1)
+            np.bitwise_and(packed >> shift, mask, out=samples[:, i::per_byte])
+        return samples[:, :width].tobytes()
+    unpacked = bytearray(len(data) * per_byte)
+    for i in range(per_byte):
+        shift = 8 - bits * (i + 1)
+        unpacked[i::per_byte] = data.translate(
+            bytes((byte >> shift) & mask for byte in range(256))
+        )
+    unpacked_length = row_length * per_byte
+    if unpacked_length == width:
+        return bytes(unpacked)
+    return b"".join(
+        unpacked[start : start + width]
+        for start in range(0, len(unpacked), unpacked_length)
+    )
+
+
+def _repeat_bytes(data: bytes, count: int) -> bytes:
+    """Repeat each byte of data count times."""
+    repeated = bytearray(len(data) * count)
+    for i in range(count):
+        repeated[i::count] = data
+    return bytes(repeated)
 
 
 def _extended_image_frombytes(
@@ -155,7 +195,7 @@ def _extended_image_frombytes(
         if data_length % nb_pix != 0:
             raise exc
         k = nb_pix * len(mode) / data_length
-        data = b"".join(bytes((x,) * int(k)) for x in data)
+        data = _repeat_bytes(data, int(k))
         img = Image.frombytes(mode, size, data)
     return img
 
@@ -225,15 +265,20 @@ def _handle_flate(
                             __name__
                         )
                     lookup = lookup[:expected_count]
-                colors_arr = [lookup[:nb], lookup[nb:]]
-                arr = b"".join(
-                    b"".join(
-                        colors_arr[1 if img.getpixel((x, y)) > 127 else 0]
-                        for x in range(img.size[0])
+                # the pixels are 0 or 255 once converted: each channel is
+                # translated from them
+                pixels = img.convert("L").tobytes()
+                channels = [
+                    Image.frombytes(
+                        "L",
+                        img.size,
+                        pixels.translate(
+                            bytes(lookup[nb + c] if i > 127 else lookup[c] for i in range(256))
+                        ),
                     )
-                    for y in range(img.size[1])
-                )
-                img = Image.frombytes(mode, img.size, arr)
+                    for c in range(nb)
+                ]
+                img = channels[0] if nb == 1 else Image.merge(mode, channels)
             else:
                 img = img.convert(conv)
                 if len(lookup) != (hival + 1) * nb:
@@ -241,7 +286,7 @@ def _handle_flate(
                     lookup = None
                 elif mode == "L":
                     # gray lookup does not work : it is converted to a similar RGB lookup
-                    lookup = b"".join([bytes([b, b, b]) for b in lookup])
+                    lookup = _repeat_bytes(lookup, 3)
                     mode = "RGB"
                 # TODO : cf https://github.com/py-pdf/pypdf/pull/2039
                 # this is a work around until PIL is able to process CMYK images
@@ -63,4 +63,8 @@ class EmptyImageDataError(PyPdfError):
     """Raised when trying to process an image that has no data."""
 
 
+class LimitReachedError(PyPdfError):
+    """Raised when a limit is reached."""
+
+
 STREAM_TRUNCATED_PREMATURELY = "Stream has ended unexpectedly"
@@ -40,9 +40,11 @@ import zlib
 from base64 import a85decode
 from dataclasses import dataclass
 from io import BytesIO
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union, cast
 
 from ._codecs._codecs import LzwCodec as _LzwCodec
+from ._codecs._predictors import decode_png_prediction, decode_tiff_prediction
+from ._image_cache import get_image_cache
 from ._utils import (
     WHITESPACES_AS_BYTES,
     deprecate,
@@ -56,7 +58,7 @@ from .constants import FilterTypes as FT
 from .constants import ImageAttributes as IA
 from .constants import LzwFilterParameters as LZW
 from .constants import StreamAttributes as SA
-from .errors import DeprecationError, PdfReadError, PdfStreamError
+from .errors import DeprecationError, LimitReachedError, PdfReadError, PdfStreamError
 from .generic import (
     ArrayObject,
     DictionaryObject,
@@ -64,14 +66,84 @@ from .generic import (
     NullObject,
 )
 
+#: Maximum size of the data decompressed from a FlateDecode stream, None for no limit.
+ZLIB_MAX_OUTPUT_LENGTH: Optional[int] = None
+
+#: Default size of the chunks of data returned when streaming
+STREAM_CHUNK_SIZE = 65536
+
+#: Start of the JPEG 2000 files, as opposed to bare JPEG 2000 codestreams
+JP2_SIGNATURE = b"\x00\x00\x00\x0cjP  \r\n\x87\n"
+
+
+def _inflate_until_error(d: Any, data: memoryview, skip: int) -> Iterator[bytes]:
+    # byte per byte, to keep the data decompressed before the corrupted byte
+    for i in range(len(data)):
+        try:
+            chunk = d.decompress(data[i : i + 1])
+        except zlib.error:
+            return
+        if skip >= len(chunk):
+            skip -= len(chunk)
+        else:
+            yield chunk[skip:]
+            skip = 0
+
+
+def _inflate(
+    data: Union[bytes, memoryview], chunk_size: int, max_length: Optional[int]
+) -> Iterator[bytes]:
+    """
+    Decompress zlib data by chunks of about chunk_size bytes.
+
+    The data decompressed before a corruption or the end of a truncated
+    stream are returned. Only the block of input containing the corruption
+    is decompressed again, so that the recovery takes linear time.
+
+    Raises:
+        LimitReachedError: If more than max_length bytes are decompressed.
+
+    """
+    d = zlib.decompressobj(zlib.MAX_WBITS | 32)  # zlib or gzip header
+    view = memoryview(data)
+    total = 0
+    for start in range(0, len(view), STREAM_CHUNK_SIZE):
+        block = view[start : start + STREAM_CHUNK_SIZE]
+        # the state before the block is needed to recover its data
+        backup = d.copy()
+        produced = 0
+        tail: Union[bytes, memoryview] = block
+        chunks: Iterable[bytes]
+        while True:
+            try:
+                chunks = (d.decompress(tail, chunk_size),)
+                failed = False
+            except zlib.error:
+                chunks = _inflate_until_error(backup, block, produced)
+                failed = True
+            for chunk in chunks:
+                total += len(chunk)
+                if max_length is not None and total > max_length:
+                    raise LimitReachedError(
+                        f"Limit reached while decompressing: more than {max_length} bytes"
+                    )
+                if chunk:
+                    yield chunk
+                produced += len(chunk)
+            if failed or d.eof:
+                # the data after the end of the compressed data are ignored
+                return
+            tail = d.unconsumed_tail
+            if not tail and len(chunk) < chunk_size:
+                break
+
 
 def decompress(data: bytes) -> bytes:
     """
     Decompress the given data using zlib.
 
-    Attempts to decompress the input data using zlib.
-    If the decompression fails due to a zlib error, it falls back
-    to using a decompression object with a larger window size.
+    If the data are corrupted or truncated, the data decompressed before the
+    error are returned.
 
     Args:
         data: The input data to be decompressed.
@@ -79,23 +151,17 @@ def decompress(data: bytes) -> bytes:
     Returns:
         The decompressed data.
 
+    Raises:
+        LimitReachedError: If the decompressed data are bigger than
+            ``ZLIB_MAX_OUTPUT_LENGTH``.
+
     """
-    try:
-        return zlib.decompress(data)
-    except zlib.error:
+    if ZLIB_MAX_OUTPUT_LENGTH is None:
         try:
-            # For larger files, use decompression object to enable buffered reading
-            return zlib.decompressobj().decompress(data)
+            return zlib.decompress(data)
         except zlib.error:
-            # If still failing, then try with increased window size
-            d = zlib.decompressobj(zlib.MAX_WBITS | 32)
-            result_str = b""
-            for b in [data[i : i + 1] for i in range(len(data))]:
-                try:
-                    result_str += d.decompress(b)
-                except zlib.error:
-                    pass
-            return result_str
+            pass
+    return b"".join(_inflate(data, STREAM_CHUNK_SIZE, ZLIB_MAX_OUTPUT_LENGTH))
 
 
 class FlateDecode:
@@ -124,118 +190,146 @@ class FlateDecode:
             raise DeprecationError("decode_parms as ArrayObject is deprecated")
 
         str_data = decompress(data)
-        predictor = 1
-
-        if decode_parms:
-            try:
-                predictor = decode_parms.get("/Predictor", 1)
-            except (AttributeError, TypeError):  # Type Error is NullObject
-                pass  # Usually an array with a null object was read
-        # predictor 1 == no predictor
-        if predictor != 1:
-            # /Columns, the number of samples in each row, has a default value of 1;
-            # §7.4.4.3, ISO 32000.
-            DEFAULT_BITS_PER_COMPONENT = 8
-            try:
-                columns = cast(int, decode_parms[LZW.COLUMNS].get_object())  # type: ignore
-            except (TypeError, KeyError):
-                columns = 1
-            try:
-                colors = cast(int, decode_parms[LZW.COLORS].get_object())  # type: ignore
-            except (TypeError, KeyError):
-                colors = 1
-            try:
-                bits_per_component = cast(
-                    int,
-                    decode_parms[LZW.BITS_PER_COMPONENT].get_object(),  # type: ignore
-                )
-            except (TypeError, KeyError):
-                bits_per_component = DEFAULT_BITS_PER_COMPONENT
-
+        predictor, columns, colors, bits_per_component = FlateDecode._get_predictor(
+            decode_parms
+        )
+        # TIFF prediction:
+        if predictor == 2:
+            str_data = decode_tiff_prediction(
+                str_data, columns, colors, bits_per_component
+            )
+        # PNG prediction:
+        elif predictor != 1:
             # PNG predictor can vary by row and so is the lead byte on each row
             rowlength = (
                 math.ceil(columns * colors * bits_per_component / 8) + 1
             )  # number of bytes
+            bpp = math.ceil(colors * bits_per_component / 8)
+            str_data = decode_png_prediction(str_data, bpp, rowlength)
+        return str_data
+
+    @staticmethod
+    def iter_decode(
+        data: Union[bytes, memoryview],
+        decode_parms: Optional[DictionaryObject] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        max_length: Optional[int] = None,
+    ) -> Iterator[bytes]:
+        """
+        Decode flate-encoded data by chunks.
+
+        The chunks are about chunk_size bytes; with a predictor, they contain
+        whole rows. The decoded data are never held entirely in memory.
 
-            # TIFF prediction:
+        Args:
+          data: flate-encoded data.
+          decode_parms: a dictionary of values, understanding the
+            "/Predictor":<int> key only
+          chunk_size: the approximate size of the chunks.
+          max_length: the maximum size of the decoded data, by default
+            ``ZLIB_MAX_OUTPUT_LENGTH``.
+
+        Returns:
+          An iterator over the flate-decoded data.
+
+        Raises:
+          PdfReadError:
+          LimitReachedError: If the decoded data exceed max_length.
+
+        """
+        if isinstance(decode_parms, ArrayObject):
+            raise DeprecationError("decode_parms as ArrayObject is deprecated")
+
+        predictor, columns, colors, bits_per_component = FlateDecode._get_predictor(
+            decode_parms
+        )
+        if max_length is None:
+            max_length = ZLIB_MAX_OUTPUT_LENGTH
+        chunks = _inflate(data, chunk_size, max_length)
+        rowlength = math.ceil(columns * colors * bits_per_component / 8)
+        if predictor == 1 or rowlength == 0:
+            yield from chunks
+            return
+        if predictor != 2:
+            rowlength += 1  # PNG filter type byte
+        bpp = math.ceil(colors * bits_per_component / 8)
+        prev_row = b""
+        pending = bytearray()
+        for chunk in chunks:
+            pending += chunk
+            size = len(pending) - len(pending) % rowlength
+            if size == 0:
+                continue
+            rows = pending[:size]
+            del pending[:size]
             if predictor == 2:
-                rowlength -= 1  # remove the predictor byte
-                bpp = rowlength // columns
-                str_data = bytearray(str_data)
-                for i in range(len(str_data)):
-                    if i % rowlength >= bpp:
-                        str_data[i] = (str_data[i] + str_data[i - bpp]) % 256
-                str_data = bytes(str_data)
-            # PNG prediction:
-            elif 10 <= predictor <= 15:
-                str_data = FlateDecode._decode_png_prediction(
-                    str_data, columns, rowlength
-                )
+                yield decode_tiff_prediction(rows, columns, colors, bits_per_component)
+                continue
+            width = rowlength - 1
+            if prev_row:
+                # a row without filter gives the previous row to the next one
+                rows[0:0] = b"\x00" + prev_row
+                decoded = decode_png_prediction(rows, bpp, rowlength)[width:]
             else:
-                raise PdfReadError(f"Unsupported flatedecode predictor {predictor!r}")
-        return str_data
+                decoded = decode_png_prediction(rows, bpp, rowlength)
+            prev_row = decoded[-width:]
+            yield decoded
+        if pending:
+            if predictor != 2:
+                raise PdfReadError("Image data is not rectangular")
+            yield decode_tiff_prediction(pending, columns, colors, bits_per_component)
+
+    @staticmethod
+    def _get_predictor(
+        decode_parms: Optional[DictionaryObject],
+    ) -> Tuple[int, int, int, int]:
+        """
+        Read the predictor parameters.
+
+        Returns:
+          The predictor, the number of columns, of colors and of bits per
+          component.
+
+        Raises:
+          PdfReadError: If the predictor is not supported.
+
+        """
+        predictor = 1
+        if decode_parms:
+            try:
+                predictor = decode_parms.get("/Predictor", 1)
+            except (AttributeError, TypeError):  # Type Error is NullObject
+                pass  # Usually an array with a null object was read
+        # predictor 1 == no predictor
+        if predictor == 1:
+            return 1, 1, 1, 8
+        if predictor != 2 and not 10 <= predictor <= 15:
+            raise PdfReadError(f"Unsupported flatedecode predictor {predictor!r}")
+        # /Columns, the number of samples in each row, has a default value of 1;
+        # §7.4.4.3, ISO 32000.
+        DEFAULT_BITS_PER_COMPONENT = 8
+        try:
+            columns = cast(int, decode_parms[LZW.COLUMNS].get_object())  # type: ignore
+        except (TypeError, KeyError):
+            columns = 1
+        try:
+            colors = cast(int, decode_parms[LZW.COLORS].get_object())  # type: ignore
+        except (TypeError, KeyError):
+            colors = 1
+        try:
+            bits_per_component = cast(
+                int,
+                decode_parms[LZW.BITS_PER_COMPONENT].get_object(),  # type: ignore
+            )
+        except (TypeError, KeyError):
+            bits_per_component = DEFAULT_BITS_PER_COMPONENT
+        return predictor, columns, colors, bits_per_component
 
     @staticmethod
     def _decode_png_prediction(data: bytes, columns: int, rowlength: int) -> bytes:
         # PNG prediction can vary from row to row
-        if len(data) % rowlength != 0:
-            raise PdfReadError("Image data is not rectangular")
-        output = []
-        prev_rowdata = (0,) * rowlength
-        bpp = (rowlength - 1) // columns  # recomputed locally to not change params
-        for row in range(0, len(data), rowlength):
-            rowdata: List[int] = list(data[row : row + rowlength])
-            filter_byte = rowdata[0]
-
-            if filter_byte == 0:
-                # PNG None Predictor
-                pass
-            elif filter_byte == 1:
-                # PNG Sub Predictor
-                for i in range(bpp + 1, rowlength):
-                    rowdata[i] = (rowdata[i] + rowdata[i - bpp]) % 256
-            elif filter_byte == 2:
-                # PNG Up Predictor
-                for i in range(1, rowlength):
-                    rowdata[i] = (rowdata[i] + prev_rowdata[i]) % 256
-            elif filter_byte == 3:
-                # PNG Average Predictor
-                for i in range(1, bpp + 1):
-                    floor = prev_rowdata[i] // 2
-                    rowdata[i] = (rowdata[i] + floor) % 256
-                for i in range(bpp + 1, rowlength):
-                    left = rowdata[i - bpp]
-                    floor = (left + prev_rowdata[i]) // 2
-                    rowdata[i] = (rowdata[i] + floor) % 256
-            elif filter_byte == 4:
-                # PNG Paeth Predictor
-                for i in range(1, bpp + 1):
-                    rowdata[i] = (rowdata[i] + prev_rowdata[i]) % 256
-                for i in range(bpp + 1, rowlength):
-                    left = rowdata[i - bpp]
-                    up = prev_rowdata[i]
-                    up_left = prev_rowdata[i - bpp]
-
-                    p = left + up - up_left
-                    dist_left = abs(p - left)
-                    dist_up = abs(p - up)
-                    dist_up_left = abs(p - up_left)
-
-                    if dist_left <= dist_up and dist_left <= dist_up_left:
-                        paeth = left
-                    elif dist_up <= dist_up_left:
-                        paeth = up
-                    else:
-                        paeth = up_left
-
-                    rowdata[i] = (rowdata[i] + paeth) % 256
-            else:
-                raise PdfReadError(
-                    f"Unsupported PNG filter {filter_byte!r}"
-                )  # pragma: no cover
-            prev_rowdata = tuple(rowdata)
-            output.extend(rowdata[1:])
-        return bytes(output)
+        bpp = max(1, (rowlength - 1) // columns)
+        return decode_png_prediction(data, bpp, rowlength)
 
     @staticmethod
     def encode(data: bytes, level: int = -1) -> bytes:
@@ -614,6 +708,19 @@ class CCITTFaxDecode:
         return tiff_header + data
 
 
+def _get_filters(stream: Any) -> Tuple[Any, Any]:
+    filters = stream.get(SA.FILTER, ())
+    if isinstance(filters, IndirectObject):
+        filters = cast(ArrayObject, filters.get_object())
+    if not isinstance(filters, ArrayObject):
+        # We have a single filter instance
+        filters = (filters,)
+    decode_parms = stream.get(SA.DECODE_PARMS, ({},) * len(filters))
+    if not isinstance(decode_parms, (list, tuple)):
+        decode_parms = (decode_parms,)
+    return filters, decode_parms
+
+
 def decode_stream_data(stream: Any) -> bytes:
     """
     Decode the stream data based on the specified filters.
@@ -631,22 +738,17 @@ def decode_stream_data(stream: Any) -> bytes:
         NotImplementedError: If an unsupported filter type is encountered.
 
     """
-    filters = stream.get(SA.FILTER, ())
-    if isinstance(filters, IndirectObject):
-        filters = cast(ArrayObject, filters.get_object())
-    if not isinstance(filters, ArrayObject):
-        # We have a single filter instance
-        filters = (filters,)
-    decode_parms = stream.get(SA.DECODE_PARMS, ({},) * len(filters))
-    if not isinstance(decode_parms, (list, tuple)):
-        decode_parms = (decode_parms,)
+    filters, decode_parms = _get_filters(stream)
     data: bytes = stream._data
     # If there is not data to decode we should not try to decode the data.
     if not data:
-        return data
+        return bytes(data)
     for filter_name, params in zip(filters, decode_parms):
         if isinstance(params, NullObject):
             params = {}
+        if isinstance(data, memoryview) and filter_name not in (FT.FLATE_DECODE, FTA.FL):
+            # data from a memory mapped file; zlib is the only consumer accepting views
+            data = data.tobytes()
         if filter_name in (FT.ASCII_HEX_DECODE, FTA.AHx):
             data = ASCIIHexDecode.decode(data)
         elif filter_name in (FT.ASCII_85_DECODE, FTA.A85):
@@ -671,9 +773,63 @@ def decode_stream_data(stream: Any) -> bytes:
                 )
         else:
             raise NotImplementedError(f"Unsupported filter {filter_name}")
+    if isinstance(data, memoryview):
+        data = data.tobytes()
     return data
 
 
+def iter_decode_stream_data(
+    stream: Any, chunk_size: int = STREAM_CHUNK_SIZE, max_length: Optional[int] = None
+) -> Iterator[bytes]:
+    """
+    Decode the stream data by chunks.
+
+    Streams only compressed with FlateDecode are decoded incrementally; the
+    other streams are decoded at once, then split.
+
+    Args:
+        stream: The input stream object containing the data and filters.
+        chunk_size: The approximate size of the chunks.
+        max_length: The maximum size of the decoded data, by default
+            ``ZLIB_MAX_OUTPUT_LENGTH``.
+
+    Returns:
+        An iterator over the decoded stream data.
+
+    Raises:
+        LimitReachedError: If the decoded data exceed max_length.
+
+    """
+    if max_length is None:
+        max_length = ZLIB_MAX_OUTPUT_LENGTH
+    filters, decode_parms = _get_filters(stream)
+    if len(filters) == 1 and filters[0] in (FT.FLATE_DECODE, FTA.FL) and stream._data:
+        params = decode_parms[0]
+        if isinstance(params, NullObject):
+            params = {}
+        yield from FlateDecode.iter_decode(stream._data, params, chunk_size, max_length)
+        return
+    yield from _iter_chunks(decode_stream_data(stream), chunk_size, max_length)
+
+
+def _iter_chunks(
+    data: bytes, chunk_size: int, max_length: Optional[int]
+) -> Iterator[bytes]:
+    """
+    Split data which are already decoded, see iter_decode_stream_data.
+
+    Raises:
+        LimitReachedError: If the data exceed max_length.
+
+    """
+    if max_length is not None and len(data) > max_length:
+        raise LimitReachedError(
+            f"Limit reached while decoding: more than {max_length} bytes"
+        )
+    for start in range(0, len(data), chunk_size):
+        yield data[start : start + chunk_size]
+
+
 def _xobj_to_image(x_object_obj: Dict[str, Any]) -> Tuple[Optional[str], bytes, Any]:
     """
     Users need to have the pillow package installed.
@@ -688,6 +844,89 @@ def _xobj_to_image(x_object_obj: Dict[str, Any]) -> Tuple[Optional[str], bytes,
         Tuple[file extension, bytes, PIL.Image.Image]
 
     """
+    extension, image_format, img, data = _xobj_to_pil_image(x_object_obj)
+    if data is None:
+        extension, data = _encode_image(img, image_format, extension)
+    return extension, data, img
+
+
+def _encode_image(img: Any, image_format: str, extension: str) -> Tuple[str, bytes]:
+    """
+    Save a PIL image in memory.
+
+    Args:
+        img: The PIL image.
+        image_format: The format to save the image in.
+        extension: The file extension of the format.
+
+    Returns:
+        The file extension, which is ".png" if the image could not be saved in
+        the requested format, and the encoded image.
+
+    """
+    img_byte_arr = BytesIO()
+    try:
+        img.save(img_byte_arr, format=image_format)
+    except OSError:  # pragma: no cover  # covered with pillow 10.3
+        # in case of we convert to RGBA and then to PNG
+        img1 = img.convert("RGBA")
+        extension = ".png"
+        img_byte_arr = BytesIO()
+        img1.save(img_byte_arr, format="PNG")
+    return extension, img_byte_arr.getvalue()
+
+
+def _xobj_to_pil_image(
+    x_object_obj: Dict[str, Any]
+) -> Tuple[str, str, Any, Optional[bytes]]:
+    """
+    Decode an image XObject as a PIL image, without encoding it.
+
+    The images of a PdfReader are decoded once, see
+    :class:`~pypdf._image_cache.DecodedImageCache`: each call returns a copy
+    of the cached image, which can be modified. JPEG and JPEG 2000 images
+    which are not modified by the decoding are opened again from the stream
+    data instead, so that they are only decoded when their pixels are used.
+
+    Args:
+        x_object_obj: The image XObject.
+
+    Returns:
+        The file extension, the format the image is to be saved in, the PIL
+        image and, for JPEG and JPEG 2000 images which are not modified by the
+        decoding, the stream data, which can be used as the encoded image.
+
+    """
+    cache, key = get_image_cache(x_object_obj)
+    if cache is None or cache.max_bytes <= 0:
+        return _decode_xobj_image(x_object_obj)
+    image = cache.get(key)
+    if image is None:
+        image = _decode_xobj_image(x_object_obj)
+        extension, image_format, img, data = image
+        if data is not None:
+            # the image opened from the data is not decoded yet: only the
+            # data are kept
+            cache.put(key, (extension, image_format, None, data))
+            return image
+        cache.put(key, image)
+    extension, image_format, img, data = image
+    if data is not None:
+        from ._xobj_image_helpers import Image
+
+        # opened again, it is only decoded if the pixels are needed
+        img = Image.open(BytesIO(data))
+    elif img is not None:
+        img_format = img.format
+        img = img.copy()
+        img.format = img_format
+    return extension, image_format, img, data
+
+
+def _decode_xobj_image(
+    x_object_obj: Dict[str, Any]
+) -> Tuple[str, str, Any, Optional[bytes]]:
+    """See :func:`_xobj_to_pil_image`."""
     from ._xobj_image_helpers import (
         Image,
         UnidentifiedImageError,
@@ -707,7 +946,7 @@ def _xobj_to_image(x_object_obj: Dict[str, Any]) -> Tuple[Optional[str], bytes,
     ) -> Tuple[Image.Image, str, str]:
         alpha = None
         if IA.S_MASK in x_object_obj:  # add alpha channel
-            alpha = _xobj_to_image(x_object_obj[IA.S_MASK])[2]
+            alpha = _xobj_to_pil_image(x_object_obj[IA.S_MASK])[2]
             if img.size != alpha.size:
                 logger_warning(
                     f"image and mask size not matching: {obj_as_text}", __name__
@@ -757,6 +996,7 @@ def _xobj_to_image(x_object_obj: Dict[str, Any]) -> Tuple[Optional[str], bytes,
     lfilters = filters[-1] if isinstance(filters, list) else filters
 
     extension = None
+    opened: Any = None  # the image opened from the stream data
     if lfilters in (FT.FLATE_DECODE, FT.RUN_LENGTH_DECODE):
         img, image_format, extension, _ = _handle_flate(
             size,
@@ -782,11 +1022,14 @@ def _xobj_to_image(x_object_obj: Dict[str, Any]) -> Tuple[Optional[str], bytes,
             img = _extended_image_frombytes(mode, size, data)
     elif lfilters == FT.DCT_DECODE:
         img, image_format, extension = Image.open(BytesIO(data)), "JPEG", ".jpg"
+        opened = img
         # invert_color kept unchanged
     elif lfilters == FT.JPX_DECODE:
         img, image_format, extension, invert_color = _handle_jpx(
             size, data, mode, color_space, colors
         )
+        if data.startswith(JP2_SIGNATURE):  # not a bare codestream
+            opened = img
     elif lfilters == FT.CCITT_FAX_DECODE:
         img, image_format, extension, invert_color = (
             Image.open(BytesIO(data), formats=("TIFF",)),
@@ -816,21 +1059,10 @@ def _xobj_to_image(x_object_obj: Dict[str, Any]) -> Tuple[Optional[str], bytes,
         img, x_object_obj, obj_as_text, image_format, extension
     )
 
-    # Save image to bytes
-    img_byte_arr = BytesIO()
-    try:
-        img.save(img_byte_arr, format=image_format)
-    except OSError:  # pragma: no cover  # covered with pillow 10.3
-        # in case of we convert to RGBA and then to PNG
-        img1 = img.convert("RGBA")
-        image_format = "PNG"
-        extension = ".png"
-        img_byte_arr = BytesIO()
-        img1.save(img_byte_arr, format=image_format)
-    data = img_byte_arr.getvalue()
-
-    try:  # temporary try/except until other fixes of images
-        img = Image.open(BytesIO(data))
-    except Exception:
-        img = None  # type: ignore
-    return extension, data, img
+    assert extension is not None
+    if img is opened and img.format == image_format and IA.S_MASK not in x_object_obj:
+        # not modified: the stream data are the encoded image
+        return extension, image_format, img, data
+    # the format the image is extracted in, as if read from the encoded image
+    img.format = image_format
+    return extension, image_format, img, None
@@ -45,10 +45,9 @@ from .._utils import (
     StreamType,
     deprecate_no_replacement,
     logger_warning,
-    read_non_whitespace,
-    read_until_regex,
 )
 from ..errors import STREAM_TRUNCATED_PREMATURELY, PdfReadError, PdfStreamError
+from ._lexer import NAME_PATTERN, NON_SPACE_PATTERN, NUMBER_PATTERN, SPACES, PdfLexer
 
 __author__ = "Mathieu Fenniak"
 __author_email__ = "biziqe@mathieu.fenniak.net"
@@ -58,6 +57,15 @@ class PdfObject(PdfObjectProtocol):
     # function for calculating a hash value
     hash_func: Callable[..., "hashlib._Hash"] = hashlib.sha1
     indirect_reference: Optional["IndirectObject"]
+    # the indirect object containing this object, when its changes are tracked
+    # (incremental PdfWriter), see track_changes
+    _owner: Optional["PdfObject"] = None
+    # set on the indirect object when it or one of its direct objects changes
+    _modified = False
+
+    def _mark_modified(self) -> None:
+        if self._owner is not None:
+            self._owner._modified = True
 
     def hash_bin(self) -> int:
         """
@@ -183,6 +191,7 @@ class PdfObject(PdfObjectProtocol):
         except IndexError:
             pdf_dest._objects.append(clone)
             i = len(pdf_dest._objects)
+        pdf_dest._object_index[id(clone)] = i
         clone.indirect_reference = IndirectObject(i, 0, pdf_dest)
         return clone
 
@@ -337,8 +346,18 @@ class IndirectObject(PdfObject):
         if id(self.pdf) not in pdf_dest._id_translated:
             pdf_dest._id_translated[id(self.pdf)] = {}
 
-        if self.idnum in pdf_dest._id_translated[id(self.pdf)]:
-            dup = pdf_dest.get_object(pdf_dest._id_translated[id(self.pdf)][self.idnum])
+        translations = pdf_dest._id_translated[id(self.pdf)]
+        idnum = translations.get(self.idnum)
+        if idnum is not None and pdf_dest._objects[idnum - 1] is None:
+            output = getattr(pdf_dest, "_output", None)
+            if output is not None and idnum in output.positions:
+                # already written to the output by a streaming writer
+                return IndirectObject(idnum, 0, pdf_dest)
+            # the copy has been removed from the writer: clone the object again
+            del translations[self.idnum]
+            idnum = None
+        if idnum is not None:
+            dup = pdf_dest.get_object(idnum)
             if force_duplicate:
                 assert dup is not None
                 assert dup.indirect_reference is not None
@@ -430,28 +449,27 @@ class IndirectObject(PdfObject):
 
     @staticmethod
     def read_from_stream(stream: StreamType, pdf: Any) -> "IndirectObject":  # PdfReader
-        idnum = b""
-        while True:
-            tok = stream.read(1)
-            if not tok:
-                raise PdfStreamError(STREAM_TRUNCATED_PREMATURELY)
-            if tok.isspace():
-                break
-            idnum += tok
-        generation = b""
-        while True:
-            tok = stream.read(1)
-            if not tok:
-                raise PdfStreamError(STREAM_TRUNCATED_PREMATURELY)
-            if tok.isspace():
-                if not generation:
-                    continue
-                break
-            generation += tok
-        r = read_non_whitespace(stream)
-        if r != b"R":
+        lexer = PdfLexer.from_stream(stream)
+        try:
+            return IndirectObject._read_from_lexer(lexer, pdf)
+        finally:
+            lexer.detach(stream)
+
+    @staticmethod
+    def _read_from_lexer(lexer: PdfLexer, pdf: Any) -> "IndirectObject":
+        idnum = lexer.match(NON_SPACE_PATTERN)
+        if lexer.peek() == -1:
+            raise PdfStreamError(STREAM_TRUNCATED_PREMATURELY)
+        lexer.pos += 1
+        lexer.skip_whitespace(SPACES)
+        generation = lexer.match(NON_SPACE_PATTERN)
+        if lexer.peek() == -1:
+            raise PdfStreamError(STREAM_TRUNCATED_PREMATURELY)
+        lexer.pos += 1
+        lexer.skip_whitespace()
+        if lexer.read(1) != b"R":
             raise PdfReadError(
-                f"Error reading indirect object reference at byte {hex(stream.tell())}"
+                f"Error reading indirect object reference at byte {hex(lexer.tell())}"
             )
         return IndirectObject(int(idnum), int(generation), pdf)
 
@@ -499,9 +517,10 @@ class FloatObject(float, PdfObject):
     def myrepr(self) -> str:
         if self == 0:
             return "0.0"
+        if self.is_integer():
+            return "%d" % self
         nb = FLOAT_WRITE_PRECISION - int(log10(abs(self)))
-        s = f"{self:.{max(1,nb)}f}".rstrip("0").rstrip(".")
-        return s
+        return ("%.*f" % (max(1, nb), self)).rstrip("0").rstrip(".")
 
     def __repr__(self) -> str:
         return self.myrepr()  # repr(float(self))
@@ -565,8 +584,16 @@ class NumberObject(int, PdfObject):
 
     @staticmethod
     def read_from_stream(stream: StreamType) -> Union["NumberObject", "FloatObject"]:
-        num = read_until_regex(stream, NumberObject.NumberPattern)
-        if num.find(b".") != -1:
+        lexer = PdfLexer.from_stream(stream)
+        try:
+            return NumberObject._read_from_lexer(lexer)
+        finally:
+            lexer.detach(stream)
+
+    @staticmethod
+    def _read_from_lexer(lexer: PdfLexer) -> Union["NumberObject", "FloatObject"]:
+        num = lexer.match(NUMBER_PATTERN)
+        if b"." in num:
             return FloatObject(num)
         return NumberObject(num)
 
@@ -852,14 +879,22 @@ class NameObject(str, PdfObject):  # noqa: SLOT000
 
     @staticmethod
     def read_from_stream(stream: StreamType, pdf: Any) -> "NameObject":  # PdfReader
-        name = stream.read(1)
-        if name != NameObject.surfix:
+        lexer = PdfLexer.from_stream(stream)
+        try:
+            return NameObject._read_from_lexer(lexer, pdf)
+        finally:
+            lexer.detach(stream)
+
+    @staticmethod
+    def _read_from_lexer(lexer: PdfLexer, pdf: Any) -> "NameObject":  # PdfReader
+        name = lexer.match(NAME_PATTERN)
+        if name[:1] != NameObject.surfix:
             raise PdfReadError("Name read error")
-        name += read_until_regex(stream, NameObject.delimiter_pattern)
         try:
             # Name objects should represent irregular characters
             # with a '#' followed by the symbol's hex number
-            name = NameObject.unnumber(name)
+            if b"#" in name:
+                name = NameObject.unnumber(name)
             for enc in NameObject.CHARSETS:
                 try:
                     ret = name.decode(enc)
@@ -882,17 +917,20 @@ class NameObject(str, PdfObject):  # noqa: SLOT000
                 ) from e
 
 
+_pdfdoc_encoding_map = {ord(char): code for char, code in _pdfdoc_encoding_rev.items()}
+
+
 def encode_pdfdocencoding(unicode_string: str) -> bytes:
     try:
-        return bytes([_pdfdoc_encoding_rev[k] for k in unicode_string])
-    except KeyError:
+        return codecs.charmap_encode(unicode_string, "strict", _pdfdoc_encoding_map)[0]
+    except UnicodeEncodeError:
         raise UnicodeEncodeError(
             "pdfdocencoding",
             unicode_string,
             -1,
             -1,
             "does not exist in translation table",
-        )
+        ) from None
 
 
 def is_null_or_none(x: Any) -> TypeGuard[Union[None, NullObject, IndirectObject]]:
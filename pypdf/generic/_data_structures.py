@@ -29,9 +29,11 @@
 __author__ = "Mathieu Fenniak"
 __author_email__ = "biziqe@mathieu.fenniak.net"
 
+import binascii
 import logging
 import re
 import sys
+from array import array
 from io import BytesIO
 from math import ceil
 from typing import (
@@ -39,10 +41,12 @@ from typing import (
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Sequence,
     Set,
+    SupportsIndex,
     Tuple,
     Union,
     cast,
@@ -56,9 +60,6 @@ from .._utils import (
     deprecation_with_replacement,
     logger_warning,
     read_non_whitespace,
-    read_until_regex,
-    read_until_whitespace,
-    skip_over_comment,
 )
 from ..constants import (
     CheckboxRadioButtonAttributes,
@@ -70,6 +71,7 @@ from ..constants import StreamAttributes as SA
 from ..constants import TypArguments as TA
 from ..constants import TypFitArguments as TF
 from ..errors import STREAM_TRUNCATED_PREMATURELY, PdfReadError, PdfStreamError
+from . import _base
 from ._base import (
     BooleanObject,
     ByteStringObject,
@@ -90,7 +92,8 @@ from ._image_inline import (
     extract_inline_default,
     extract_inline_RL,
 )
-from ._utils import read_hex_string_from_stream, read_string_from_stream
+from ._lexer import NAME_PATTERN, NON_SPACE_PATTERN, SPACES, PdfLexer
+from ._utils import _read_hex_string, _read_string
 
 if sys.version_info >= (3, 11):
     from typing import Self
@@ -99,7 +102,9 @@ else:
 
 logger = logging.getLogger(__name__)
 NumberSigns = b"+-"
-IndirectPattern = re.compile(rb"[+-]?(\d+)\s+(\d+)\s+R[^a-zA-Z]")
+IndirectPattern = re.compile(rb"([+-]?\d+)\s+(\d+)\s+R(?=[^a-zA-Z])")
+NUMBER_CHARS = frozenset(b"0123456789+-.")
+ENDSTREAM_PATTERN = re.compile(rb"endstream")
 
 
 class ArrayObject(List[Any], PdfObject):
@@ -162,6 +167,48 @@ class ArrayObject(List[Any], PdfObject):
         """Emulate DictionaryObject.items for a list (index, object)."""
         return enumerate(self)
 
+    # the changes are tracked for incremental writing, see track_changes
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        self._mark_modified()
+        list.__setitem__(self, index, value)
+
+    def __delitem__(self, index: Any) -> None:
+        self._mark_modified()
+        list.__delitem__(self, index)
+
+    def append(self, value: Any) -> None:
+        self._mark_modified()
+        list.append(self, value)
+
+    def extend(self, values: Iterable[Any]) -> None:
+        self._mark_modified()
+        list.extend(self, values)
+
+    def insert(self, index: SupportsIndex, value: Any) -> None:
+        self._mark_modified()
+        list.insert(self, index, value)
+
+    def pop(self, index: SupportsIndex = -1) -> Any:
+        self._mark_modified()
+        return list.pop(self, index)
+
+    def remove(self, value: Any) -> None:
+        self._mark_modified()
+        list.remove(self, value)
+
+    def clear(self) -> None:
+        self._mark_modified()
+        list.clear(self)
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        self._mark_modified()
+        list.sort(self, *args, **kwargs)
+
+    def reverse(self) -> None:
+        self._mark_modified()
+        list.reverse(self)
+
     def _to_lst(self, lst: Any) -> List[Any]:
         # Convert to list, internal
         if isinstance(lst, (list, tuple, set)):
@@ -241,30 +288,38 @@ class ArrayObject(List[Any], PdfObject):
         stream: StreamType,
         pdf: Optional[PdfReaderProtocol],
         forced_encoding: Union[None, str, List[str], Dict[int, str]] = None,
+    ) -> "ArrayObject":
+        lexer = PdfLexer.from_stream(stream)
+        try:
+            return ArrayObject._read_from_lexer(lexer, pdf, forced_encoding)
+        finally:
+            lexer.detach(stream)
+
+    @staticmethod
+    def _read_from_lexer(
+        lexer: PdfLexer,
+        pdf: Optional[PdfReaderProtocol],
+        forced_encoding: Union[None, str, List[str], Dict[int, str]] = None,
     ) -> "ArrayObject":
         arr = ArrayObject()
-        tmp = stream.read(1)
-        if tmp != b"[":
+        if lexer.read(1) != b"[":
             raise PdfReadError("Could not read array")
         while True:
             # skip leading whitespace
-            tok = stream.read(1)
-            while tok.isspace():
-                tok = stream.read(1)
-            if tok == b"":
+            lexer.skip_whitespace(SPACES)
+            tok = lexer.peek()
+            if tok == -1:
                 break
-            if tok == b"%":
-                stream.seek(-1, 1)
-                skip_over_comment(stream)
+            if tok == 0x25:  # %
+                if not lexer.skip_comment():
+                    raise PdfStreamError("File ended unexpectedly.")
                 continue
-            stream.seek(-1, 1)
             # check for array ending
-            peek_ahead = stream.read(1)
-            if peek_ahead == b"]":
+            if tok == 0x5D:  # ]
+                lexer.pos += 1
                 break
-            stream.seek(-1, 1)
             # read and append obj
-            arr.append(read_object(stream, pdf, forced_encoding))
+            arr.append(_read_object(lexer, pdf, forced_encoding))
         return arr
 
 
@@ -466,6 +521,7 @@ class DictionaryObject(Dict[Any, Any], PdfObject):
             raise ValueError("Key must be a PdfObject")
         if not isinstance(value, PdfObject):
             raise ValueError("Value must be a PdfObject")
+        self._mark_modified()
         return dict.__setitem__(self, key, value)
 
     def setdefault(self, key: Any, value: Optional[Any] = None) -> Any:
@@ -473,8 +529,32 @@ class DictionaryObject(Dict[Any, Any], PdfObject):
             raise ValueError("Key must be a PdfObject")
         if not isinstance(value, PdfObject):
             raise ValueError("Value must be a PdfObject")
+        if key not in self:
+            self._mark_modified()
         return dict.setdefault(self, key, value)  # type: ignore
 
+    # the changes are tracked for incremental writing, see track_changes
+
+    def __delitem__(self, key: Any) -> None:
+        self._mark_modified()
+        dict.__delitem__(self, key)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self._mark_modified()
+        dict.update(self, *args, **kwargs)
+
+    def pop(self, *args: Any) -> Any:
+        self._mark_modified()
+        return dict.pop(self, *args)
+
+    def popitem(self) -> Tuple[Any, Any]:
+        self._mark_modified()
+        return dict.popitem(self)
+
+    def clear(self) -> None:
+        self._mark_modified()
+        dict.clear(self)
+
     def __getitem__(self, key: Any) -> PdfObject:
         return dict.__getitem__(self, key).get_object()
 
@@ -526,6 +606,18 @@ class DictionaryObject(Dict[Any, Any], PdfObject):
         stream: StreamType,
         pdf: Optional[PdfReaderProtocol],
         forced_encoding: Union[None, str, List[str], Dict[int, str]] = None,
+    ) -> "DictionaryObject":
+        lexer = PdfLexer.from_stream(stream)
+        try:
+            return DictionaryObject._read_from_lexer(lexer, pdf, forced_encoding)
+        finally:
+            lexer.detach(stream)
+
+    @staticmethod
+    def _read_from_lexer(
+        lexer: PdfLexer,
+        pdf: Optional[PdfReaderProtocol],
+        forced_encoding: Union[None, str, List[str], Dict[int, str]] = None,
     ) -> "DictionaryObject":
         def get_next_obj_pos(
             p: int, p1: int, rem_gens: List[int], pdf: PdfReaderProtocol
@@ -541,49 +633,48 @@ class DictionaryObject(Dict[Any, Any], PdfObject):
                     pass
             return out
 
-        def read_unsized_from_stream(
-            stream: StreamType, pdf: PdfReaderProtocol
+        def read_unsized_from_lexer(
+            lexer: PdfLexer, pdf: PdfReaderProtocol
         ) -> bytes:
             # we are just pointing at beginning of the stream
-            eon = get_next_obj_pos(stream.tell(), 2**32, list(pdf.xref), pdf) - 1
-            curr = stream.tell()
-            rw = stream.read(eon - stream.tell())
+            curr = lexer.tell()
+            eon = get_next_obj_pos(curr, 2**32, list(pdf.xref), pdf) - 1
+            start = lexer.pos
+            rw = lexer.read(eon - curr)
             p = rw.find(b"endstream")
             if p < 0:
                 raise PdfReadError(
                     f"Unable to find 'endstream' marker for obj starting at {curr}."
                 )
-            stream.seek(curr + p + 9)
+            lexer.pos = start + p + 9
             return rw[: p - 1]
 
-        tmp = stream.read(2)
+        tmp = lexer.read(2)
         if tmp != b"<<":
             raise PdfReadError(
-                f"Dictionary read error at byte {hex(stream.tell())}: "
+                f"Dictionary read error at byte {hex(lexer.tell())}: "
                 "stream must begin with '<<'"
             )
         data: Dict[Any, Any] = {}
         while True:
-            tok = read_non_whitespace(stream)
-            if tok == b"\x00":
-                continue
-            elif tok == b"%":
-                stream.seek(-1, 1)
-                skip_over_comment(stream)
+            lexer.skip_whitespace()
+            tok = lexer.peek()
+            if tok == 0x25:  # %
+                if not lexer.skip_comment():
+                    raise PdfStreamError("File ended unexpectedly.")
                 continue
-            if not tok:
+            if tok == -1:
                 raise PdfStreamError(STREAM_TRUNCATED_PREMATURELY)
 
-            if tok == b">":
-                stream.read(1)
+            if tok == 0x3E:  # >
+                lexer.read(2)
                 break
-            stream.seek(-1, 1)
             try:
                 try:
-                    key = read_object(stream, pdf)
-                    if isinstance(key, NullObject):
-                        break
+                    key = _read_object(lexer, pdf)
                     if not isinstance(key, NameObject):
+                        if isinstance(key, NullObject):
+                            break
                         raise PdfReadError(
                             f"Expecting a NameObject for key but found {key!r}"
                         )
@@ -592,9 +683,8 @@ class DictionaryObject(Dict[Any, Any], PdfObject):
                         raise
                     logger_warning(exc.__repr__(), __name__)
                     continue
-                tok = read_non_whitespace(stream)
-                stream.seek(-1, 1)
-                value = read_object(stream, pdf, forced_encoding)
+                lexer.skip_whitespace()
+                value = _read_object(lexer, pdf, forced_encoding)
             except Exception as exc:
                 if pdf is not None and pdf.strict:
                     raise PdfReadError(exc.__repr__())
@@ -609,50 +699,48 @@ class DictionaryObject(Dict[Any, Any], PdfObject):
                 # multiple definitions of key not permitted
                 msg = (
                     f"Multiple definitions in dictionary at byte "
-                    f"{hex(stream.tell())} for key {key}"
+                    f"{hex(lexer.tell())} for key {key}"
                 )
                 if pdf is not None and pdf.strict:
                     raise PdfReadError(msg)
                 logger_warning(msg, __name__)
 
-        pos = stream.tell()
-        s = read_non_whitespace(stream)
-        if s == b"s" and stream.read(5) == b"tream":
-            eol = stream.read(1)
+        pos = lexer.pos
+        lexer.skip_whitespace()
+        if lexer.read(6) == b"stream":
+            eol = lexer.read(1)
             # odd PDF file output has spaces after 'stream' keyword but before EOL.
             # patch provided by Danial Sandler
             while eol == b" ":
-                eol = stream.read(1)
+                eol = lexer.read(1)
             if eol not in (b"\n", b"\r"):
                 raise PdfStreamError("Stream data must be followed by a newline")
-            if eol == b"\r" and stream.read(1) != b"\n":
-                stream.seek(-1, 1)
+            if eol == b"\r" and lexer.peek() == 0x0A:
+                lexer.pos += 1
             # this is a stream object, not a dictionary
             if SA.LENGTH not in data:
                 if pdf is not None and pdf.strict:
                     raise PdfStreamError("Stream length not defined")
                 else:
                     logger_warning(
-                        f"Stream length not defined @pos={stream.tell()}", __name__
+                        f"Stream length not defined @pos={lexer.tell()}", __name__
                     )
                 data[NameObject(SA.LENGTH)] = NumberObject(-1)
             length = data[SA.LENGTH]
             if isinstance(length, IndirectObject):
-                t = stream.tell()
                 assert pdf is not None  # hint for mypy
                 length = pdf.get_object(length)
-                stream.seek(t, 0)
             if length is None:  # if the PDF is damaged
                 length = -1
-            pstart = stream.tell()
+            pstart = lexer.pos
             if length > 0:
-                data["__streamdata__"] = stream.read(length)
+                # a view on the data is kept instead of a copy for memory mapped files
+                data["__streamdata__"] = lexer.read_data(length)
             else:
-                data["__streamdata__"] = read_until_regex(
-                    stream, re.compile(b"endstream")
-                )
-            e = read_non_whitespace(stream)
-            ndstream = stream.read(8)
+                data["__streamdata__"] = lexer.read_until(ENDSTREAM_PATTERN)
+            lexer.skip_whitespace()
+            e = lexer.read(1)
+            ndstream = lexer.read(8)
             if (e + ndstream) != b"endstream":
                 # (sigh) - the odd PDF file has a length that is too long, so
                 # we need to read backwards to find the "endstream" ending.
@@ -660,24 +748,23 @@ class DictionaryObject(Dict[Any, Any], PdfObject):
                 # and Python users into PDF files tend to be our audience.
                 # we need to do this to correct the streamdata and chop off
                 # an extra character.
-                pos = stream.tell()
-                stream.seek(-10, 1)
-                end = stream.read(9)
+                pos = lexer.pos
+                lexer.pos = max(pos - 10, 0)
+                end = lexer.read(9)
                 if end == b"endstream":
                     # we found it by looking back one character further.
                     data["__streamdata__"] = data["__streamdata__"][:-1]
                 elif pdf is not None and not pdf.strict:
-                    stream.seek(pstart, 0)
-                    data["__streamdata__"] = read_unsized_from_stream(stream, pdf)
-                    pos = stream.tell()
+                    lexer.pos = pstart
+                    data["__streamdata__"] = read_unsized_from_lexer(lexer, pdf)
                 else:
-                    stream.seek(pos, 0)
+                    lexer.pos = pos
                     raise PdfReadError(
                         "Unable to find 'endstream' marker after stream at byte "
-                        f"{hex(stream.tell())} (nd='{ndstream!r}', end='{end!r}')."
+                        f"{hex(lexer.tell())} (nd='{ndstream!r}', end='{end!r}')."
                     )
         else:
-            stream.seek(pos, 0)
+            lexer.pos = pos
         if "__streamdata__" in data:
             return StreamObject.initialize_from_dictionary(data)
         else:
@@ -914,6 +1001,28 @@ def _reset_node_tree_relationship(child_obj: Any) -> None:
         del child_obj[NameObject("/Prev")]
 
 
+def track_changes(obj: PdfObject) -> None:
+    """
+    Start tracking the changes of an indirect object.
+
+    The changes of the object and of the arrays and dictionaries it contains
+    directly set ``obj._modified``.
+
+    Args:
+        obj: The indirect object.
+
+    """
+    obj._modified = False
+    obj._owner = obj
+    # list and dict rather than PdfObject classes: isinstance is faster
+    pending: List[Any] = [obj] if isinstance(obj, (list, dict)) else []
+    while pending:
+        item = pending.pop()
+        item._owner = obj
+        values = dict.values(item) if isinstance(item, dict) else item
+        pending.extend(value for value in values if isinstance(value, (list, dict)))
+
+
 class StreamObject(DictionaryObject):
     def __init__(self) -> None:
         self._data: bytes = b""
@@ -990,7 +1099,32 @@ class StreamObject(DictionaryObject):
     def get_data(self) -> bytes:
         return self._data
 
+    def iter_data(
+        self, chunk_size: Optional[int] = None, max_length: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """
+        Iterate over the decoded data by chunks.
+
+        Args:
+            chunk_size: The size of the chunks, by default
+                ``pypdf.filters.STREAM_CHUNK_SIZE``.
+            max_length: The maximum size of the data, no limit by default.
+
+        Returns:
+            An iterator over the data.
+
+        Raises:
+            LimitReachedError: If the data exceed max_length.
+
+        """
+        from ..filters import STREAM_CHUNK_SIZE, _iter_chunks
+
+        if chunk_size is None:
+            chunk_size = STREAM_CHUNK_SIZE
+        yield from _iter_chunks(self.get_data(), chunk_size, max_length)
+
     def set_data(self, data: bytes) -> None:
+        self._mark_modified()
         self._data = data
 
     def hash_value_data(self) -> bytes:
@@ -1005,9 +1139,10 @@ class StreamObject(DictionaryObject):
             deprecation_no_replacement(
                 "the encryption_key parameter of write_to_stream", "5.0.0"
             )
-        self[NameObject(SA.LENGTH)] = NumberObject(len(self._data))
+        # not a change of the object: dict methods
+        dict.__setitem__(self, NameObject(SA.LENGTH), NumberObject(len(self._data)))
         DictionaryObject.write_to_stream(self, stream)
-        del self[SA.LENGTH]
+        dict.__delitem__(self, SA.LENGTH)
         stream.write(b"\nstream\n")
         stream.write(self._data)
         stream.write(b"\nendstream")
@@ -1028,6 +1163,11 @@ class StreamObject(DictionaryObject):
         else:
             retval = DecodedStreamObject()
         retval._data = data["__streamdata__"]
+        if isinstance(retval, DecodedStreamObject) and isinstance(
+            retval._data, memoryview
+        ):
+            # unfiltered data is returned as is by get_data()
+            retval._data = retval._data.tobytes()
         del data["__streamdata__"]
         if SA.LENGTH in data:
             del data[SA.LENGTH]
@@ -1119,6 +1259,46 @@ class EncodedStreamObject(StreamObject):
             self.decoded_self = decoded
             return decoded.get_data()
 
+    # This overrides the parent method:
+    def iter_data(
+        self, chunk_size: Optional[int] = None, max_length: Optional[int] = None
+    ) -> Iterator[bytes]:
+        """
+        Iterate over the decoded data by chunks.
+
+        Unlike :meth:`get_data`, the decoded data are not kept. Streams only
+        compressed with FlateDecode are decoded incrementally, so that the
+        whole decoded data are never in memory.
+
+        Args:
+            chunk_size: The approximate size of the chunks, by default
+                ``pypdf.filters.STREAM_CHUNK_SIZE``.
+            max_length: The maximum size of the decoded data, by default
+                ``pypdf.filters.ZLIB_MAX_OUTPUT_LENGTH``.
+
+        Returns:
+            An iterator over the decoded data.
+
+        Raises:
+            LimitReachedError: If the decoded data exceed max_length.
+
+        """
+        from ..filters import (
+            STREAM_CHUNK_SIZE,
+            ZLIB_MAX_OUTPUT_LENGTH,
+            iter_decode_stream_data,
+        )
+
+        if chunk_size is None:
+            chunk_size = STREAM_CHUNK_SIZE
+        if max_length is None:
+            max_length = ZLIB_MAX_OUTPUT_LENGTH
+        if self.decoded_self is not None:
+            # the limit applies whether the data are already decoded or not
+            yield from self.decoded_self.iter_data(chunk_size, max_length)
+        else:
+            yield from iter_decode_stream_data(self, chunk_size, max_length)
+
     # This overrides the parent method:
     def set_data(self, data: bytes) -> None:
         from ..filters import FlateDecode
@@ -1137,6 +1317,214 @@ class EncodedStreamObject(StreamObject):
             )
 
 
+class _ParsedData:
+    """The data operations were parsed from, and the offsets of the operations."""
+
+    __slots__ = ("data", "offsets")
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        #: start and end offsets of each operation in the data
+        self.offsets = array("q")
+
+
+class _Operands(list):  # type: ignore[type-arg]
+    """
+    Operands of a parsed operation, which remember where they were parsed from
+    until they are modified.
+    """
+
+    __slots__ = ("_index", "_parsed")
+
+    def __init__(self) -> None:
+        self._parsed: Optional[_ParsedData] = None
+        self._index = -1
+
+    def _source(self, parsed: _ParsedData) -> int:
+        """
+        Find the operation in the parsed data.
+
+        Returns:
+            The index of the operation in the data, or -1 if the operands do
+            not come from this data or may have been modified.
+
+        """
+        if self._parsed is not parsed:
+            return -1
+        # arrays and dictionaries can be modified without being noticed
+        for operand in self:
+            if operand.__class__ not in _IMMUTABLE_OPERANDS:
+                self._parsed = None
+                return -1
+        return self._index
+
+
+def _modifies_operands(name: str) -> Callable[..., Any]:
+    method = getattr(list, name)
+
+    def modify(self: _Operands, *args: Any) -> Any:
+        self._parsed = None
+        return method(self, *args)
+
+    modify.__name__ = name
+    return modify
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "clear",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "reverse",
+    "sort",
+):
+    setattr(_Operands, _name, _modifies_operands(_name))
+
+# classes of the operands which cannot be modified in place
+_IMMUTABLE_OPERANDS = frozenset(
+    (NumberObject, FloatObject, NameObject, TextStringObject, ByteStringObject)
+)
+# encoded names and numbers, which are repeated a lot in content streams
+MAX_CACHED_NAMES = 4096
+MAX_CACHED_FLOATS = 16384
+_encoded_names: Dict[str, bytes] = {}
+_encoded_floats: Dict[float, bytes] = {}
+_encoded_floats_precision = _base.FLOAT_WRITE_PRECISION
+_STRING_ESCAPES = re.compile(rb"[^A-Za-z0-9 ]")
+# bytes which can precede an operator
+_OPERATOR_BOUNDARIES = frozenset(b" \t\n\r\x0c\x00()<>[]{}/%")
+
+
+def _escape_string_byte(match: "re.Match[bytes]") -> bytes:
+    return b"\\%03o" % match[0][0]
+
+
+def _serialize_operand(obj: Any, out: bytearray, fallback: BytesIO) -> None:
+    """Append an operand to out, as written by its write_to_stream method."""
+    cls = obj.__class__
+    if cls is NumberObject:
+        out += b"%d" % obj
+    elif cls is FloatObject:
+        encoded = _encoded_floats.get(obj)
+        if encoded is None:
+            encoded = obj.myrepr().encode()
+            if len(_encoded_floats) < MAX_CACHED_FLOATS:
+                _encoded_floats[obj] = encoded
+        out += encoded
+    elif cls is NameObject:
+        try:
+            out += _encoded_names[obj]
+        except KeyError:
+            encoded = obj.renumber()
+            if len(_encoded_names) < MAX_CACHED_NAMES and obj[:1] == "/":
+                _encoded_names[obj] = encoded
+            out += encoded
+    elif cls is TextStringObject:
+        out += b"("
+        out += _STRING_ESCAPES.sub(_escape_string_byte, obj.get_encoded_bytes())
+        out += b")"
+    elif cls is ByteStringObject:
+        out += b"<"
+        out += binascii.hexlify(obj)
+        out += b">"
+    elif cls is ArrayObject:
+        out += b"["
+        for item in obj:
+            out += b" "
+            _serialize_operand(item, out, fallback)
+        out += b" ]"
+    else:
+        fallback.seek(0)
+        fallback.truncate()
+        obj.write_to_stream(fallback)
+        out += fallback.getvalue()
+
+
+def _serialize_operations(
+    operations: List[Tuple[Any, bytes]], parsed: Optional[_ParsedData]
+) -> bytes:
+    """
+    Serialize the operations of a content stream.
+
+    The runs of consecutive operations which are still as they were parsed
+    are copied from the parsed data.
+
+    Args:
+        operations: The operations to serialize.
+        parsed: The data the operations were parsed from, if any.
+
+    Returns:
+        The content stream data.
+
+    """
+    global _encoded_floats_precision
+    if _encoded_floats_precision != _base.FLOAT_WRITE_PRECISION:
+        _encoded_floats.clear()
+        _encoded_floats_precision = _base.FLOAT_WRITE_PRECISION
+    floats = _encoded_floats
+    out = bytearray()
+    fallback = BytesIO()
+    data = parsed.data if parsed is not None else b""
+    offsets = parsed.offsets if parsed is not None else array("q")
+    # the run of unchanged operations being copied
+    run_start = run_end = run_last = -1
+    for operation in operations:
+        operands, operator = operation
+        if operands.__class__ is _Operands and parsed is not None:
+            index = operands._source(parsed)
+            if index >= 0:
+                start = offsets[2 * index]
+                end = offsets[2 * index + 1]
+                operator_start = end - len(operator)
+                # the operator may have been replaced
+                if data.endswith(operator, start, end) and (
+                    operator_start == start
+                    or data[operator_start - 1] in _OPERATOR_BOUNDARIES
+                ):
+                    if index != run_last + 1 or run_start < 0:
+                        if run_start >= 0:
+                            out += data[run_start:run_end]
+                            out += b"\n"
+                        run_start = start
+                    run_end = end
+                    run_last = index
+                    continue
+        if run_start >= 0:
+            out += data[run_start:run_end]
+            out += b"\n"
+            run_start = -1
+        if operator == b"INLINE IMAGE":
+            fallback.seek(0)
+            fallback.truncate()
+            operands["settings"].write_to_stream(fallback)
+            out += b"BI"
+            out += fallback.getvalue()[2:-2]
+            out += b"ID "
+            out += operands["data"]
+            out += b"EI"
+        else:
+            for op in operands:
+                # the most frequent case is handled inline
+                encoded = floats.get(op) if op.__class__ is FloatObject else None
+                if encoded is None:
+                    _serialize_operand(op, out, fallback)
+                else:
+                    out += encoded
+                out += b" "
+            out += operator
+        out += b"\n"
+    if run_start >= 0:
+        out += data[run_start:run_end]
+        out += b"\n"
+    return bytes(out)
+
+
 class ContentStream(DecodedStreamObject):
     """
     In order to be fast, this data structure can contain either:
@@ -1156,6 +1544,11 @@ class ContentStream(DecodedStreamObject):
 
     * when .set_data() is called, ._operations is set to None.
     * when .operations is set, ._data is set to None.
+
+    .iter_operations() parses ._data on the fly without filling ._operations.
+    When ._data is rebuilt, the operations whose operands list was not modified
+    since it was parsed, and holds no array or dictionary, are copied from the
+    parsed data.
     """
 
     def __init__(
@@ -1170,6 +1563,8 @@ class ContentStream(DecodedStreamObject):
         #  Element 0: List
         #  Element 1: str
         self._operations: List[Tuple[Any, bytes]] = []
+        # the data parsed by .operations, see _serialize_operations
+        self._parsed: Optional[_ParsedData] = None
 
         # stream may be a StreamObject or an ArrayObject containing
         # multiple StreamObjects to be cat'd together.
@@ -1289,6 +1684,7 @@ class ContentStream(DecodedStreamObject):
         super().set_data(src_cs._data)
         self.pdf = pdf_dest
         self._operations = list(src_cs._operations)
+        self._parsed = src_cs._parsed
         self.forced_encoding = src_cs.forced_encoding
         # no need to call DictionaryObjection or anything
         # like super(DictionaryObject,self)._clone(src, pdf_dest, force_duplicate, ignore_fields, visited)
@@ -1296,33 +1692,99 @@ class ContentStream(DecodedStreamObject):
     def _parse_content_stream(self, stream: StreamType) -> None:
         # 7.8.2 Content Streams
         stream.seek(0, 0)
-        operands: List[Union[int, str, PdfObject]] = []
+        lexer = PdfLexer.from_stream(stream)
+        parsed = _ParsedData(stream.getvalue()) if isinstance(stream, BytesIO) else None
+        try:
+            self._operations.extend(self._parse_operations(lexer, stream, parsed))
+        finally:
+            lexer.detach(stream)
+        if parsed is not None and parsed.data:
+            self._parsed = parsed
+
+    def iter_operations(self) -> Iterator[Tuple[Any, bytes]]:
+        """
+        Iterate over the operations of the content stream.
+
+        Unlike :attr:`operations`, the operations which have not been parsed
+        yet are parsed from the data while iterating, and are not kept: the
+        whole list is never held in memory, and the parsing stops with the
+        iteration. The stream is not marked as modified, so the operations
+        must not be modified in place; assign :attr:`operations` instead.
+
+        Yields:
+            The (operands, operator) tuples. Inline images are yielded as
+            ``({"settings": ..., "data": ...}, b"INLINE IMAGE")``.
+
+        """
+        if self._operations or not self._data:
+            yield from list(self._operations)
+            return
+        stream = BytesIO(self._data)
+        lexer = PdfLexer.from_stream(stream)
+        yield from self._parse_operations(lexer, stream)
+
+    def _parse_operations(
+        self, lexer: PdfLexer, stream: StreamType, parsed: Optional[_ParsedData] = None
+    ) -> Iterator[Tuple[Any, bytes]]:
+        """
+        Parse the operations from the position of the lexer.
+
+        Args:
+            lexer: The lexer over the stream.
+            stream: The stream, used to read the inline images.
+            parsed: If provided, the data of the stream: the start and end
+                offsets of each operation are appended to it, and the operands
+                remember them, see _serialize_operations.
+
+        Yields:
+            The (operands, operator) tuples.
+
+        """
+        operands: List[Union[int, str, PdfObject]] = [] if parsed is None else _Operands()
+        start = -1
         while True:
-            peek = read_non_whitespace(stream)
-            if peek in (b"", 0):
+            lexer.skip_whitespace()
+            peek = lexer.peek()
+            if peek == -1:
                 break
-            stream.seek(-1, 1)
-            if peek.isalpha() or peek in (b"'", b'"'):
-                operator = read_until_regex(stream, NameObject.delimiter_pattern)
+            if start < 0 and peek != 0x25:
+                start = lexer.tell()
+            if 0x61 <= peek <= 0x7A or 0x41 <= peek <= 0x5A or peek in (0x27, 0x22):  # letters, ' and "
+                operator = lexer.match(NAME_PATTERN)
                 if operator == b"BI":
                     # begin inline image - a completely different parsing
                     # mechanism is required, of course... thanks buddy...
                     assert operands == []
+                    stream.seek(lexer.tell(), 0)
                     ii = self._read_inline_image(stream)
-                    self._operations.append((ii, b"INLINE IMAGE"))
+                    lexer.reset(stream.tell())
+                    if parsed is not None:
+                        parsed.offsets += array("q", (start, lexer.tell()))
+                    start = -1
+                    yield ii, b"INLINE IMAGE"
                 else:
-                    self._operations.append((operands, operator))
-                    operands = []
-            elif peek == b"%":
+                    if parsed is None:
+                        yield operands, operator
+                        operands = []
+                    else:
+                        offsets = parsed.offsets
+                        parsed_operands = cast(_Operands, operands)
+                        parsed_operands._index = len(offsets) >> 1
+                        parsed_operands._parsed = parsed
+                        offsets.append(start)
+                        offsets.append(lexer.tell())
+                        yield operands, operator
+                        operands = _Operands()
+                    start = -1
+            elif peek == 0x25:  # %
                 # If we encounter a comment in the content stream, we have to
                 # handle it here. Typically, read_object will handle
                 # encountering a comment -- but read_object assumes that
                 # following the comment must be the object we're trying to
                 # read. In this case, it could be an operator instead.
-                while peek not in (b"\r", b"\n", b""):
-                    peek = stream.read(1)
+                lexer.skip_comment()
             else:
-                operands.append(read_object(stream, None, self.forced_encoding))
+                operands.append(_read_object(lexer, None, self.forced_encoding))
 
     def _read_inline_image(self, stream: StreamType) -> Dict[str, Any]:
         # begin reading just after the "BI" - begin image
@@ -1402,32 +1864,19 @@ class ContentStream(DecodedStreamObject):
     # This overrides the parent method:
     def get_data(self) -> bytes:
         if not self._data:
-            new_data = BytesIO()
-            for operands, operator in self._operations:
-                if operator == b"INLINE IMAGE":
-                    new_data.write(b"BI")
-                    dict_text = BytesIO()
-                    operands["settings"].write_to_stream(dict_text)
-                    new_data.write(dict_text.getvalue()[2:-2])
-                    new_data.write(b"ID ")
-                    new_data.write(operands["data"])
-                    new_data.write(b"EI")
-                else:
-                    for op in operands:
-                        op.write_to_stream(new_data)
-                        new_data.write(b" ")
-                    new_data.write(operator)
-                new_data.write(b"\n")
-            self._data = new_data.getvalue()
+            self._data = _serialize_operations(self._operations, self._parsed)
         return self._data
 
     # This overrides the parent method:
     def set_data(self, data: bytes) -> None:
         super().set_data(data)
         self._operations = []
+        self._parsed = None
 
     @property
     def operations(self) -> List[Tuple[Any, bytes]]:
+        # the operations may be modified in place
+        self._mark_modified()
         if not self._operations and self._data:
             self._parse_content_stream(BytesIO(self._data))
             self._data = b""
@@ -1435,10 +1884,12 @@ class ContentStream(DecodedStreamObject):
 
     @operations.setter
     def operations(self, operations: List[Tuple[Any, bytes]]) -> None:
+        self._mark_modified()
         self._operations = operations
         self._data = b""
 
     def isolate_graphics_state(self) -> None:
+        self._mark_modified()
         if self._operations:
             self._operations.insert(0, ([], b"q"))
             self._operations.append(([], b"Q"))
@@ -1459,51 +1910,71 @@ def read_object(
     pdf: Optional[PdfReaderProtocol],
     forced_encoding: Union[None, str, List[str], Dict[int, str]] = None,
 ) -> Union[PdfObject, int, str, ContentStream]:
-    tok = stream.read(1)
-    stream.seek(-1, 1)  # reset to start
-    if tok == b"/":
-        return NameObject.read_from_stream(stream, pdf)
-    elif tok == b"<":
+    lexer = PdfLexer.from_stream(stream)
+    try:
+        return _read_object(lexer, pdf, forced_encoding)
+    finally:
+        lexer.detach(stream)
+
+
+def _read_object(  # noqa: PLR0911
+    lexer: PdfLexer,
+    pdf: Optional[PdfReaderProtocol],
+    forced_encoding: Union[None, str, List[str], Dict[int, str]] = None,
+) -> Union[PdfObject, int, str, ContentStream]:
+    tok = lexer.peek()
+    if tok == 0x2F:  # /
+        return NameObject._read_from_lexer(lexer, pdf)
+    elif tok in NUMBER_CHARS or tok == -1:
+        # number object OR indirect reference
+        lexer.ensure(20)
+        m = IndirectPattern.match(lexer.buf, lexer.pos, lexer.pos + 20)
+        if m is not None:
+            assert pdf is not None  # hint for mypy
+            lexer.pos = m.end()
+            return IndirectObject(int(m.group(1)), int(m.group(2)), pdf)
+        else:
+            return NumberObject._read_from_lexer(lexer)
+    elif tok == 0x3C:  # <
         # hexadecimal string OR dictionary
-        peek = stream.read(2)
-        stream.seek(-2, 1)  # reset to start
-        if peek == b"<<":
-            return DictionaryObject.read_from_stream(stream, pdf, forced_encoding)
+        if lexer.ensure(2) == 2 and lexer.buf[lexer.pos + 1] == 0x3C:
+            return DictionaryObject._read_from_lexer(lexer, pdf, forced_encoding)
         else:
-            return read_hex_string_from_stream(stream, forced_encoding)
-    elif tok == b"[":
-        return ArrayObject.read_from_stream(stream, pdf, forced_encoding)
-    elif tok in (b"t", b"f"):
-        return BooleanObject.read_from_stream(stream)
-    elif tok == b"(":
-        return read_string_from_stream(stream, forced_encoding)
-    elif tok == b"e" and stream.read(6) == b"endobj":
+            return _read_hex_string(lexer, forced_encoding)
+    elif tok == 0x5B:  # [
+        return ArrayObject._read_from_lexer(lexer, pdf, forced_encoding)
+    elif tok in (0x74, 0x66):  # t, f
+        word = lexer.read(4)
+        if word == b"true":
+            return BooleanObject(True)
+        elif word == b"fals":
+            lexer.read(1)
+            return BooleanObject(False)
+        else:
+            raise PdfReadError("Could not read Boolean object")
+    elif tok == 0x28:  # (
+        return _read_string(lexer, forced_encoding)
+    elif tok == 0x65 and lexer.read(6) == b"endobj":  # e
+        return NullObject()
+    elif tok == 0x6E:  # n
+        if lexer.read(4) != b"null":
+            raise PdfReadError("Could not read Null object")
         return NullObject()
-    elif tok == b"n":
-        return NullObject.read_from_stream(stream)
-    elif tok == b"%":
+    elif tok == 0x25:  # %
         # comment
-        skip_over_comment(stream)
-        tok = read_non_whitespace(stream)
-        stream.seek(-1, 1)
-        return read_object(stream, pdf, forced_encoding)
-    elif tok in b"0123456789+-.":
-        # number object OR indirect reference
-        peek = stream.read(20)
-        stream.seek(-len(peek), 1)  # reset to start
-        if IndirectPattern.match(peek) is not None:
-            assert pdf is not None  # hint for mypy
-            return IndirectObject.read_from_stream(stream, pdf)
-        else:
-            return NumberObject.read_from_stream(stream)
+        if not lexer.skip_comment():
+            raise PdfStreamError("File ended unexpectedly.")
+        lexer.skip_whitespace()
+        return _read_object(lexer, pdf, forced_encoding)
     else:
-        pos = stream.tell()
-        stream.seek(-20, 1)
-        stream_extract = stream.read(80)
-        stream.seek(pos)
-        read_until_whitespace(stream)
+        pos = lexer.tell()
+        lexer.ensure(60)
+        stream_extract = bytes(lexer.buf[max(lexer.pos - 20, 0) : lexer.pos + 60])
+        lexer.match(NON_SPACE_PATTERN)
+        if lexer.peek() != -1:
+            lexer.pos += 1
         raise PdfReadError(
-            f"Invalid Elementary Object starting with {tok!r} @{pos}: {stream_extract!r}"
+            f"Invalid Elementary Object starting with {bytes([tok])!r} @{pos}: {stream_extract!r}"
         )
 
 
@@ -0,0 +1,249 @@
+# Copyright (c) 2024, pypdf contributors
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met:
+#
+# * Redistributions of source code must retain the above copyright notice,
+# this list of conditions and the following disclaimer.
+# * Redistributions in binary form must reproduce the above copyright notice,
+# this list of conditions and the following disclaimer in the documentation
+# and/or other materials provided with the distribution.
+# * The name of the author may not be used to endorse or promote products
+# derived from this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Tokenizer used to parse PDF objects.
+
+Reading a stream byte per byte is slow in Python. The lexer works instead on a
+contiguous buffer with an integer cursor and precompiled regular expressions.
+In-memory and memory mapped streams are accessed without copying them; other
+streams are read in chunks.
+"""
+
+import re
+from io import BytesIO
+from typing import Any, FrozenSet, Optional, Pattern, Union
+
+from .._utils import MemoryMappedStream, StreamType
+
+WHITESPACES = frozenset(b"\x00\t\n\f\r ")
+SPACES = frozenset(b" \t\n\r\x0b\f")  # bytes.isspace()
+NON_SPACE_PATTERN = re.compile(rb"[^ \t\n\r\x0b\f]*")
+NAME_PATTERN = re.compile(rb"/?[^ \t\n\r\x0b\f()<>\[\]{}/%]*")
+NUMBER_PATTERN = re.compile(rb"[+-.0-9]*")
+STRING_SPECIAL_PATTERN = re.compile(rb"[()\\]")
+EOL_PATTERN = re.compile(rb"[\r\n]")
+
+CHUNK_SIZE = 8192
+SEARCH_OVERLAP = 16
+
+
+class PdfLexer:
+    """
+    Cursor over a bytes-like buffer.
+
+    ``pos`` is the index of the next byte to be read within ``buf``; the
+    corresponding stream offset is ``base + pos``.
+
+    Args:
+        buf: The data to tokenize.
+        pos: Initial position of the cursor.
+        stream: If provided, ``buf`` is extended by reading from the stream
+            whenever more data is needed.
+
+    """
+
+    __slots__ = ("_eof", "_stream", "_view", "base", "buf", "pos")
+
+    def __init__(
+        self,
+        buf: Any,
+        pos: int = 0,
+        stream: Optional[StreamType] = None,
+    ) -> None:
+        self.buf = buf
+        self.pos = pos
+        self.base = 0
+        self._stream = stream
+        self._eof = stream is None
+        self._view: Optional[memoryview] = None
+
+    @classmethod
+    def from_stream(cls, stream: StreamType) -> "PdfLexer":
+        """
+        Create a lexer starting at the current position of stream.
+
+        :meth:`detach` has to be called once done to move the stream to the
+        position of the lexer.
+        """
+        if isinstance(stream, BytesIO):
+            # no copy: the bytes object is shared until the stream is modified
+            return cls(stream.getvalue(), stream.tell())
+        if isinstance(stream, MemoryMappedStream):
+            lexer = cls(stream.getvalue(), stream.tell())
+            lexer._view = stream.getbuffer()
+            return lexer
+        lexer = cls(bytearray(), 0, stream)
+        lexer.base = stream.tell()
+        return lexer
+
+    def detach(self, stream: StreamType) -> None:
+        """Move the stream to the position of the lexer."""
+        stream.seek(self.base + self.pos, 0)
+
+    def tell(self) -> int:
+        return self.base + self.pos
+
+    def reset(self, offset: int) -> None:
+        """Move the cursor to the given stream offset."""
+        if self._stream is None:
+            self.pos = offset
+        else:
+            self.buf = bytearray()
+            self.base = offset
+            self.pos = 0
+            self._eof = False
+            self._stream.seek(offset, 0)
+
+    def _fill(self, size: int = CHUNK_SIZE) -> bool:
+        """Append a chunk of the stream to the buffer; False at the end of the data."""
+        if self._eof:
+            return False
+        assert self._stream is not None
+        self._stream.seek(self.base + len(self.buf), 0)
+        chunk = self._stream.read(max(size, CHUNK_SIZE))
+        if not chunk:
+            self._eof = True
+            return False
+        self.buf += chunk
+        return True
+
+    def ensure(self, size: int) -> int:
+        """Try to have size bytes available after the cursor; returns the number available."""
+        if not self._eof:
+            while len(self.buf) - self.pos < size and self._fill(size - len(self.buf) + self.pos):
+                pass
+        return min(size, len(self.buf) - self.pos)
+
+    def peek(self) -> int:
+        """Next byte as an integer, -1 at the end of the data."""
+        try:
+            return self.buf[self.pos]
+        except IndexError:
+            if self.ensure(1):
+                return self.buf[self.pos]
+            return -1
+
+    def read(self, size: int) -> bytes:
+        start = self.pos
+        if not self._eof:
+            self.ensure(size)
+        self.pos = end = min(start + size, len(self.buf))
+        return bytes(self.buf[start:end])
+
+    def read_data(self, size: int) -> Union[bytes, memoryview]:
+        """Like :meth:`read`, but returns a view on memory mapped data."""
+        if self._view is None:
+            return self.read(size)
+        start = self.pos
+        self.pos = end = min(start + size, len(self.buf))
+        return self._view[start:end]
+
+    def _match_more(self, pattern: Pattern[bytes], m: "Optional[re.Match[bytes]]") -> "Optional[re.Match[bytes]]":
+        # when reading by chunks, a match may continue in the next chunk
+        while m is not None and m.end() == len(self.buf) and self._fill():
+            m = pattern.match(self.buf, self.pos)
+        return m
+
+    def match(self, pattern: Pattern[bytes]) -> bytes:
+        """Consume and return the bytes matching pattern at the cursor."""
+        m = pattern.match(self.buf, self.pos)
+        if self._stream is not None:
+            m = self._match_more(pattern, m)
+            if m is None:
+                return b""
+            self.pos = m.end()
+            return bytes(m.group())
+        if m is None:
+            return b""
+        self.pos = m.end()
+        return m.group()
+
+    def skip(self, pattern: Pattern[bytes]) -> None:
+        """Advance the cursor over the bytes matching pattern."""
+        m = pattern.match(self.buf, self.pos)
+        if self._stream is not None:
+            m = self._match_more(pattern, m)
+        if m is not None:
+            self.pos = m.end()
+
+    def skip_whitespace(self, whitespaces: FrozenSet[int] = WHITESPACES) -> None:
+        """Advance the cursor over whitespaces (PDF whitespaces by default)."""
+        buf = self.buf
+        pos = self.pos
+        try:
+            # usually there is a single separator: cheaper than a regular expression
+            while buf[pos] in whitespaces:
+                pos += 1
+        except IndexError:
+            self.pos = pos
+            if self._fill():
+                self.skip_whitespace(whitespaces)
+            return
+        self.pos = pos
+
+    def search(self, pattern: Pattern[bytes]) -> "Optional[re.Match[bytes]]":
+        """
+        Search pattern from the cursor without moving it.
+
+        When reading from a stream in chunks, matches are expected to be
+        shorter than ``SEARCH_OVERLAP`` bytes.
+        """
+        pos = self.pos
+        while True:
+            m = pattern.search(self.buf, pos)
+            if self._eof or (m is not None and m.end() < len(self.buf)):
+                return m
+            if m is None:
+                pos = max(pos, len(self.buf) - SEARCH_OVERLAP)
+            if not self._fill():
+                return m
+
+    def read_until(self, pattern: Pattern[bytes]) -> bytes:
+        """
+        Read until pattern matches (the match is not consumed).
+        Reads until the end of the data if pattern does not match.
+        """
+        m = self.search(pattern)
+        start = self.pos
+        self.pos = len(self.buf) if m is None else m.start()
+        return bytes(self.buf[start : self.pos])
+
+    def skip_comment(self) -> bool:
+        """
+        Skip a comment including its end of line.
+
+        Returns:
+            False if the comment is not terminated.
+
+        """
+        m = self.search(EOL_PATTERN)
+        if m is None:
+            self.pos = len(self.buf)
+            return False
+        self.pos = m.end()
+        return True
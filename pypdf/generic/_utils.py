@@ -1,10 +1,15 @@
+import binascii
 import codecs
+import re
 from typing import Dict, List, Tuple, Union
 
 from .._codecs import _pdfdoc_encoding
-from .._utils import StreamType, logger_warning, read_non_whitespace
+from .._utils import WHITESPACES_AS_BYTES, StreamType, logger_warning
 from ..errors import STREAM_TRUNCATED_PREMATURELY, PdfStreamError
 from ._base import ByteStringObject, TextStringObject
+from ._lexer import STRING_SPECIAL_PATTERN, PdfLexer
+
+HEX_STRING_END_PATTERN = re.compile(rb">")
 
 
 def hex_to_rgb(value: str) -> Tuple[float, float, float]:
@@ -15,24 +20,30 @@ def read_hex_string_from_stream(
     stream: StreamType,
     forced_encoding: Union[None, str, List[str], Dict[int, str]] = None,
 ) -> Union["TextStringObject", "ByteStringObject"]:
-    stream.read(1)
-    arr = []
-    x = b""
-    while True:
-        tok = read_non_whitespace(stream)
-        if not tok:
-            raise PdfStreamError(STREAM_TRUNCATED_PREMATURELY)
-        if tok == b">":
-            break
-        x += tok
-        if len(x) == 2:
-            arr.append(int(x, base=16))
-            x = b""
-    if len(x) == 1:
+    lexer = PdfLexer.from_stream(stream)
+    try:
+        return _read_hex_string(lexer, forced_encoding)
+    finally:
+        lexer.detach(stream)
+
+
+def _read_hex_string(
+    lexer: PdfLexer,
+    forced_encoding: Union[None, str, List[str], Dict[int, str]] = None,
+) -> Union["TextStringObject", "ByteStringObject"]:
+    lexer.read(1)
+    m = lexer.search(HEX_STRING_END_PATTERN)
+    if m is None:
+        raise PdfStreamError(STREAM_TRUNCATED_PREMATURELY)
+    x = bytes(lexer.buf[lexer.pos : m.start()]).translate(None, WHITESPACES_AS_BYTES)
+    lexer.pos = m.end()
+    if len(x) % 2 == 1:
         x += b"0"
-    if x != b"":
-        arr.append(int(x, base=16))
-    return create_string_object(bytes(arr), forced_encoding)
+    try:
+        data = binascii.unhexlify(x)
+    except binascii.Error:
+        data = bytes(int(x[i : i + 2], base=16) for i in range(0, len(x), 2))
+    return create_string_object(data, forced_encoding)
 
 
 __ESPACE_DICT__ = {
@@ -57,67 +68,80 @@ __ESPACE_DICT__ = {
     b"$": ord(b"$"),
 }
 __BACKSLASH_CODE__ = 92
+__ESCAPE_CODES__ = {k[0]: v for k, v in __ESPACE_DICT__.items()}
+OCTAL_PATTERN = re.compile(rb"[0-7]{1,3}")
 
 
 def read_string_from_stream(
     stream: StreamType,
     forced_encoding: Union[None, str, List[str], Dict[int, str]] = None,
 ) -> Union["TextStringObject", "ByteStringObject"]:
-    tok = stream.read(1)
+    lexer = PdfLexer.from_stream(stream)
+    try:
+        return _read_string(lexer, forced_encoding)
+    finally:
+        lexer.detach(stream)
+
+
+def _read_string(
+    lexer: PdfLexer,
+    forced_encoding: Union[None, str, List[str], Dict[int, str]] = None,
+) -> Union["TextStringObject", "ByteStringObject"]:
+    lexer.read(1)
     parens = 1
-    txt = []
+    txt = bytearray()
     while True:
-        tok = stream.read(1)
-        if not tok:
+        # copy the plain characters up to the next parenthesis or backslash at once
+        m = lexer.search(STRING_SPECIAL_PATTERN)
+        if m is None:
             raise PdfStreamError(STREAM_TRUNCATED_PREMATURELY)
+        txt += lexer.buf[lexer.pos : m.start()]
+        lexer.pos = m.end()
+        tok = m.group()
         if tok == b"(":
             parens += 1
         elif tok == b")":
             parens -= 1
             if parens == 0:
                 break
-        elif tok == b"\\":
-            tok = stream.read(1)
-            try:
-                txt.append(__ESPACE_DICT__[tok])
-                continue
-            except KeyError:
-                if b"0" <= tok <= b"7":
-                    # "The number ddd may consist of one, two, or three
-                    # octal digits; high-order overflow shall be ignored.
-                    # Three octal digits shall be used, with leading zeros
-                    # as needed, if the next character of the string is also
-                    # a digit." (PDF reference 7.3.4.2, p 16)
-                    sav = stream.tell() - 1
-                    for _ in range(2):
-                        ntok = stream.read(1)
-                        if b"0" <= ntok <= b"7":
-                            tok += ntok
-                        else:
-                            stream.seek(-1, 1)  # ntok has to be analyzed
-                            break
-                    i = int(tok, base=8)
-                    if i > 255:
-                        txt.append(__BACKSLASH_CODE__)
-                        stream.seek(sav)
-                    else:
-                        txt.append(i)
-                    continue
-                elif tok in b"\n\r":
-                    # This case is  hit when a backslash followed by a line
-                    # break occurs. If it's a multi-char EOL, consume the
-                    # second character:
-                    tok = stream.read(1)
-                    if tok not in b"\n\r":
-                        stream.seek(-1, 1)
-                    # Then don't add anything to the actual string, since this
-                    # line break was escaped:
-                    continue
-                else:
-                    msg = f"Unexpected escaped string: {tok.decode('utf-8','ignore')}"
-                    logger_warning(msg, __name__)
+        else:
+            c = lexer.peek()
+            if c == -1:
+                raise PdfStreamError(STREAM_TRUNCATED_PREMATURELY)
+            esc = __ESCAPE_CODES__.get(c)
+            if esc is not None:
+                txt.append(esc)
+                lexer.pos += 1
+            elif 0x30 <= c <= 0x37:
+                # "The number ddd may consist of one, two, or three
+                # octal digits; high-order overflow shall be ignored.
+                # Three octal digits shall be used, with leading zeros
+                # as needed, if the next character of the string is also
+                # a digit." (PDF reference 7.3.4.2, p 16)
+                lexer.ensure(3)
+                m = OCTAL_PATTERN.match(lexer.buf, lexer.pos, lexer.pos + 3)
+                assert m is not None
+                i = int(m.group(), base=8)
+                if i > 255:
                     txt.append(__BACKSLASH_CODE__)
-        txt.append(ord(tok))
+                else:
+                    txt.append(i)
+                    lexer.pos = m.end()
+            elif c in (0x0A, 0x0D):
+                # This case is  hit when a backslash followed by a line
+                # break occurs. If it's a multi-char EOL, consume the
+                # second character:
+                lexer.pos += 1
+                if lexer.peek() in (0x0A, 0x0D):
+                    lexer.pos += 1
+                # Then don't add anything to the actual string, since this
+                # line break was escaped
+            else:
+                msg = f"Unexpected escaped string: {bytes([c]).decode('utf-8','ignore')}"
+                logger_warning(msg, __name__)
+                txt.append(__BACKSLASH_CODE__)
+            continue
+        txt += tok
     return create_string_object(bytes(txt), forced_encoding)
 
 
@@ -194,17 +218,20 @@ def create_string_object(
         raise TypeError("create_string_object should have str or unicode arg")
 
 
+# characters which do not exist are mapped to U+FFFE, rejected by charmap_decode
+_pdfdoc_decoding_table = "".join(
+    "\ufffe" if c == "\u0000" else c for c in _pdfdoc_encoding
+)
+
+
 def decode_pdfdocencoding(byte_array: bytes) -> str:
-    retval = ""
-    for b in byte_array:
-        c = _pdfdoc_encoding[b]
-        if c == "\u0000":
-            raise UnicodeDecodeError(
-                "pdfdocencoding",
-                bytearray(b),
-                -1,
-                -1,
-                "does not exist in translation table",
-            )
-        retval += c
-    return retval
+    try:
+        return codecs.charmap_decode(byte_array, "strict", _pdfdoc_decoding_table)[0]
+    except UnicodeDecodeError as exc:
+        raise UnicodeDecodeError(
+            "pdfdocencoding",
+            exc.object,
+            exc.start,
+            exc.end,
+            "does not exist in translation table",
+        ) from None
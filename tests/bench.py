@@ -13,7 +13,12 @@ import pytest
 import pypdf
 from pypdf import PdfReader, PdfWriter, Transformation
 from pypdf._page import PageObject
-from pypdf.generic import Destination, read_string_from_stream
+from pypdf.generic import (
+    ContentStream,
+    DecodedStreamObject,
+    Destination,
+    read_string_from_stream,
+)
 
 from . import get_data_from_url
 
@@ -161,6 +166,48 @@ def test_read_string_from_stream_performance(benchmark):
     benchmark(read_string_from_stream_performance)
 
 
+def content_stream_round_trip(data):
+    stream = DecodedStreamObject()
+    stream.set_data(data)
+    content = ContentStream(stream, None)
+    operations = content.operations
+    operations.insert(0, ([], b"q"))
+    operations.append(([], b"Q"))
+    return content.get_data()
+
+
+def test_content_stream_round_trip(benchmark):
+    """
+    Parse the operations of a large content stream, then serialize them
+    with a few operations added.
+    """
+    lines = []
+    for i in range(5000):
+        lines.append(b"BT /F1 12 Tf %d %d Td (Text %d) Tj ET" % (i % 500, i % 700, i))
+        lines.append(b"q 1 0 0 1 %d 0 cm 0.5 0.25 0.1 rg %d 0 10 10 re f Q" % (i, i))
+    data = b"\n".join(lines)
+    assert benchmark(content_stream_round_trip, data).startswith(b"q\nBT /F1 12 Tf")
+
+
+def crypt_operations(provider):
+    key = bytes(range(16))
+    data = bytes(range(256)) * 64
+    aes = provider.CryptAES(key)
+    assert aes.decrypt(aes.encrypt(data)) == data
+    rc4 = provider.CryptRC4(key)
+    assert rc4.decrypt(rc4.encrypt(data)) == data
+
+
+@pytest.mark.parametrize("provider", ["_fallback", "_cryptography", "_pycryptodome"])
+def test_crypt_providers(benchmark, provider):
+    """
+    Encrypt and decrypt 16 KiB with AES-128 and RC4, to compare the pure
+    Python fallback with the native providers.
+    """
+    module = pytest.importorskip(f"pypdf._crypt_providers.{provider}")
+    benchmark(crypt_operations, module)
+
+
 def image_new_property(data):
     reader = PdfReader(data)
     assert reader.pages[0].images.keys() == [
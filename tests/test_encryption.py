@@ -5,15 +5,18 @@ from pathlib import Path
 import pytest
 
 import pypdf
-from pypdf import PasswordType, PdfReader, PdfWriter
-from pypdf._crypt_providers import crypt_provider
-from pypdf._crypt_providers._fallback import _DEPENDENCY_ERROR_STR
+from pypdf import (
+    PasswordType,
+    PdfReader,
+    PdfWriter,
+    clear_key_derivation_cache,
+    set_key_derivation_cache_size,
+)
+from pypdf._crypt_providers import _fallback, crypt_provider
 from pypdf._encryption import AlgV5, CryptAES, CryptRC4
-from pypdf.errors import DependencyError, PdfReadError
+from pypdf.errors import PdfReadError
 
 USE_CRYPTOGRAPHY = crypt_provider[0] == "cryptography"
-USE_PYCRYPTODOME = crypt_provider[0] == "pycryptodome"
-HAS_AES = USE_CRYPTOGRAPHY or USE_PYCRYPTODOME
 TESTS_ROOT = Path(__file__).parent.resolve()
 PROJECT_ROOT = TESTS_ROOT.parent
 RESOURCE_ROOT = PROJECT_ROOT / "resources"
@@ -21,81 +24,72 @@ SAMPLE_ROOT = PROJECT_ROOT / "sample-files"
 
 
 @pytest.mark.parametrize(
-    ("name", "requires_aes"),
+    "name",
     [
         # unencrypted pdf
-        ("unencrypted.pdf", False),
+        "unencrypted.pdf",
         # created by:
         # qpdf --encrypt "" "" 40 -- unencrypted.pdf r2-empty-password.pdf
-        ("r2-empty-password.pdf", False),
+        "r2-empty-password.pdf",
         # created by:
         # qpdf --encrypt "" "" 128 -- unencrypted.pdf r3-empty-password.pdf
-        ("r3-empty-password.pdf", False),
+        "r3-empty-password.pdf",
         # created by:
         # qpdf --encrypt "asdfzxcv" "" 40 -- unencrypted.pdf r2-user-password.pdf
-        ("r2-user-password.pdf", False),
+        "r2-user-password.pdf",
         # created by:
         # qpdf --encrypt "" "asdfzxcv" 40 -- unencrypted.pdf r2-owner-password.pdf
-        ("r2-owner-password.pdf", False),
+        "r2-owner-password.pdf",
         # created by:
         # qpdf --encrypt "asdfzxcv" "" 128 -- unencrypted.pdf r3-user-password.pdf
-        ("r3-user-password.pdf", False),
+        "r3-user-password.pdf",
         # created by:
         # qpdf --encrypt "asdfzxcv" "" 128 --force-V4 -- unencrypted.pdf r4-user-password.pdf
-        ("r4-user-password.pdf", False),
+        "r4-user-password.pdf",
         # created by:
         # qpdf --encrypt "" "asdfzxcv" 128 --force-V4 -- unencrypted.pdf r4-owner-password.pdf
-        ("r4-owner-password.pdf", False),
+        "r4-owner-password.pdf",
         # created by:
         # qpdf --encrypt "asdfzxcv" "" 128 --use-aes=y -- unencrypted.pdf r4-aes-user-password.pdf
-        ("r4-aes-user-password.pdf", True),
+        "r4-aes-user-password.pdf",
         # created by:
         # qpdf --encrypt "" "" 256 --force-R5 -- unencrypted.pdf r5-empty-password.pdf
-        ("r5-empty-password.pdf", True),
+        "r5-empty-password.pdf",
         # created by:
         # qpdf --encrypt "asdfzxcv" "" 256 --force-R5 -- unencrypted.pdf r5-user-password.pdf
-        ("r5-user-password.pdf", True),
+        "r5-user-password.pdf",
         # created by:
         # qpdf --encrypt "" "asdfzxcv" 256 --force-R5 -- unencrypted.pdf r5-owner-password.pdf
-        ("r5-owner-password.pdf", True),
+        "r5-owner-password.pdf",
         # created by:
         # qpdf --encrypt "" "" 256 -- unencrypted.pdf r6-empty-password.pdf
-        ("r6-empty-password.pdf", True),
+        "r6-empty-password.pdf",
         # created by:
         # qpdf --encrypt "asdfzxcv" "" 256 -- unencrypted.pdf r6-user-password.pdf
-        ("r6-user-password.pdf", True),
+        "r6-user-password.pdf",
         # created by:
         # qpdf --encrypt "" "asdfzxcv" 256 -- unencrypted.pdf r6-owner-password.pdf
-        ("r6-owner-password.pdf", True),
+        "r6-owner-password.pdf",
     ],
 )
-def test_encryption(name, requires_aes):
+def test_encryption(name):
     """
     Encrypted PDFs are handled correctly.
 
     This test function ensures that:
-    - If PyCryptodome or cryptography is not available and required, a DependencyError is raised
     - Encrypted PDFs are identified correctly
     - Decryption works for encrypted PDFs
     - Metadata is properly extracted from the decrypted PDF
     """
     inputfile = RESOURCE_ROOT / "encryption" / name
-    if requires_aes and not HAS_AES:
-        with pytest.raises(DependencyError) as exc:
-            ipdf = pypdf.PdfReader(inputfile)
-            ipdf.decrypt("asdfzxcv")
-            dd = dict(ipdf.metadata)
-        assert exc.value.args[0] == _DEPENDENCY_ERROR_STR
-        return
+    ipdf = pypdf.PdfReader(inputfile)
+    if str(inputfile).endswith("unencrypted.pdf"):
+        assert not ipdf.is_encrypted
     else:
-        ipdf = pypdf.PdfReader(inputfile)
-        if str(inputfile).endswith("unencrypted.pdf"):
-            assert not ipdf.is_encrypted
-        else:
-            assert ipdf.is_encrypted
-            ipdf.decrypt("asdfzxcv")
-        assert len(ipdf.pages) == 1
-        dd = dict(ipdf.metadata)
+        assert ipdf.is_encrypted
+        ipdf.decrypt("asdfzxcv")
+    assert len(ipdf.pages) == 1
+    dd = dict(ipdf.metadata)
     # remove empty value entry
     dd = {x[0]: x[1] for x in dd.items() if x[1]}
     assert dd == {
@@ -116,7 +110,6 @@ def test_encryption(name, requires_aes):
         ("r6-both-passwords.pdf", "foo", "bar"),
     ],
 )
-@pytest.mark.skipif(not HAS_AES, reason="No AES implementation")
 def test_pdf_with_both_passwords(name, user_passwd, owner_passwd):
     """
     PDFs with both user and owner passwords are handled correctly.
@@ -142,7 +135,6 @@ def test_pdf_with_both_passwords(name, user_passwd, owner_passwd):
         ("crazyones-encrypted-256.pdf", b"password"),
     ],
 )
-@pytest.mark.skipif(not HAS_AES, reason="No AES implementation")
 def test_read_page_from_encrypted_file_aes_256(pdffile, password):
     """
     A page can be read from an encrypted.
@@ -167,7 +159,6 @@ def test_read_page_from_encrypted_file_aes_256(pdffile, password):
         ),
     ],
 )
-@pytest.mark.skipif(not HAS_AES, reason="No AES implementation")
 @pytest.mark.filterwarnings("ignore::DeprecationWarning")
 def test_merge_encrypted_pdfs(names):
     """Encrypted PDFs can be merged after decryption."""
@@ -208,7 +199,6 @@ def test_attempt_decrypt_unencrypted_pdf():
     assert exc.value.args[0] == "Not an encrypted file"
 
 
-@pytest.mark.skipif(not HAS_AES, reason="No AES implementation")
 def test_alg_v5_generate_values():
     """
     Algorithm V5 values are generated without raising exceptions.
@@ -235,17 +225,9 @@ def test_alg_v5_generate_values():
 
 
 @pytest.mark.parametrize(
-    ("alg", "requires_aes"),
-    [
-        ("RC4-40", False),
-        ("RC4-128", False),
-        ("AES-128", True),
-        ("AES-256-R5", True),
-        ("AES-256", True),
-        ("ABCD", False),
-    ],
+    "alg", ["RC4-40", "RC4-128", "AES-128", "AES-256-R5", "AES-256", "ABCD"]
 )
-def test_pdf_encrypt(pdf_file_path, alg, requires_aes):
+def test_pdf_encrypt(pdf_file_path, alg):
     user_password = secrets.token_urlsafe(10)
     owner_password = secrets.token_urlsafe(10)
 
@@ -267,18 +249,6 @@ def test_pdf_encrypt(pdf_file_path, alg, requires_aes):
         assert exc.value.args[0] == "Algorithm 'ABCD' NOT supported"
         return
 
-    if requires_aes and not HAS_AES:
-        with pytest.raises(DependencyError) as exc:
-            writer.encrypt(
-                user_password=user_password,
-                owner_password=owner_password,
-                algorithm=alg,
-            )
-            with open(pdf_file_path, "wb") as output_stream:
-                writer.write(output_stream)
-        assert exc.value.args[0] == _DEPENDENCY_ERROR_STR
-        return
-
     writer.encrypt(
         user_password=user_password, owner_password=owner_password, algorithm=alg
     )
@@ -336,7 +306,6 @@ def test_pdf_encrypt_multiple(pdf_file_path, count):
     assert text0 == text1
 
 
-@pytest.mark.skipif(not HAS_AES, reason="No AES implementation")
 def test_aes_decrypt_corrupted_data():
     """Just for robustness"""
     aes = CryptAES(secrets.token_bytes(16))
@@ -344,6 +313,210 @@ def test_aes_decrypt_corrupted_data():
         aes.decrypt(secrets.token_bytes(num))
 
 
+@pytest.mark.parametrize("aes", [False, True])
+def test_decrypt_many(aes):
+    """Strings decrypted together give the same result as one by one."""
+    crypt = CryptAES(secrets.token_bytes(16)) if aes else CryptRC4(b"secret key")
+    messages = [b"", b"Hello", b"x" * 16, secrets.token_bytes(100)]
+    data = [crypt.encrypt(message) for message in messages]
+    data += [b"", secrets.token_bytes(17)]  # corrupted data
+    assert crypt.decrypt_many(data) == [crypt.decrypt(d) for d in data]
+    assert crypt.decrypt_many(data)[: len(messages)] == messages
+
+
+# FIPS-197, appendix C
+@pytest.mark.parametrize(
+    ("key", "ciphertext"),
+    [
+        ("000102030405060708090a0b0c0d0e0f", "69c4e0d86a7b0430d8cdb78070b4c55a"),
+        (
+            "000102030405060708090a0b0c0d0e0f1011121314151617",
+            "dda97ca4864cdfe06eaf70a0ec0d7191",
+        ),
+        (
+            "000102030405060708090a0b0c0d0e0f101112131415161718191a1b1c1d1e1f",
+            "8ea2b7ca516745bfeafc49904b496089",
+        ),
+    ],
+)
+def test_fallback_aes_fips_197(key, ciphertext):
+    key = bytes.fromhex(key)
+    plaintext = bytes.fromhex("00112233445566778899aabbccddeeff")
+    ciphertext = bytes.fromhex(ciphertext)
+    assert _fallback.aes_ecb_encrypt(key, plaintext) == ciphertext
+    assert _fallback.aes_ecb_decrypt(key, ciphertext) == plaintext
+
+
+SP800_38A_PLAINTEXT = (
+    "6bc1bee22e409f96e93d7e117393172a"
+    "ae2d8a571e03ac9c9eb76fac45af8e51"
+    "30c81c46a35ce411e5fbc1191a0a52ef"
+    "f69f2445df4f9b17ad2b417be66c3710"
+)
+SP800_38A_KEYS = {
+    128: "2b7e151628aed2a6abf7158809cf4f3c",
+    192: "8e73b0f7da0e6452c810f32b809079e562f8ead2522c6b7b",
+    256: "603deb1015ca71be2b73aef0857d77811f352c073b6108d72d9810a30914dff4",
+}
+
+
+# NIST SP 800-38A, appendices F.1 and F.2
+@pytest.mark.parametrize(
+    ("mode", "key_size", "ciphertext"),
+    [
+        (
+            "ECB",
+            128,
+            (
+                "3ad77bb40d7a3660a89ecaf32466ef97"
+                "f5d3d58503b9699de785895a96fdbaaf"
+                "43b1cd7f598ece23881b00e3ed030688"
+                "7b0c785e27e8ad3f8223207104725dd4"
+            ),
+        ),
+        (
+            "ECB",
+            192,
+            (
+                "bd334f1d6e45f25ff712a214571fa5cc"
+                "974104846d0ad3ad7734ecb3ecee4eef"
+                "ef7afd2270e2e60adce0ba2face6444e"
+                "9a4b41ba738d6c72fb16691603c18e0e"
+            ),
+        ),
+        (
+            "ECB",
+            256,
+            (
+                "f3eed1bdb5d2a03c064b5a7e3db181f8"
+                "591ccb10d410ed26dc5ba74a31362870"
+                "b6ed21b99ca6f4f9f153e7b1beafed1d"
+                "23304b7a39f9f3ff067d8d8f9e24ecc7"
+            ),
+        ),
+        (
+            "CBC",
+            128,
+            (
+                "7649abac8119b246cee98e9b12e9197d"
+                "5086cb9b507219ee95db113a917678b2"
+                "73bed6b8e3c1743b7116e69e22229516"
+                "3ff1caa1681fac09120eca307586e1a7"
+            ),
+        ),
+        (
+            "CBC",
+            192,
+            (
+                "4f021db243bc633d7178183a9fa071e8"
+                "b4d9ada9ad7dedf4e5e738763f69145a"
+                "571b242012fb7ae07fa9baac3df102e0"
+                "08b0e27988598881d920a9e64f5615cd"
+            ),
+        ),
+        (
+            "CBC",
+            256,
+            (
+                "f58c4c04d6e5f1ba779eabfb5f7bfbd6"
+                "9cfc4e967edb808d679f777bc6702c7d"
+                "39f23369a9d9bacfa530e26304231461"
+                "b2eb05e2c39be9fcda6c19078c6a9d1b"
+            ),
+        ),
+    ],
+)
+def test_fallback_aes_sp800_38a(mode, key_size, ciphertext):
+    key = bytes.fromhex(SP800_38A_KEYS[key_size])
+    plaintext = bytes.fromhex(SP800_38A_PLAINTEXT)
+    ciphertext = bytes.fromhex(ciphertext)
+    if mode == "ECB":
+        assert _fallback.aes_ecb_encrypt(key, plaintext) == ciphertext
+        assert _fallback.aes_ecb_decrypt(key, ciphertext) == plaintext
+    else:
+        iv = bytes.fromhex("000102030405060708090a0b0c0d0e0f")
+        assert _fallback.aes_cbc_encrypt(key, iv, plaintext) == ciphertext
+        assert _fallback.aes_cbc_decrypt(key, iv, ciphertext) == plaintext
+        # the strings and streams of a document are padded, the IV first
+        padded = _fallback.aes_cbc_encrypt(key, iv, plaintext + bytes([16]) * 16)
+        assert padded[:64] == ciphertext
+        assert _fallback.CryptAES(key).decrypt(iv + padded) == plaintext
+
+
+@pytest.mark.parametrize(
+    ("key", "plaintext", "ciphertext"),
+    [
+        (b"Key", b"Plaintext", "bbf316e8d940af0ad3"),
+        (b"Wiki", b"pedia", "1021bf0420"),
+        (b"Secret", b"Attack at dawn", "45a01f645fc35b383552544b9bf5"),
+        # RFC 6229, 40-bit key, first 16 bytes of the keystream
+        (bytes.fromhex("0102030405"), bytes(16), "b2396305f03dc027ccc3524a0a1118a8"),
+    ],
+)
+def test_fallback_rc4(key, plaintext, ciphertext):
+    ciphertext = bytes.fromhex(ciphertext)
+    assert _fallback.rc4_encrypt(key, plaintext) == ciphertext
+    assert _fallback.rc4_decrypt(key, ciphertext) == plaintext
+    # the keystream kept by the cipher gives the same results
+    crypt = _fallback.CryptRC4(key)
+    assert crypt.encrypt(plaintext) == ciphertext
+    assert crypt.decrypt_many([ciphertext, ciphertext[:3]]) == [
+        plaintext,
+        plaintext[:3],
+    ]
+
+
+def test_key_derivation_cache(monkeypatch):
+    calls = []
+    calculate_hash = AlgV5.calculate_hash
+
+    def counted_hash(r: int, password: bytes, salt: bytes, udata: bytes) -> bytes:
+        calls.append((r, password, salt, udata))
+        return calculate_hash(r, password, salt, udata)
+
+    monkeypatch.setattr(AlgV5, "calculate_hash", staticmethod(counted_hash))
+    path = RESOURCE_ROOT / "encryption" / "r6-user-password.pdf"
+    assert PdfReader(path).decrypt("asdfzxcv") == PasswordType.USER_PASSWORD
+    assert len(calls) > 0
+    calls.clear()
+    assert PdfReader(path).decrypt("asdfzxcv") == PasswordType.USER_PASSWORD
+    assert len(calls) > 0  # the cache is disabled by default
+
+    # the empty password is also tried when opening the document
+    set_key_derivation_cache_size(3)
+    for _ in range(2):
+        calls.clear()
+        reader = PdfReader(path)
+        assert reader.decrypt("asdfzxcv") == PasswordType.USER_PASSWORD
+        assert reader.decrypt("wrong") == PasswordType.NOT_DECRYPTED
+        assert reader.pages[0].extract_text()
+    assert calls == []
+    # the least recently used entries are evicted
+    PdfReader(path).decrypt("other")
+    calls.clear()
+    PdfReader(path).decrypt("asdfzxcv")
+    assert len(calls) > 0
+    clear_key_derivation_cache()
+    calls.clear()
+    PdfReader(path).decrypt("asdfzxcv")
+    assert len(calls) > 0
+    set_key_derivation_cache_size(0)
+    assert len(pypdf._encryption._key_derivation_cache._entries) == 0
+
+
+def test_decrypt_any():
+    reader = PdfReader(RESOURCE_ROOT / "encryption" / "r6-both-passwords.pdf")
+    assert reader.decrypt_any([]) == (None, PasswordType.NOT_DECRYPTED)
+    assert reader.decrypt_any(["a", b"a", "b"]) == (None, PasswordType.NOT_DECRYPTED)
+    assert reader.decrypt_any(["a", "foo", "bar"]) == ("foo", PasswordType.USER_PASSWORD)
+    assert reader.pages[0].extract_text()
+    assert reader.decrypt_any([b"bar", "foo"]) == (b"bar", PasswordType.OWNER_PASSWORD)
+
+    reader = PdfReader(RESOURCE_ROOT / "crazyones.pdf")
+    with pytest.raises(PdfReadError, match="Not encrypted file"):
+        reader.decrypt_any(["a"])
+
+
 @pytest.mark.samples
 def test_encrypt_stream_dictionary(pdf_file_path):
     user_password = secrets.token_urlsafe(10)
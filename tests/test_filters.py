@@ -3,15 +3,18 @@ import os
 import shutil
 import string
 import subprocess
+import zlib
 from io import BytesIO
 from itertools import product as cartesian_product
 from pathlib import Path
+from unittest import mock
 
 import pytest
 from PIL import Image
 
 from pypdf import PdfReader
-from pypdf.errors import DeprecationError, PdfReadError
+from pypdf._codecs import _predictors
+from pypdf.errors import DeprecationError, LimitReachedError, PdfReadError
 from pypdf.filters import (
     ASCII85Decode,
     ASCIIHexDecode,
@@ -19,11 +22,18 @@ from pypdf.filters import (
     CCITTFaxDecode,
     CCITTParameters,
     FlateDecode,
+    decompress,
+)
+from pypdf.generic import (
+    ArrayObject,
+    DictionaryObject,
+    EncodedStreamObject,
+    IndirectObject,
+    NameObject,
+    NumberObject,
 )
-from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject, NameObject, NumberObject
 
 from . import PILContext, get_data_from_url
-from .test_encryption import HAS_AES
 from .test_images import image_similarity
 
 filter_inputs = (
@@ -81,6 +91,94 @@ def test_flate_decode_decompress_with_array_params(params):
         assert codec.decode(encoded, params) == s
 
 
+def _png_predictor_reference(data, bpp, rowlength) -> bytes:
+    output = bytearray()
+    prev = bytes(rowlength - 1)
+    for start in range(0, len(data), rowlength):
+        filter_byte = data[start]
+        row = bytearray(data[start + 1 : start + rowlength])
+        for i in range(len(row)):
+            left = row[i - bpp] if i >= bpp else 0
+            up = prev[i]
+            up_left = prev[i - bpp] if i >= bpp else 0
+            if filter_byte == 1:
+                predicted = left
+            elif filter_byte == 2:
+                predicted = up
+            elif filter_byte == 3:
+                predicted = (left + up) // 2
+            elif filter_byte == 4:
+                p = left + up - up_left
+                predicted = min((abs(p - left), 0, left), (abs(p - up), 1, up), (abs(p - up_left), 2, up_left))[2]
+            else:
+                predicted = 0
+            row[i] = (row[i] + predicted) % 256
+        output += row
+        prev = row
+    return bytes(output)
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+@pytest.mark.parametrize(("colors", "bits_per_component"), [(1, 1), (3, 2), (1, 4), (3, 8), (4, 8), (2, 16)])
+def test_flate_decode_png_predictor(use_numpy, colors, bits_per_component):
+    if use_numpy and not _predictors.HAS_NUMPY:
+        pytest.skip("numpy is not installed")
+    columns = 23
+    rowlength = (columns * colors * bits_per_component + 7) // 8 + 1
+    bpp = (colors * bits_per_component + 7) // 8
+    data = bytearray(os.urandom(rowlength * 12))
+    # all filters, including runs of the same filter
+    for row, filter_byte in enumerate([0, 1, 2, 3, 4, 2, 2, 2, 1, 4, 3, 0]):
+        data[row * rowlength] = filter_byte
+    expected = _png_predictor_reference(data, bpp, rowlength)
+    decode_parms = DictionaryObject(
+        {
+            NameObject("/Predictor"): NumberObject(15),
+            NameObject("/Columns"): NumberObject(columns),
+            NameObject("/Colors"): NumberObject(colors),
+            NameObject("/BitsPerComponent"): NumberObject(bits_per_component),
+        }
+    )
+    with mock.patch.object(_predictors, "HAS_NUMPY", use_numpy):
+        assert FlateDecode.decode(FlateDecode.encode(bytes(data)), decode_parms) == expected
+
+        data[rowlength] = 5
+        with pytest.raises(PdfReadError, match="Unsupported PNG filter 5"):
+            FlateDecode.decode(FlateDecode.encode(bytes(data)), decode_parms)
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+@pytest.mark.parametrize(
+    ("data", "columns", "colors", "bits_per_component", "expected"),
+    [
+        (b"\x01\x02\x03\xff\x01\x02", 3, 1, 8, b"\x01\x03\x06\xff\x00\x02"),
+        (b"\x01\x02\x03\x04\x05\x06", 2, 3, 8, b"\x01\x02\x03\x05\x07\x09"),
+        # the last row is incomplete
+        (b"\x01\x02\x03\x04\x05", 2, 1, 8, b"\x01\x03\x03\x07\x05"),
+        # the carry of the low byte is added to the high byte
+        (b"\x00\xff\x00\x01\xff\xff\x00\x02", 4, 1, 16, b"\x00\xff\x01\x00\x00\xff\x01\x01"),
+        # 1010 becomes 1100, 1001 becomes 1110
+        (b"\xa0\x9c", 4, 1, 1, b"\xc0\xec"),
+        (b"\x1b\xe4", 2, 2, 2, b"\x18\xe2"),
+        # the padding bits are kept
+        (b"\x5f", 1, 1, 4, b"\x5f"),
+    ],
+)
+def test_flate_decode_tiff_predictor(use_numpy, data, columns, colors, bits_per_component, expected):
+    if use_numpy and not _predictors.HAS_NUMPY:
+        pytest.skip("numpy is not installed")
+    decode_parms = DictionaryObject(
+        {
+            NameObject("/Predictor"): NumberObject(2),
+            NameObject("/Columns"): NumberObject(columns),
+            NameObject("/Colors"): NumberObject(colors),
+            NameObject("/BitsPerComponent"): NumberObject(bits_per_component),
+        }
+    )
+    with mock.patch.object(_predictors, "HAS_NUMPY", use_numpy):
+        assert FlateDecode.decode(FlateDecode.encode(data), decode_parms) == expected
+
+
 @pytest.mark.parametrize(
     ("data", "expected"),
     [
@@ -244,6 +342,76 @@ def test_ccitt_fax_decode():
     )
 
 
+def test_decompress_truncated_or_corrupted():
+    data = bytes(range(256)) * 1000 + os.urandom(100_000)
+    compressed = zlib.compress(data)
+    # truncated: what was decompressed is returned
+    truncated = decompress(compressed[: len(compressed) // 2])
+    assert 0 < len(truncated) < len(data)
+    assert data.startswith(truncated)
+    # corrupted in the checksum: all the data can be recovered
+    corrupted = bytearray(compressed)
+    corrupted[-1] ^= 0xFF
+    assert decompress(bytes(corrupted)) == data
+    assert b"".join(FlateDecode.iter_decode(bytes(corrupted), chunk_size=1000)) == data
+
+
+def test_decompress_max_length():
+    compressed = zlib.compress(b"0" * 10_000)
+    with mock.patch("pypdf.filters.ZLIB_MAX_OUTPUT_LENGTH", 5000), pytest.raises(
+        LimitReachedError, match="more than 5000 bytes"
+    ):
+        decompress(compressed)
+    with mock.patch("pypdf.filters.ZLIB_MAX_OUTPUT_LENGTH", 10_000):
+        assert decompress(compressed) == b"0" * 10_000
+
+
+@pytest.mark.parametrize("predictor", [1, 2, 12, 15])
+def test_flate_iter_decode(predictor):
+    decode_parms = DictionaryObject(
+        {
+            NameObject("/Predictor"): NumberObject(predictor),
+            NameObject("/Columns"): NumberObject(50),
+            NameObject("/Colors"): NumberObject(3),
+        }
+    )
+    data = bytearray(os.urandom(151 * 200))
+    for row in range(0, len(data), 151):
+        data[row] = row % 5
+    compressed = FlateDecode.encode(bytes(data))
+    expected = FlateDecode.decode(compressed, decode_parms)
+    chunks = list(FlateDecode.iter_decode(compressed, decode_parms, chunk_size=1000))
+    assert len(chunks) > 1
+    assert max(len(chunk) for chunk in chunks) < 2000
+    assert b"".join(chunks) == expected
+
+
+def test_stream_iter_data():
+    stream = EncodedStreamObject()
+    stream[NameObject("/Filter")] = NameObject("/FlateDecode")
+    stream._data = FlateDecode.encode(b"0123456789" * 1000)
+    assert list(stream.iter_data(4000)) == [b"0123456789" * 400, b"0123456789" * 400, b"0123456789" * 200]
+    assert stream.decoded_self is None
+    with pytest.raises(LimitReachedError):
+        list(stream.iter_data(max_length=9999))
+    assert b"".join(stream.iter_data(max_length=10_000)) == stream.get_data()
+    # the limit also applies once the data are decoded
+    assert stream.decoded_self is not None
+    with pytest.raises(LimitReachedError):
+        list(stream.iter_data(max_length=9999))
+    assert list(stream.iter_data()) == [b"0123456789" * 1000]
+    with mock.patch("pypdf.filters.STREAM_CHUNK_SIZE", 4000):
+        assert len(list(stream.iter_data())) == 3
+        assert len(list(stream.decoded_self.iter_data())) == 3
+
+    stream[NameObject("/Filter")] = ArrayObject([NameObject("/ASCIIHexDecode"), NameObject("/FlateDecode")])
+    stream._data = stream._data.hex().encode()
+    stream.decoded_self = None
+    assert b"".join(stream.iter_data(3)) == b"0123456789" * 1000
+    with pytest.raises(LimitReachedError):
+        list(stream.iter_data(max_length=9999))
+
+
 @pytest.mark.enable_socket
 def test_decompress_zlib_error(caplog):
     reader = PdfReader(BytesIO(get_data_from_url(name="tika-952445.pdf")))
@@ -599,7 +767,6 @@ def test_nested_device_n_color_space():
 
 
 @pytest.mark.enable_socket
-@pytest.mark.skipif(not HAS_AES, reason="No AES implementation")
 def test_flate_decode_with_image_mode_1():
     """From #2248"""
     url = "https://github.com/py-pdf/pypdf/files/12847339/Prototype-Declaration-VDE4110-HYD-5000-20000-ZSS-DE.pdf"
@@ -3,7 +3,7 @@
 import codecs
 from base64 import a85encode
 from copy import deepcopy
-from io import BytesIO
+from io import BufferedReader, BytesIO
 from pathlib import Path
 
 import pytest
@@ -336,6 +336,26 @@ def test_read_object_comment():
     assert out == 1
 
 
+@pytest.mark.parametrize("padding", [0, 8180, 8191, 8200])
+def test_read_object_from_unbuffered_stream(padding):
+    # streams without getvalue() are read by chunks: the tokens can span them
+    data = (
+        b"<< /Pad (" + b"x" * padding + b") /Long (" + b"(a\\\\b) \\101 " * 1000 + b")"
+        b" /Kids [ 1 0 R 2 0 R ] /Hex <41 42 4> /Name /A#42C /Number -1.5"
+        b" /Length 6 >>\nstream\nbinary\nendstream\nrest"
+    )
+    pdf = ReaderDummy()
+    expected = read_object(BytesIO(data), pdf)
+    stream = BufferedReader(BytesIO(data))
+    obj = read_object(stream, pdf)
+    assert obj == expected
+    assert obj["/Long"] == "(a\\b) A " * 1000
+    assert obj["/Hex"] == "AB@"
+    assert obj["/Name"] == "/ABC"
+    assert obj.get_data() == b"binary"
+    assert stream.read() == b"\nrest"
+
+
 def test_bytestringobject():
     bo = ByteStringObject("stream", encoding="utf-8")
     stream = BytesIO(b"")
@@ -1219,3 +1239,58 @@ def test_contentstream_arrayobject_containing_nullobject(caplog):
     content_stream = ContentStream(stream=input_stream, pdf=None)
     assert content_stream.get_data() == b"Hello World!\n"
     assert caplog.text == ""
+
+
+def test_contentstream_iter_operations():
+    stream_object = DecodedStreamObject()
+    stream_object.set_data(
+        b"q 1 0 0 1 10 20 cm BI /W 1 /H 1 /BPC 8 /CS /G ID \x80 EI Q BT (Hi) Tj ET"
+    )
+    content_stream = ContentStream(stream_object, None)
+    operations = content_stream.iter_operations()
+    assert next(operations) == ([], b"q")
+    assert next(operations) == ([1, 0, 0, 1, 10, 20], b"cm")
+    operands, operator = next(operations)
+    assert operator == b"INLINE IMAGE"
+    assert operands["data"] == b"\x80"
+    # the operations are not kept
+    assert content_stream._operations == []
+    assert [operator for _, operator in operations] == [b"Q", b"BT", b"Tj", b"ET"]
+
+    expected = list(content_stream.iter_operations())
+    assert content_stream.operations == expected
+    assert content_stream._data == b""
+    assert list(content_stream.iter_operations()) == expected
+
+
+def test_contentstream_serialization():
+    stream_object = DecodedStreamObject()
+    stream_object.set_data(
+        b"q 1.50 0 0 1 0 0 cm % comment\nBT /F1 12 Tf [(a)-2(b\\(c\\))] TJ (x) Tj ET\n"
+        b"BI /W 1 /H 1 /BPC 8 /CS /G ID \x80 EI Q"
+    )
+    content_stream = ContentStream(stream_object, None)
+    operations = content_stream.operations
+    assert content_stream._data == b""
+    # unchanged operations are copied from the parsed data, except those with
+    # arrays or dictionaries, which may have been modified in place
+    assert content_stream.get_data() == (
+        b"q 1.50 0 0 1 0 0 cm % comment\nBT /F1 12 Tf\n[ (a) -2 (b\\050c\\051) ] TJ\n"
+        b"(x) Tj ET\nBI\n/W 1\n/H 1\n/BPC 8\n/CS /G\nID \x80EI\nQ\n"
+    )
+
+    # a replaced operator is noticed
+    operations[5] = (operations[5][0], b"'")
+    content_stream.operations = operations
+    assert b"(x) '\nET" in content_stream.get_data()
+    operations[5] = (operations[5][0], b"Tj")
+
+    operations[3][0][0] = NameObject("/F2")
+    operations[4][0][0][0] = TextStringObject("d")
+    del operations[-1]
+    operations.insert(0, ([FloatObject(0.5), NumberObject(1)], b"d0"))
+    content_stream.operations = operations
+    assert content_stream.get_data() == (
+        b"0.5 1 d0\nq 1.50 0 0 1 0 0 cm % comment\nBT\n/F2 12 Tf\n"
+        b"[ (d) -2 (b\\050c\\051) ] TJ\n(x) Tj ET\nBI\n/W 1\n/H 1\n/BPC 8\n/CS /G\nID \x80EI\n"
+    )
@@ -5,6 +5,7 @@ Typically, tests in here should compare the extracted images count, names,
 and/or the actual image data with the expected value.
 """
 
+import dataclasses
 from io import BytesIO
 from pathlib import Path
 from typing import Union
@@ -13,8 +14,10 @@ from zipfile import ZipFile
 
 import pytest
 from PIL import Image, ImageChops, ImageDraw
+from PIL.ImageFile import ImageFile as PILImageFile
 
 from pypdf import PageObject, PdfReader, PdfWriter
+from pypdf._page import ImageFile
 from pypdf.generic import ContentStream, NameObject, NullObject
 
 from . import get_data_from_url
@@ -510,3 +513,111 @@ EI Q
             b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x02\x00\x00\x00\x01\x08\x02\x00\x00\x00{@\xe8\xdd\x00\x00\x00\x0f"
             b"IDATx\x9cc\xe8\xee\xee\xfe\xf7\xef\x1f\x00\x0e \x04\x9cpr_\x96\x00\x00\x00\x00IEND\xaeB`\x82"
         )
+
+
+def test_lazy_image_file():
+    reader = PdfReader(RESOURCE_ROOT / "imagemagick-images.pdf")
+    image_file = reader.pages[0].images[0]
+    assert image_file.name == "Im0.png"
+    assert image_file._data is None
+    assert image_file.raw_pixels() == ("L", (16, 16), image_file.image.tobytes())
+    assert image_file._data is None
+    with Image.open(BytesIO(image_file.data)) as img:
+        assert img.format == "PNG"
+        assert img.tobytes() == image_file.image.tobytes()
+
+    # the JPEG data are taken from the file
+    image_file = reader.pages[3].images[0]
+    assert image_file.name == "Im3.jpg"
+    assert image_file.data == reader.pages[3]["/Resources"]["/XObject"]["/Im3"].get_data()
+    assert image_file.image.format == "JPEG"
+
+    with pytest.raises(ValueError, match="No image"):
+        ImageFile().raw_pixels()
+
+    # the image has the format it is extracted in, and ImageFile is a dataclass
+    image_file = reader.pages[1].images[0]
+    assert image_file.image.format == "TIFF"
+    assert [field.name for field in dataclasses.fields(ImageFile)] == [
+        "name",
+        "data",
+        "image",
+        "indirect_reference",
+    ]
+    renamed = dataclasses.replace(image_file, name="renamed.tiff")
+    assert renamed.data == image_file.data
+    assert dataclasses.asdict(renamed)["name"] == "renamed.tiff"
+    assert dataclasses.fields(ImageFile)[1].default == b""
+    assert ImageFile(data=b"data").data == b"data"
+    assert ImageFile(data=b"data") == ImageFile(data=b"data")
+
+
+def test_decoded_image_cache():
+    writer = PdfWriter(clone_from=RESOURCE_ROOT / "imagemagick-images.pdf")
+    writer.add_page(writer.pages[0])
+    output = BytesIO()
+    writer.write(output)
+    reader = PdfReader(output)
+    cache = reader._image_cache
+
+    # the image XObject is decoded once for both pages
+    image = reader.pages[0].images[0].image
+    assert (cache.hits, cache.misses, len(cache)) == (0, 1, 1)
+    image_copy = reader.pages[6].images[0].image
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert image_copy is not image
+    assert image_copy.tobytes() == image.tobytes()
+
+    # each image is a copy, which can be modified
+    image.thumbnail((4, 4))
+    image = reader.pages[0].images[0].image
+    assert image.size == (16, 16)
+    assert image.tobytes() == image_copy.tobytes()
+
+    unique_images = [(image.name, pages) for image, pages in reader.unique_images()]
+    assert unique_images[0] == ("Im0.png", [0, 6])
+    assert [pages for _, pages in unique_images[1:]] == [[1], [2], [3], [4], [5]]
+
+    reader.clear_image_cache()
+    assert (cache.hits, cache.misses, len(cache), cache.current_bytes) == (0, 0, 0, 0)
+
+    # the least recently used images are evicted
+    size = cache.size_of(("png", "PNG", image, None))
+    reader = PdfReader(output, max_image_cache_bytes=size)
+    cache = reader._image_cache
+    reader.pages[0].images[0].image
+    assert len(cache) == 1
+    reader.pages[1].images[0].image
+    assert len(cache) <= 1
+    assert cache.current_bytes <= size
+    reader.pages[0].images[0].image
+    assert cache.misses == 3
+
+    # the cache can be disabled
+    reader = PdfReader(output, max_image_cache_bytes=0)
+    reader.pages[0].images[0].image
+    assert len(reader._image_cache) == 0
+
+
+@pytest.mark.parametrize("max_image_cache_bytes", [0, 1024 * 1024])
+def test_decoded_image_cache__jpeg_not_decoded(max_image_cache_bytes):
+    reader = PdfReader(
+        RESOURCE_ROOT / "imagemagick-images.pdf",
+        max_image_cache_bytes=max_image_cache_bytes,
+    )
+    expected = reader.pages[3]["/Resources"]["/XObject"]["/Im3"].get_data()
+    load = PILImageFile.load
+    with mock.patch.object(
+        PILImageFile, "load", autospec=True, side_effect=load
+    ) as loaded:
+        for _ in range(2):
+            image_file = reader.pages[3].images[0]
+            assert image_file.data == expected
+            assert image_file.image.format == "JPEG"
+        assert loaded.call_count == 0
+        # the images opened from the data are not shared
+        first, second = (reader.pages[3].images[0].image for _ in range(2))
+        assert first is not second
+        first.thumbnail((4, 4))
+        assert second.size != first.size
+    assert len(reader._image_cache) == (1 if max_image_cache_bytes else 0)
@@ -5,7 +5,7 @@ from copy import deepcopy
 from io import BytesIO
 from pathlib import Path
 from random import shuffle
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 import pytest
 
@@ -21,6 +21,7 @@ from pypdf.generic import (
     IndirectObject,
     NameObject,
     NullObject,
+    NumberObject,
     RectangleObject,
     TextStringObject,
 )
@@ -1105,6 +1106,29 @@ def test_merge_resources(apage1, apage2, expected_result, expected_renames):
     assert renames == expected_renames
 
 
+def test_merge_resources__many_resources():
+    def fonts(values: Iterable[int]) -> DictionaryObject:
+        return DictionaryObject(
+            {
+                NameObject(f"/F{i}"): DictionaryObject({NameObject("/N"): NumberObject(v)})
+                for i, v in enumerate(values)
+            }
+        )
+
+    count = 2000
+    res1 = DictionaryObject({NameObject("/Font"): fonts(range(count))})
+    # even fonts are identical, odd fonts differ
+    res2 = DictionaryObject(
+        {NameObject("/Font"): fonts(i + i % 2 for i in range(count))}
+    )
+    result, renames = PageObject()._merge_resources(res1, res2, "/Font")
+
+    assert len(result) == count + count // 2
+    assert list(result) == sorted(result)
+    assert renames == {f"/F{i}": f"/F{i}-0" for i in range(1, count, 2)}
+    assert result["/F1-0"] == {"/N": 2}
+
+
 def test_merge_page_resources_smoke_test():
     # Arrange
     page1 = PageObject.create_blank_page(width=100, height=100)
@@ -1,15 +1,18 @@
 """Test the pypdf._reader module."""
 import io
+import multiprocessing
+import os
 import time
 from io import BytesIO
 from pathlib import Path
 from typing import List, Union
+from unittest import mock
 
 import pytest
 
-from pypdf import PdfReader, PdfWriter
-from pypdf._crypt_providers import crypt_provider
+from pypdf import ObjectCache, PdfReader, PdfWriter
 from pypdf._reader import convert_to_int
+from pypdf._text_extraction._parallel import PageText, _extract_pages
 from pypdf.constants import ImageAttributes as IA
 from pypdf.constants import PageAttributes as PG
 from pypdf.constants import UserAccessPermissions as UAP
@@ -24,14 +27,16 @@ from pypdf.generic import (
     ArrayObject,
     Destination,
     DictionaryObject,
+    EncodedStreamObject,
+    IndirectObject,
     NameObject,
     NumberObject,
+    PdfObject,
     TextStringObject,
 )
 
 from . import get_data_from_url, normalize_warnings
 
-HAS_AES = crypt_provider[0] in ["pycryptodome", "cryptography"]
 TESTS_ROOT = Path(__file__).parent.resolve()
 PROJECT_ROOT = TESTS_ROOT.parent
 RESOURCE_ROOT = PROJECT_ROOT / "resources"
@@ -759,7 +764,6 @@ def test_decode_permissions():
         assert reader.decode_permissions(8) == modify
 
 
-@pytest.mark.skipif(not HAS_AES, reason="No AES implementation")
 def test_user_access_permissions():
     # Not encrypted.
     reader = PdfReader(RESOURCE_ROOT / "crazyones.pdf")
@@ -879,7 +883,6 @@ def test_read_not_binary_mode(caplog):
 
 
 @pytest.mark.enable_socket
-@pytest.mark.skipif(not HAS_AES, reason="No AES algorithm available")
 def test_read_form_416():
     url = (
         "https://www.fda.gov/downloads/AboutFDA/ReportsManualsForms/Forms/UCM074728.pdf"
@@ -1787,3 +1790,240 @@ def test_repair_root(caplog):
             'Searching object with "/Catalog" key',
         )
     )
+
+
+def test_memory_map_zero_copy():
+    with PdfReader(RESOURCE_ROOT / "pdflatex-outline.pdf", memory_map=True) as reader:
+        content = reader.pages[0]["/Contents"].get_object()
+        assert isinstance(content, EncodedStreamObject)
+        assert isinstance(content._data, memoryview)
+        assert isinstance(content.get_data(), bytes)
+
+
+@pytest.mark.parametrize(
+    "src", ["crazyones.pdf", "pdflatex-outline.pdf", "imagemagick-images.pdf"]
+)
+def test_memory_map(src):
+    src = RESOURCE_ROOT / src
+    with PdfReader(src) as reader:
+        expected = [page.extract_text() for page in reader.pages]
+    with PdfReader(src, memory_map=True) as reader:
+        reader.stream.seek(0)
+        assert reader.stream.read_view(5) == b"%PDF-"
+        content = reader.pages[0].get_contents()
+        assert isinstance(content.get_data(), bytes)
+        assert [page.extract_text() for page in reader.pages] == expected
+        writer = PdfWriter(clone_from=reader)
+        writer.write(BytesIO())
+    assert reader.stream.closed
+
+
+def test_memory_map_empty_file(tmp_path):
+    path = tmp_path / "empty.pdf"
+    path.write_bytes(b"")
+    with pytest.raises(EmptyFileError):
+        PdfReader(path, memory_map=True)
+
+
+@pytest.mark.parametrize(
+    "object_cache", [ObjectCache(max_objects=3), ObjectCache(max_bytes=1000)]
+)
+def test_bounded_object_cache(object_cache):
+    src = RESOURCE_ROOT / "pdflatex-outline.pdf"
+    with PdfReader(src) as reader:
+        expected = [page.extract_text() for page in reader.pages]
+        cached = len(reader.resolved_objects)
+    reader = PdfReader(src, object_cache=object_cache)
+    assert reader.resolved_objects is object_cache
+    assert [page.extract_text() for page in reader.pages] == expected
+    assert object_cache.evictions > 0
+    assert object_cache.hits > 0
+    assert object_cache.misses >= cached
+    assert len(object_cache) < cached
+    # the catalog and the page tree are never evicted
+    root = reader.trailer.raw_get("/Root")
+    assert (root.generation, root.idnum) in object_cache.pinned
+    for page in reader.pages:
+        ref = page.indirect_reference
+        assert (ref.generation, ref.idnum) in object_cache
+    assert reader.root_object is reader.trailer["/Root"]
+
+    with pytest.raises(ValueError, match="already used by another reader"):
+        PdfReader(src, object_cache=object_cache)
+    counters = (object_cache.hits, object_cache.misses, object_cache.evictions)
+    reader.close()
+    assert reader.resolved_objects is not object_cache
+    assert len(reader.resolved_objects) == 0
+    assert (object_cache.hits, object_cache.misses, object_cache.evictions) == counters
+
+
+def test_object_cache_lru():
+    cache = ObjectCache(max_objects=2)
+    cache[(0, 1)] = NumberObject(1)
+    cache[(0, 2)] = NumberObject(2)
+    assert cache.get((0, 1)) == 1
+    cache[(0, 3)] = NumberObject(3)
+    assert list(cache) == [(0, 1), (0, 3)]
+    assert cache.get((0, 2)) is None
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 1, 1)
+    cache.pin((0, 4))
+    cache[(0, 4)] = NumberObject(4)
+    cache[(0, 5)] = NumberObject(5)
+    assert set(cache) == {(0, 3), (0, 4), (0, 5)}
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.evictions == 0
+
+
+@pytest.mark.parametrize("eager", [False, True])
+def test_object_stream_index(eager):
+    def serialize(obj: PdfObject) -> bytes:
+        out = BytesIO()
+        obj.write_to_stream(out)
+        return out.getvalue()
+
+    src = RESOURCE_ROOT / "crazyones.pdf"
+    with PdfReader(src) as reader:
+        expected = {i: serialize(reader.get_object(i)) for i in reader.xref_objStm}
+    reader = PdfReader(src, eager_object_streams=eager)
+    idnum = next(iter(reader.xref_objStm))
+    stmnum = reader.xref_objStm[idnum][0]
+    reader.get_object(idnum)
+    assert set(reader._object_stream_index) == {stmnum}
+    in_stream = [i for i, (s, _) in reader.xref_objStm.items() if s == stmnum]
+    assert len(in_stream) > 1
+    assert all(((0, i) in reader.resolved_objects) is eager for i in in_stream[1:])
+    assert {i: serialize(reader.get_object(i)) for i in reader.xref_objStm} == expected
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_extract_text_parallel(workers):
+    path = RESOURCE_ROOT / "GeoBase_NHNC1_Data_Model_UML_EN.pdf"
+    expected = [page.extract_text() for page in PdfReader(path).pages]
+
+    reader = PdfReader(path)
+    results = list(reader.extract_text_parallel(workers=workers))
+    assert [result.page_number for result in results] == list(range(len(expected)))
+    assert [result.text for result in results] == expected
+    assert all(result.error is None for result in results)
+
+    # from a stream, in completion order, with a failing page
+    reader = PdfReader(BytesIO(path.read_bytes()))
+    results = list(
+        reader.extract_text_parallel([3, 1, 100, 2], workers=workers, ordered=False)
+    )
+    assert sorted(result.page_number for result in results) == [1, 2, 3, 100]
+    for result in results:
+        if result.page_number == 100:
+            assert result.text == ""
+            assert result.error.startswith("IndexError")
+        else:
+            assert result.text == expected[result.page_number]
+            assert result.error is None
+
+
+def _extract_pages_or_die(reader, page_numbers, mode, kwargs) -> List[PageText]:
+    if 13 in page_numbers:
+        os._exit(1)
+    return _extract_pages(reader, page_numbers, mode, kwargs)
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="the workers have to inherit the mock",
+)
+@pytest.mark.parametrize("ordered", [True, False])
+def test_extract_text_parallel__worker_dies(ordered):
+    path = RESOURCE_ROOT / "GeoBase_NHNC1_Data_Model_UML_EN.pdf"
+    reader = PdfReader(path)
+    # 37 pages, in 13 batches of 3 pages
+    page_numbers = [*range(len(reader.pages)), *range(14, len(reader.pages)), *range(13)]
+    with mock.patch(
+        "pypdf._text_extraction._parallel._extract_pages", _extract_pages_or_die
+    ):
+        results = list(
+            reader.extract_text_parallel(page_numbers, workers=4, ordered=ordered)
+        )
+    assert len(results) == len(page_numbers)
+    if ordered:
+        assert [result.page_number for result in results] == page_numbers
+    failed = [result for result in results if result.error is not None]
+    # the batch of the page 13 and those running at the same time
+    assert 3 <= len(failed) <= 4 * 3
+    assert all(result.error.startswith("BrokenProcessPool") for result in failed)
+    assert 13 in {result.page_number for result in failed}
+    for result in results:
+        if result.error is None:
+            assert result.text == reader.pages[result.page_number].extract_text()
+
+
+def test_extract_text_parallel_encrypted():
+    reader = PdfReader(RESOURCE_ROOT / "encryption" / "r3-user-password.pdf")
+    reader.decrypt("asdfzxcv")
+    expected = reader.pages[0].extract_text(extraction_mode="layout")
+    # the workers have to decrypt the document too
+    results = list(reader.extract_text_parallel([0, 0], workers=2, mode="layout"))
+    assert [result.text for result in results] == [expected, expected]
+
+
+def _write_page_tree(count_offset: int = 0) -> BytesIO:
+    # 5 pages in 2 nodes, the pages of the first node inherit their /MediaBox
+    writer = PdfWriter()
+    for width in range(100, 600, 100):
+        writer.add_blank_page(width, 100)
+    root = writer._pages.get_object()
+    pages = list(root["/Kids"])
+    nodes = ArrayObject()
+    for kids, mediabox in ((pages[:2], [0, 0, 50, 50]), (pages[2:], None)):
+        node = DictionaryObject(
+            {
+                NameObject("/Type"): NameObject("/Pages"),
+                NameObject("/Kids"): ArrayObject(kids),
+                NameObject("/Count"): NumberObject(len(kids)),
+                NameObject("/Parent"): writer._pages,
+            }
+        )
+        if mediabox is not None:
+            node[NameObject("/MediaBox")] = ArrayObject(NumberObject(x) for x in mediabox)
+            for kid in kids:
+                del kid.get_object()["/MediaBox"]
+        nodes.append(writer._add_object(node))
+        for kid in kids:
+            kid.get_object()[NameObject("/Parent")] = nodes[-1]
+    root[NameObject("/Kids")] = nodes
+    root[NameObject("/Count")] = NumberObject(5 + count_offset)
+    output = BytesIO()
+    writer.write(output)
+    return output
+
+
+def test_lazy_pages():
+    reader = PdfReader(_write_page_tree())
+    assert len(reader.pages) == 5
+    page = reader.pages[3]
+    assert page.mediabox.width == 400
+    assert reader.pages[1].mediabox.width == 50
+    # the page tree is not flattened
+    assert reader.flattened_pages is None
+    assert reader.pages[3] is page
+
+    assert [p.mediabox.width for p in reader.pages] == [50, 50, 300, 400, 500]
+    reader._flatten()
+    assert reader.flattened_pages[3] is page
+
+    # the pages are flattened if the counts are not consistent
+    reader = PdfReader(_write_page_tree(count_offset=1))
+    assert len(reader.pages) == 5
+    assert reader.flattened_pages is not None
+
+    # a kid referencing a missing object is not a page
+    writer = PdfWriter()
+    for _ in range(2):
+        writer.add_blank_page(100, 100)
+    root = writer._pages.get_object()
+    root["/Kids"].append(IndirectObject(999, 0, writer))
+    root[NameObject("/Count")] = NumberObject(3)
+    output = BytesIO()
+    writer.write(output)
+    reader = PdfReader(output)
+    assert len(reader.pages) == 2
@@ -10,6 +10,7 @@ from unittest.mock import patch
 import pytest
 
 from pypdf import PdfReader, mult
+from pypdf._cmap import get_encoding
 from pypdf._text_extraction import set_custom_rtl
 from pypdf.errors import ParseError, PdfReadError
 
@@ -346,3 +347,21 @@ def test_iss3074():
     # pypdf.errors.PdfReadError: ZeroDivisionError: float division by zero
     txt = reader.pages[0].extract_text(extraction_mode="layout")
     assert txt.strip().startswith("AAAAAA")
+
+
+def test_font_cache():
+    reader = PdfReader(RESOURCE_ROOT / "GeoBase_NHNC1_Data_Model_UML_EN.pdf")
+    with patch("pypdf._cmap.get_encoding", wraps=get_encoding) as encoding_mock:
+        texts = [page.extract_text() for page in reader.pages]
+        calls = encoding_mock.call_count
+        assert 0 < calls < sum(len(page["/Resources"]["/Font"]) for page in reader.pages)
+        # fonts are parsed once per document
+        assert [page.extract_text() for page in reader.pages] == texts
+        assert encoding_mock.call_count == calls
+        layout = reader.pages[0].extract_text(extraction_mode="layout")
+        assert reader.pages[0].extract_text(extraction_mode="layout") == layout
+        assert encoding_mock.call_count == calls
+
+        reader.clear_font_cache()
+        assert reader.pages[0].extract_text() == texts[0]
+        assert encoding_mock.call_count > calls
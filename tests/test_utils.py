@@ -70,6 +70,10 @@ def test_check_if_whitespace_only(value, expected):
 
 def test_read_until_whitespace():
     assert read_until_whitespace(io.BytesIO(b"foo"), maxchars=1) == b"f"
+    stream = io.BytesIO(b"a" * 100 + b"\x0bbar baz")
+    assert read_until_whitespace(stream) == b"a" * 100
+    assert read_until_whitespace(stream, maxchars=50) == b"bar"
+    assert stream.read() == b"baz"
 
 
 @pytest.mark.parametrize(
@@ -2219,6 +2219,35 @@ def test_get_pagenumber_from_indirectobject():
     assert writer._get_page_number_by_indirect(ind.idnum + 1) is None
 
 
+def test_page_number_index():
+    writer = PdfWriter()
+    for _ in range(4):
+        writer.add_blank_page(100, 100)
+
+    def check() -> None:
+        for i, page in enumerate(writer.pages):
+            assert writer.get_page_number(page) == i
+            assert page.page_number == i
+
+    check()
+    writer.add_blank_page(100, 100)
+    assert writer._page_id2num is not None  # updated in place by an append
+    check()
+    writer.insert_blank_page(100, 100, 1)
+    check()
+    writer.remove_page(2)
+    check()
+    removed = writer.pages[0]
+    del writer.pages[0]
+    check()
+    assert writer.get_page_number(removed) is None
+
+    reader = PdfReader(RESOURCE_ROOT / "crazyones.pdf")
+    copy = PdfWriter(clone_from=reader)
+    # the pages of another document are looked up in that document
+    assert copy._get_page_number_by_indirect(reader.pages[0].indirect_reference) == 0
+
+
 def test_replace_object():
     pdf_path = RESOURCE_ROOT / "crazyones.pdf"
     reader = PdfReader(pdf_path)
@@ -2379,6 +2408,120 @@ def test_compress_identical_objects():
     assert len(out2.getvalue()) > len(out3.getvalue())
 
 
+def test_compress_identical_objects_fixed_point():
+    writer = PdfWriter()
+    writer.add_blank_page(100, 100)
+    writer.add_blank_page(100, 100)
+    fonts = []
+    for page in writer.pages:
+        # identical fonts, referenced by identical font dictionaries
+        descriptor = writer._add_object(
+            DictionaryObject({NameObject("/FontName"): NameObject("/Helvetica")})
+        )
+        font = writer._add_object(
+            DictionaryObject(
+                {
+                    NameObject("/Type"): NameObject("/Font"),
+                    NameObject("/FontDescriptor"): descriptor,
+                }
+            )
+        )
+        page[NameObject("/Resources")] = DictionaryObject(
+            {
+                NameObject("/Font"): DictionaryObject({NameObject("/F1"): font}),
+            }
+        )
+        fonts.append(font)
+    orphan = writer._add_object(DictionaryObject())
+    writer._add_object(ArrayObject([orphan]))
+    count = sum(obj is not None for obj in writer._objects)
+
+    out1 = BytesIO()
+    writer.write(out1)
+    saved = writer.compress_identical_objects(remove_orphans=False)
+    # the font, its descriptor, but not the identical pages
+    assert sum(obj is not None for obj in writer._objects) == count - 2
+    assert writer.pages[0].indirect_reference != writer.pages[1].indirect_reference
+    assert (
+        writer.pages[0]["/Resources"]["/Font"].raw_get("/F1")
+        == writer.pages[1]["/Resources"]["/Font"].raw_get("/F1")
+    )
+    out2 = BytesIO()
+    writer.write(out2)
+    # the removed objects are still in the cross-reference table, as free
+    assert len(out1.getvalue()) - len(out2.getvalue()) == saved
+
+    # the array is not referenced, neither is the dictionary it contains
+    assert writer.compress_identical_objects(remove_identicals=False) > 0
+    assert sum(obj is not None for obj in writer._objects) == count - 4
+    assert writer.compress_identical_objects() == 0
+
+
+def test_compress_identical_objects__clone_again():
+    reader = PdfReader(RESOURCE_ROOT / "crazyones.pdf")
+    writer = PdfWriter()
+    writer.add_page(reader.pages[0])
+    writer.add_page(reader.pages[0])
+    writer.remove_page(1)
+    writer.remove_page(0)
+    writer.compress_identical_objects()
+    # the removed objects are not referenced anymore by the translations
+    removed = {
+        idnum for idnum, obj in enumerate(writer._objects, 1) if obj is None
+    }
+    translated = set(writer._id_translated[id(reader)].values())
+    assert removed
+    assert not removed & translated
+
+    writer.add_page(reader.pages[0])
+    output = BytesIO()
+    writer.write(output)
+    assert "The Crazy Ones" in PdfReader(output).pages[0].extract_text()
+
+
+def test_compress_identical_objects__translations():
+    # the same file read twice: the copies of its objects are identical
+    readers = [PdfReader(RESOURCE_ROOT / "crazyones.pdf") for _ in range(2)]
+    writer = PdfWriter()
+    for reader in readers:
+        writer.add_page(reader.pages[0])
+    first, second = (page["/Contents"][0].idnum for page in writer.pages)
+    translations = writer._id_translated[id(readers[1])]
+    source = next(key for key, value in translations.items() if value == second)
+    writer.compress_identical_objects()
+    # the copy is merged, its source is translated to the object kept
+    assert writer._objects[second - 1] is None
+    assert translations[source] == first
+    page = writer.add_page(readers[1].pages[0])
+    assert page["/Contents"][0].idnum == first
+
+
+def test_get_reference_identity():
+    writer = PdfWriter()
+    first = DictionaryObject()
+    second = DictionaryObject()
+    first_ref = writer._add_object(first)
+    second_ref = writer._add_object(second)
+    # equal objects are told apart
+    assert writer.get_reference(first) == first_ref
+    assert writer.get_reference(second) == second_ref
+    assert writer.object_index[id(second)] == second_ref.idnum
+
+    # the index follows the replaced objects
+    third = DictionaryObject()
+    writer._replace_object(first_ref, third)
+    assert writer.object_index[id(third)] == first_ref.idnum
+    assert id(first) not in writer.object_index
+    assert writer.get_reference(third) == first_ref
+
+    writer.compress_identical_objects(remove_orphans=False)
+    # second is merged into third, which is equal
+    assert writer.get_reference(second) == first_ref
+    assert id(second) not in writer.object_index
+    with pytest.raises(ValueError):
+        writer.get_reference(NumberObject(1))
+
+
 def test_set_need_appearances_writer():
     """Minimal test for coverage"""
     writer = PdfWriter()
@@ -2500,6 +2643,40 @@ def test_increment_writer(caplog):
     writer.write(b)
 
 
+def test_increment_writer_change_tracking():
+    writer = PdfWriter(
+        RESOURCE_ROOT / "Seige_of_Vicksburg_Sample_OCR-crazyones-merged.pdf",
+        incremental=True,
+    )
+    assert writer.list_objects_in_increment() == []
+    # writing does not modify the objects
+    writer.write(BytesIO())
+    assert writer.list_objects_in_increment() == []
+
+    # direct object within a page
+    page = writer.pages[1]
+    page["/MediaBox"][2] = NumberObject(600)
+    assert writer.list_objects_in_increment() == [page.indirect_reference]
+
+    stream = writer.pages[2]["/Contents"][0].get_object()
+    stream.set_data(stream.get_data())
+    assert stream.indirect_reference in writer.list_objects_in_increment()
+
+    # changes made without the methods of the objects
+    resources = writer.pages[1]["/Resources"]
+    dict.__setitem__(resources, NameObject("/Foo"), NameObject("/Bar"))
+    assert resources.indirect_reference not in writer.list_objects_in_increment()
+    writer.verify_increment = True
+    assert resources.indirect_reference in writer.list_objects_in_increment()
+    assert len(writer.list_objects_in_increment()) == 3
+
+    b = BytesIO()
+    writer.write(b)
+    reader = PdfReader(b)
+    assert reader.pages[1].mediabox.width == 600
+    assert reader.pages[1]["/Resources"]["/Foo"] == "/Bar"
+
+
 @pytest.mark.enable_socket
 def test_append_pdf_with_dest_without_page(caplog):
     """Tests for #2842"""
@@ -2652,3 +2829,157 @@ def test_incremental_read():
     # 2 = Pages, 5 = New Page, 6 = XRef, Size == 7
     # XRef is created on write and not counted
     assert len(writer._objects) == 5
+
+
+def test_stream_to():
+    files = [RESOURCE_ROOT / "pdflatex-outline.pdf", RESOURCE_ROOT / "libreoffice-form.pdf"]
+    expected = BytesIO()
+    writer = PdfWriter()
+    writer.append(files[0])
+    writer.add_page(PdfReader(files[1]).pages[0])
+    writer.append(files[1])
+    writer.write(expected)
+
+    output = BytesIO()
+    writer = PdfWriter()
+    writer.stream_to(output, buffer_size=1024)
+    writer.append(files[0])
+    page = writer.add_page(PdfReader(files[1]).pages[0])
+    contents = page.raw_get("/Contents").idnum
+    writer.append(files[1])
+    # the objects used by the pages are written once the next pages are added
+    assert output.getvalue().startswith(b"%PDF-1.5")
+    assert writer._objects[contents - 1] is None
+    with pytest.raises(PyPdfError, match="already been written"):
+        page["/Contents"]
+    with pytest.raises(PyPdfError, match="encrypted before"):
+        writer.encrypt("password")
+    with pytest.raises(PyPdfError, match="close"):
+        writer.write(BytesIO())
+    writer.close()
+    writer.close()
+    assert len(output.getvalue()) == len(expected.getvalue())
+
+    reader = PdfReader(output, strict=True)
+    expected_reader = PdfReader(expected)
+    assert len(reader.pages) == len(expected_reader.pages)
+    for page, expected_page in zip(reader.pages, expected_reader.pages):
+        assert page.extract_text() == expected_page.extract_text()
+    assert len(reader.outline) == len(expected_reader.outline)
+    assert reader.get_fields().keys() == expected_reader.get_fields().keys()
+
+
+def test_stream_to_file(tmp_path):
+    target = tmp_path / "out.pdf"
+    writer = PdfWriter()
+    writer.stream_to(target, buffer_size=16)
+    writer.add_page(PdfReader(RESOURCE_ROOT / "toy.pdf").pages[0])
+    writer.add_blank_page()
+    # the header is updated if the version is raised after the first flush
+    writer.append(RESOURCE_ROOT / "crazyones.pdf")
+    writer.close()
+
+    reader = PdfReader(target, strict=True)
+    assert reader.pdf_header == "%PDF-1.5"
+    assert len(reader.pages) == 3
+    assert "The Crazy Ones" in reader.pages[2].extract_text()
+
+    writer = PdfWriter(target, incremental=True)
+    with pytest.raises(PyPdfError, match="incremental"):
+        writer.stream_to(BytesIO())
+
+
+def test_clone_removed_object():
+    reader = PdfReader(RESOURCE_ROOT / "crazyones.pdf")
+    writer = PdfWriter()
+    contents = writer.add_page(reader.pages[0])["/Contents"][0].idnum
+    # the copy is removed, but the writer has not written it to an output
+    writer._objects[contents - 1] = None
+    page = writer.add_page(reader.pages[0])
+    assert page["/Contents"][0].idnum != contents
+    assert page.get_contents().get_data() == reader.pages[0].get_contents().get_data()
+
+
+@pytest.mark.parametrize("object_stream_size", [1, 3, 100])
+def test_write_object_streams(object_stream_size):
+    writer = PdfWriter(clone_from=RESOURCE_ROOT / "pdflatex-outline.pdf")
+    writer.add_metadata({"/Title": "Object streams"})
+    for i in range(30):
+        writer.add_blank_page(100, 100)
+        writer.add_outline_item(f"Item {i}", i)
+    writer.pdf_header = "%PDF-1.4"
+    expected = BytesIO()
+    writer.write(expected)
+    output = BytesIO()
+    writer.write(output, use_object_streams=True, object_stream_size=object_stream_size)
+    if object_stream_size > 1:
+        assert len(output.getvalue()) < len(expected.getvalue())
+    assert b"/ObjStm" in output.getvalue()
+    assert b"\nxref\n" not in output.getvalue()
+
+    reader = PdfReader(output, strict=True)
+    assert reader.pdf_header == "%PDF-1.5"
+    assert len(reader.xref_objStm) > 30
+    assert max(idx for _, idx in reader.xref_objStm.values()) == object_stream_size - 1
+    expected_reader = PdfReader(expected)
+    assert len(reader.pages) == len(expected_reader.pages)
+    assert reader.pages[0].extract_text() == expected_reader.pages[0].extract_text()
+    assert [item.title for item in reader.outline if not isinstance(item, list)] == [
+        item.title for item in expected_reader.outline if not isinstance(item, list)
+    ]
+    assert reader.metadata.title == "Object streams"
+
+    with pytest.raises(ValueError, match="at least 1"):
+        writer.write(BytesIO(), use_object_streams=True, object_stream_size=0)
+
+
+def test_write_object_streams_encrypted():
+    writer = PdfWriter(clone_from=RESOURCE_ROOT / "crazyones.pdf")
+    writer.add_metadata({"/Title": "Secret"})
+    writer.encrypt("password", algorithm="AES-128")
+    output = BytesIO()
+    writer.write(output, use_object_streams=True)
+
+    reader = PdfReader(output, password="password")
+    assert reader.metadata.title == "Secret"
+    assert "The Crazy Ones" in reader.pages[0].extract_text()
+
+
+def test_stamp_pages():
+    writer = PdfWriter(clone_from=RESOURCE_ROOT / "GeoBase_NHNC1_Data_Model_UML_EN.pdf")
+    stamp = PdfReader(RESOURCE_ROOT / "crazyones.pdf").pages[0]
+    contents = [page.raw_get("/Contents") for page in writer.pages]
+
+    form = writer.stamp_pages(
+        stamp, transformation=Transformation().scale(0.5).translate(10, 20)
+    )
+    assert form.get_object()["/Subtype"] == "/Form"
+    for page, data in zip(writer.pages, contents):
+        assert page["/Resources"]["/XObject"].raw_get("/Stamp") == form
+        # the contents of the page are kept as is
+        save_state, original, draw = page["/Contents"]
+        assert original == data
+        assert save_state.get_object().get_data() == b"q\n"
+        assert draw.get_object().get_data() == (
+            b"Q\nq\n0.5 0.0 0.0 0.5 10 20 cm\n/Stamp Do\nQ\n"
+        )
+
+    # the name is taken by the previous stamp
+    objects = len(writer._objects)
+    form2 = writer.stamp_pages(stamp, pages=[1, writer.pages[2]], over=False)
+    # the resources of the stamp are already cloned: the form, and the shared
+    # content streams
+    assert len(writer._objects) - objects == 3
+    for page_number in (1, 2):
+        page = writer.pages[page_number]
+        assert page["/Resources"]["/XObject"].raw_get("/Stamp-0") == form2
+        draw = page["/Contents"][0].get_object()
+        assert draw.get_data() == b"q\n/Stamp-0 Do\nQ\n"
+
+    output = BytesIO()
+    writer.write(output)
+    page = PdfReader(output).pages[1]
+    assert "Heres to the crazy ones" in page.extract_text()
+
+    with pytest.raises(ValueError, match="does not belong"):
+        writer.stamp_pages(stamp, pages=[stamp])
@@ -1,10 +1,11 @@
 """Test the pypdf._xobj_image_helpers module."""
 from io import BytesIO
+from unittest import mock
 
 import pytest
 
 from pypdf import PdfReader
-from pypdf._xobj_image_helpers import _extended_image_frombytes, _handle_flate
+from pypdf._xobj_image_helpers import _extended_image_frombytes, _handle_flate, bits2byte
 from pypdf.errors import EmptyImageDataError, PdfReadError
 from pypdf.generic import ArrayObject, DecodedStreamObject, NameObject, NumberObject
 
@@ -126,3 +127,18 @@ def test_extended_image_frombytes_zero_data():
 
     with pytest.raises(EmptyImageDataError, match="Data is 0 bytes, cannot process an image from empty data."):
         _extended_image_frombytes(mode, size, data)
+
+
+@pytest.mark.parametrize("has_numpy", [True, False])
+def test_bits2byte(has_numpy):
+    with mock.patch("pypdf._xobj_image_helpers.HAS_NUMPY", has_numpy):
+        assert bits2byte(b"\xa5\xff", (3, 2), 1) == b"\x01\x00\x01\x01\x01\x01"
+        assert bits2byte(b"\x1b\xe4", (3, 2), 2) == b"\x00\x01\x02\x03\x02\x01"
+        assert bits2byte(b"\x12\x34", (4, 1), 4) == b"\x01\x02\x03\x04"
+        # missing data
+        assert bits2byte(b"\x12", (4, 1), 4) == b"\x01\x02\x00\x00"
+
+
+def test_extended_image_frombytes__repeated_samples():
+    img = _extended_image_frombytes("RGB", (2, 1), b"\x01\x02")
+    assert img.tobytes() == b"\x01\x01\x01\x02\x02\x02"